@@ -0,0 +1,43 @@
+"""Benchmark parsing ulang halaman tersimpan dengan dan tanpa cache hasil parsing kartu produk.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_card_cache --pages 50
+"""
+import argparse
+import time
+
+from benchmarks.fixtures import render_catalog_page
+from utils.extract import PARSER_ENGINES, CardParseCache, parse_fashion_page
+
+def bench_pass(pages, engine, card_cache=None):
+    """Mengembalikan (jumlah kartu per detik, daftar produk) untuk satu kali parsing seluruh halaman"""
+    records = []
+    start = time.perf_counter()
+    for content in pages:
+        records.extend(parse_fashion_page(content, engine=engine, card_cache=card_cache)[0])
+    return len(records) / (time.perf_counter() - start), records
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=50)
+    parser.add_argument('--cards-per-page', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    pages = [render_catalog_page(n, args.pages, args.cards_per_page) for n in range(1, args.pages + 1)]
+    strip_timestamp = lambda records: [{k: v for k, v in r.items() if k != 'Timestamp'} for r in records]
+    for engine in PARSER_ENGINES:
+        card_cache = CardParseCache(max_entries=args.pages * args.cards_per_page)
+        # Lintasan pertama mengisi cache, lintasan berikutnya mensimulasikan re-scrape halaman yang sama
+        _, cold_records = bench_pass(pages, engine, card_cache)
+        card_cache.hits = card_cache.misses = 0
+        uncached = max(bench_pass(pages, engine)[0] for _ in range(args.repeat))
+        warm_results = [bench_pass(pages, engine, card_cache) for _ in range(args.repeat)]
+        warm = max(cards_per_second for cards_per_second, _ in warm_results)
+        assert strip_timestamp(warm_results[-1][1]) == strip_timestamp(cold_records), "Hasil cache kartu berbeda"
+        hit_rate = card_cache.hits / (card_cache.hits + card_cache.misses)
+        print(f"{engine:>5}: tanpa cache {uncached:8.0f} kartu/detik, re-scrape dengan cache {warm:8.0f} kartu/detik "
+              f"({warm / uncached:.2f}x, hit rate {hit_rate:.0%})")
+
+if __name__ == "__main__":
+    main()
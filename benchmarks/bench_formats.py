@@ -0,0 +1,60 @@
+"""Benchmark ukuran file, kecepatan tulis, dan kecepatan baca CSV dibandingkan Parquet dan Feather.
+
+Membutuhkan pyarrow untuk format kolumnar. Jalankan dari root repository:
+    python -m benchmarks.bench_formats --rows 200000
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.fixtures import make_transformed_frame
+from utils.load import export_to_csv, export_to_feather, export_to_parquet
+
+# (label, fungsi ekspor, argumen tambahan, fungsi baca, ekstensi file)
+CANDIDATES = [
+    ('csv', export_to_csv, {}, pd.read_csv, 'csv'),
+    ('parquet-snappy', export_to_parquet, {'compression': 'snappy'}, pd.read_parquet, 'parquet'),
+    ('parquet-zstd', export_to_parquet, {'compression': 'zstd'}, pd.read_parquet, 'parquet'),
+    ('feather-lz4', export_to_feather, {'compression': 'lz4'}, pd.read_feather, 'feather'),
+    ('feather-zstd', export_to_feather, {'compression': 'zstd'}, pd.read_feather, 'feather'),
+]
+
+def best_time(function, repeat):
+    """Waktu terbaik (detik) dari beberapa pengulangan"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_transformed_frame(args.rows)
+    # Size dan Gender disimpan sebagai kategori seperti pada skema ringkas hasil transform
+    df['Size'] = df['Size'].astype('category')
+    df['Gender'] = df['Gender'].astype('category')
+    print(f"Jumlah baris: {args.rows}")
+    print(f"{'format':>15} {'ukuran (KB)':>12} {'tulis (dtk)':>12} {'baca (dtk)':>12}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for label, exporter, options, reader, extension in CANDIDATES:
+            filename = os.path.join(temp_dir, f"{label}.{extension}")
+            with contextlib.redirect_stdout(io.StringIO()):
+                write_time = best_time(lambda: exporter(df, filename, **options), args.repeat)
+            if not os.path.exists(filename):
+                print(f"{label:>15} gagal (pyarrow tidak terinstal?)")
+                continue
+            read_time = best_time(lambda: reader(filename), args.repeat)
+            print(f"{label:>15} {os.path.getsize(filename) / 1024:12.0f} {write_time:12.3f} {read_time:12.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Micro-benchmark jumlah kartu produk per detik untuk setiap engine parser.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_parser --pages 50
+"""
+import argparse
+import time
+
+from benchmarks.fixtures import render_catalog_page
+from utils.extract import FAST_TREE_BUILDER, PARSER_ENGINES, parse_fashion_page
+
+def bench_engine(pages, engine, repeat):
+    """Mengembalikan jumlah kartu per detik terbaik dari beberapa pengulangan"""
+    best = 0.0
+    for _ in range(repeat):
+        cards = 0
+        start = time.perf_counter()
+        for content in pages:
+            records, _ = parse_fashion_page(content, engine=engine)
+            cards += len(records)
+        elapsed = time.perf_counter() - start
+        best = max(best, cards / elapsed)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=50)
+    parser.add_argument('--cards-per-page', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    pages = [render_catalog_page(n, args.pages, args.cards_per_page) for n in range(1, args.pages + 1)]
+    # Pastikan kedua engine menghasilkan data yang sama sebelum diukur
+    strip_timestamp = lambda records: [{k: v for k, v in r.items() if k != 'Timestamp'} for r in records]
+    for content in pages[:3]:
+        results = [strip_timestamp(parse_fashion_page(content, engine=engine)[0]) for engine in PARSER_ENGINES]
+        assert all(result == results[0] for result in results), "Output engine parser berbeda"
+
+    print(f"Tree builder engine 'fast': {FAST_TREE_BUILDER}")
+    baseline = None
+    for engine in PARSER_ENGINES:
+        cards_per_second = bench_engine(pages, engine, args.repeat)
+        baseline = baseline or cards_per_second
+        print(f"{engine:>5}: {cards_per_second:10.0f} kartu/detik ({cards_per_second / baseline:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Benchmark parser harga: to_numeric setelah membuang '$' dibandingkan parser multi mata uang tervektorisasi.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_prices --rows 2000000 --unique 5000
+"""
+import argparse
+import contextlib
+import io
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.currency import STRING_DTYPE, convert_prices_to_idr
+
+def make_prices(rows, unique):
+    """Kolom harga campuran dollar dan rupiah dengan `unique` nilai berbeda"""
+    amounts = np.arange(unique)
+    values = np.array([f"${amount % 1000}.{amount % 100:02d}" if amount % 2 else f"Rp {amount * 1000:,}".replace(',', '.')
+                       for amount in amounts], dtype=object)
+    return pd.Series(values[np.arange(rows) % unique])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000000)
+    parser.add_argument('--unique', type=int, default=5000)
+    args = parser.parse_args()
+
+    prices = make_prices(args.rows, args.unique)
+    print(f"Jumlah baris: {args.rows}, harga unik: {args.unique}, tipe string: {STRING_DTYPE}")
+    start = time.perf_counter()
+    pd.to_numeric(prices.astype(str).str.replace('$', '', regex=False), errors='coerce') * 16000
+    print(f"{'to_numeric ($ saja)':>22}: {time.perf_counter() - start:.2f} detik")
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        convert_prices_to_idr(prices)
+    print(f"{'multi mata uang':>22}: {time.perf_counter() - start:.2f} detik")
+
+if __name__ == "__main__":
+    main()
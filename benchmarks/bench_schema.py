@@ -0,0 +1,33 @@
+"""Laporan pemakaian memori DataFrame hasil transform sebelum dan sesudah skema ringkas.
+
+Jalankan dari root repository (default membaca products.csv, --repeat menggandakan baris
+untuk mensimulasikan riwayat beberapa run):
+    python -m benchmarks.bench_schema --csv products.csv --repeat 100
+"""
+import argparse
+
+import pandas as pd
+
+from utils.transform import compare_memory_usage, enforce_schema
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--csv', default='products.csv')
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+
+    # products.csv sudah berisi data hasil transform, dibaca dengan tipe bawaan pandas
+    df = pd.read_csv(args.csv)
+    if args.repeat > 1:
+        df = pd.concat([df] * args.repeat, ignore_index=True)
+    compact_df = enforce_schema(df.copy())
+    report = compare_memory_usage(df, compact_df)
+
+    print(f"Jumlah baris: {len(df)}")
+    print(pd.DataFrame({'before': df.dtypes.astype(str), 'after': compact_df.dtypes.astype(str)}))
+    print()
+    print(report.assign(before=report['before'] / 1024, after=report['after'] / 1024)
+          .rename(columns={'before': 'before (KB)', 'after': 'after (KB)'}).round(1))
+
+if __name__ == "__main__":
+    main()
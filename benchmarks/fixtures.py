@@ -0,0 +1,91 @@
+"""Pembangkit HTML bergaya Fashion Studio untuk benchmark, tanpa akses ke situs asli."""
+
+CATEGORIES = ['T-shirt', 'Hoodie', 'Pants', 'Outerwear', 'Jacket', 'Shirt', 'Sweater', 'Shorts']
+SIZES = ['S', 'M', 'L', 'XL', 'XXL']
+GENDERS = ['Men', 'Women', 'Unisex']
+
+def product_fields(index):
+    """Nilai kartu produk ke-`index` seperti yang tampil di halaman (Title, Price, Rating, Colors, Size, Gender)"""
+    title = f"{CATEGORIES[index % len(CATEGORIES)]} {index}"
+    price = f"${(index * 37) % 500 + 10}.{index % 100:02d}"
+    rating = f"{(index * 7) % 50 / 10 + 0.5:.1f}"
+    colors = index % 5 + 1
+    size = SIZES[index % len(SIZES)]
+    gender = GENDERS[index % len(GENDERS)]
+    if index % 97 == 0:
+        title = "Unknown Product"
+        rating = "Invalid Rating"
+    return title, price, rating, colors, size, gender
+
+def render_product_card(index):
+    """Membuat satu kartu produk secara deterministik berdasarkan indeks"""
+    title, price, rating, colors, size, gender = product_fields(index)
+    return f"""
+    <div class="collection-card">
+        <div style="position: relative;">
+            <img src="https://picsum.photos/280/350?random={index}" class="collection-image" alt="{title}">
+        </div>
+        <div class="product-details">
+            <h3 class="product-title">{title}</h3>
+            <div class="price-container"><span class="price">{price}</span></div>
+            <p style="font-size: 14px; color: #777;">Rating: ⭐ {rating} / 5</p>
+            <p style="font-size: 14px; color: #777;">{colors} Colors</p>
+            <p style="font-size: 14px; color: #777;">Size: {size}</p>
+            <p style="font-size: 14px; color: #777;">Gender: {gender}</p>
+        </div>
+    </div>"""
+
+def render_catalog_page(page_number, total_pages, cards_per_page=20):
+    """Membuat satu halaman katalog lengkap dengan navigasi dan paginasi"""
+    first_index = (page_number - 1) * cards_per_page + 1
+    cards = "".join(render_product_card(i) for i in range(first_index, first_index + cards_per_page))
+    previous_link = ""
+    if page_number > 1:
+        previous_href = "/" if page_number == 2 else f"/page{page_number - 1}"
+        previous_link = f'<li class="page-item previous"><a class="page-link" href="{previous_href}">Previous</a></li>'
+    next_link = ""
+    if page_number < total_pages:
+        next_link = f'<li class="page-item next"><a class="page-link" href="/page{page_number + 1}">Next</a></li>'
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="UTF-8"><title>Fashion Studio</title></head>
+<body>
+    <nav class="navbar"><a class="navbar-brand" href="/">Fashion Studio</a>
+        <ul class="navbar-nav"><li><a href="/">Home</a></li><li><a href="/about">About</a></li></ul>
+    </nav>
+    <div class="container">
+        <h1 class="section-title">Our Collection</h1>
+        <div class="collection-grid" id="collectionList">{cards}
+        </div>
+        <ul class="pagination">{previous_link}<li class="page-item current"><span class="page-link">Page {page_number} of {total_pages}</span></li>{next_link}</ul>
+    </div>
+    <footer><p>&copy; Fashion Studio</p></footer>
+</body>
+</html>""".encode()
+
+def make_scraped_frame(rows, timestamp='2025-01-01 00:00:00'):
+    """Membuat DataFrame sintetis dengan kolom dan nilai teks persis seperti hasil `extract_fashion_data`"""
+    import pandas as pd
+
+    records = []
+    for index in range(1, rows + 1):
+        title, price, rating, colors, size, gender = product_fields(index)
+        records.append({'Title': title, 'Price': price, 'Rating': 'N/A' if rating == 'Invalid Rating' else rating,
+                        'Colors': str(colors), 'Size': size, 'Gender': gender, 'Timestamp': timestamp})
+    return pd.DataFrame(records)
+
+def make_transformed_frame(rows):
+    """Membuat DataFrame sintetis dengan kolom dan tipe data hasil `convert_dollar_to_rupiah`"""
+    import numpy as np
+    import pandas as pd
+
+    index = np.arange(rows)
+    return pd.DataFrame({
+        'Title': [f"{CATEGORIES[i % len(CATEGORIES)]} {i}" for i in index],
+        'Price': ((index * 37) % 500 + 10) * 16000.0,
+        'Rating': (index * 7) % 50 / 10 + 0.5,
+        'Colors': (index % 5 + 1).astype(int),
+        'Size': [SIZES[i % len(SIZES)] for i in index],
+        'Gender': [GENDERS[i % len(GENDERS)] for i in index],
+        'Timestamp': '2025-01-01 00:00:00'
+    })
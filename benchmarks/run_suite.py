@@ -0,0 +1,168 @@
+"""Suite benchmark end-to-end terhadap situs tiruan lokal; hasilnya disimpan ke JSON untuk dibandingkan antar commit.
+
+Mengukur scrape_fashion (melalui server HTTP lokal), extract_fashion_data, transform_data,
+convert_dollar_to_rupiah, dan setiap exporter file/database. Google Sheets tidak diukur karena
+membutuhkan kredensial dan kuota API. Tanpa --db-url, exporter database memakai SQLite sementara.
+Jalankan dari root repository:
+    python -m benchmarks.run_suite --pages 50 --rows 100000 --output baseline.json
+    python -m benchmarks.run_suite --pages 50 --rows 100000 --compare baseline.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from benchmarks.fixtures import make_scraped_frame, render_catalog_page
+from benchmarks.server import PAGINATION_PATH_PATTERN, FixtureSite
+from utils.extract import PARSER_ENGINES, extract_fashion_data, extract_fashion_data_fast, scrape_fashion
+from utils.load import export_to_csv, export_to_feather, export_to_parquet, export_to_postgre
+from utils.transform import convert_dollar_to_rupiah, transform_data
+
+DEFAULT_OUTPUT = 'benchmark_results.json'
+# Penurunan throughput lebih dari batas ini dibanding hasil pembanding dianggap regresi
+DEFAULT_TOLERANCE = 0.10
+# Jumlah halaman yang diurai sekali untuk benchmark per kartu
+EXTRACT_SAMPLE_PAGES = 50
+
+def measure(function, items, unit, repeat):
+    """Menjalankan `function` sebanyak `repeat` kali tanpa keluaran print dan mengembalikan waktu terbaik,
+    median, serta throughput. Mengembalikan None jika `function` mengembalikan False (misalnya pyarrow tidak ada)."""
+    timings = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = function()
+            timings.append(time.perf_counter() - start)
+        if result is False:
+            return None
+    best = min(timings)
+    return {
+        'seconds': best,
+        'median_seconds': statistics.median(timings),
+        'items': items,
+        'unit': unit,
+        'per_second': items / best if best > 0 else None,
+    }
+
+def git_commit():
+    """Hash commit saat ini, atau None jika bukan repository git"""
+    try:
+        completed = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                   capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+def bench_scrape(args, results):
+    with FixtureSite(args.pages, args.cards_per_page) as site:
+        expected_cards = args.pages * args.cards_per_page
+        for engine in PARSER_ENGINES:
+            def run():
+                records = scrape_fashion(site.base_url, PAGINATION_PATH_PATTERN, delay=0, workers=args.workers, engine=engine)
+                assert len(records) == expected_cards, f"scrape_fashion menghasilkan {len(records)} dari {expected_cards} kartu"
+            results[f"scrape_fashion[{engine}]"] = measure(run, expected_cards, 'kartu', args.repeat)
+
+def bench_extract(args, results):
+    pages = [render_catalog_page(n, args.pages, args.cards_per_page) for n in range(1, min(args.pages, EXTRACT_SAMPLE_PAGES) + 1)]
+    details = [div for content in pages for div in BeautifulSoup(content, 'html.parser').find_all('div', class_='product-details')]
+    containers = [div.find_parent() for div in details]
+    timestamp = '2025-01-01 00:00:00'
+    results['extract_fashion_data'] = measure(
+        lambda: [extract_fashion_data(article, timestamp=timestamp) for article in containers], len(containers), 'kartu', args.repeat)
+    results['extract_fashion_data_fast'] = measure(
+        lambda: [extract_fashion_data_fast(article, timestamp=timestamp) for article in details], len(details), 'kartu', args.repeat)
+
+def bench_transform_and_load(args, results):
+    scraped_df = make_scraped_frame(args.rows)
+    results['transform_data'] = measure(lambda: transform_data(scraped_df), args.rows, 'baris', args.repeat)
+    transformed_df = transform_data(scraped_df)
+    results['convert_dollar_to_rupiah'] = measure(lambda: convert_dollar_to_rupiah(transformed_df), len(transformed_df), 'baris', args.repeat)
+    final_df = convert_dollar_to_rupiah(transformed_df)
+
+    rows = len(final_df)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        exporters = {
+            'export_to_csv': lambda: export_to_csv(final_df, os.path.join(temp_dir, 'products.csv')),
+            'export_to_parquet': lambda: export_to_parquet(final_df, os.path.join(temp_dir, 'products.parquet')),
+            'export_to_feather': lambda: export_to_feather(final_df, os.path.join(temp_dir, 'products.feather')),
+        }
+        db_url = args.db_url or f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+        exporters['export_to_postgre'] = lambda: export_to_postgre(final_df, db_url, table_name='bench_products', method='copy')
+        for name, exporter in exporters.items():
+            results[name] = measure(exporter, rows, 'baris', args.repeat)
+    results['export_to_postgre']['database'] = 'postgresql' if args.db_url else 'sqlite' if results['export_to_postgre'] else None
+
+def compare_results(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Mencetak perbandingan throughput dengan hasil pembanding dan mengembalikan nama benchmark yang mengalami regresi"""
+    regressions = []
+    print(f"\nPerbandingan dengan commit {baseline['meta'].get('commit')} ({baseline['meta'].get('created_at')}):")
+    for name, result in current['results'].items():
+        previous = baseline['results'].get(name)
+        if not result or not previous or not result.get('per_second') or not previous.get('per_second'):
+            continue
+        ratio = result['per_second'] / previous['per_second']
+        status = ''
+        if ratio < 1 - tolerance:
+            status = '  REGRESI'
+            regressions.append(name)
+        print(f"  {name:>30}: {ratio:6.2f}x{status}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=50, help="jumlah halaman situs tiruan (50 hingga 50000)")
+    parser.add_argument('--cards-per-page', type=int, default=20)
+    parser.add_argument('--rows', type=int, default=100000, help="jumlah baris untuk benchmark transform dan exporter")
+    parser.add_argument('--workers', type=int, default=1, help="jumlah worker fetch untuk scrape_fashion")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--db-url', default=None, help="URL PostgreSQL untuk exporter database, bawaan SQLite sementara")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    parser.add_argument('--compare', metavar='BASELINE', default=None, help="file JSON hasil commit lain sebagai pembanding")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--fail-on-regression', action='store_true', help="keluar dengan kode 1 jika ada regresi")
+    args = parser.parse_args()
+
+    results = {}
+    bench_scrape(args, results)
+    bench_extract(args, results)
+    bench_transform_and_load(args, results)
+
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'args': vars(args),
+        },
+        'results': results,
+    }
+    for name, result in results.items():
+        if result is None:
+            print(f"{name:>30}: dilewati")
+        else:
+            print(f"{name:>30}: {result['per_second']:12.0f} {result['unit']}/detik ({result['seconds']:.3f} detik)")
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"Hasil benchmark disimpan ke {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            regressions = compare_results(report, json.load(baseline_file), args.tolerance)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Server HTTP lokal yang menyajikan situs tiruan Fashion Studio untuk benchmark tanpa akses internet.
+
+Halaman dibangkitkan saat diminta sehingga skala 50 hingga 50.000 halaman tidak memakan memori.
+Jalankan dari root repository:
+    python -m benchmarks.server --pages 50000 --port 8000
+"""
+import argparse
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.fixtures import render_catalog_page
+
+PAGINATION_PATH_PATTERN = '/page{}'
+PAGE_PATH = re.compile(r'^/page(\d+)$')
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """Melayani '/' sebagai halaman 1 dan '/pageN' untuk halaman 2 hingga jumlah halaman server"""
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        match = PAGE_PATH.match(path)
+        page_number = 1 if path == '/' else int(match.group(1)) if match else None
+        if page_number is None or not 1 <= page_number <= self.server.total_pages:
+            self.send_error(404)
+            return
+        body = render_catalog_page(page_number, self.server.total_pages, self.server.cards_per_page)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Log per permintaan akan mendominasi waktu benchmark
+        pass
+
+class FixtureSite:
+    """Context manager yang menjalankan server situs tiruan di thread latar belakang.
+    `port=0` memilih port bebas secara otomatis; alamatnya tersedia di `base_url`."""
+
+    def __init__(self, total_pages=50, cards_per_page=20, host='127.0.0.1', port=0):
+        self.server = ThreadingHTTPServer((host, port), FixtureRequestHandler)
+        self.server.daemon_threads = True
+        self.server.total_pages = total_pages
+        self.server.cards_per_page = cards_per_page
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name='fixture-site', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=50)
+    parser.add_argument('--cards-per-page', type=int, default=20)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    site = FixtureSite(args.pages, args.cards_per_page, args.host, args.port)
+    print(f"Situs tiruan {args.pages} halaman tersedia di {site.base_url}, tekan Ctrl+C untuk berhenti.")
+    try:
+        site.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        site.server.server_close()
+
+if __name__ == "__main__":
+    main()
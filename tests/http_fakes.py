@@ -0,0 +1,12 @@
+from requests.models import Response
+
+def make_response(request, status_code=200, body=b"", headers=None):
+    """Membuat objek Response palsu untuk menggantikan akses jaringan"""
+    response = Response()
+    response.status_code = status_code
+    response._content = body
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    response.url = request.url
+    response.request = request
+    return response
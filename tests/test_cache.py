@@ -0,0 +1,102 @@
+import shutil
+import tempfile
+import time
+import unittest
+from requests.adapters import HTTPAdapter
+from unittest.mock import patch
+
+from http_fakes import make_response
+import utils.extract as utils_extract
+from utils.cache import PageCache
+from utils.extract import create_session, fetching_fashion_content, scrape_fashion
+
+class TestPageCache(unittest.TestCase):
+
+    def setUp(self):
+        """Menyiapkan direktori cache sementara."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.url = 'http://test.com/page2'
+
+    def tearDown(self):
+        """Menghapus direktori cache sementara."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_fresh_entry_served_without_network(self):
+        """Menguji entri yang masih dalam TTL disajikan dari disk tanpa permintaan jaringan."""
+        cache = PageCache(self.cache_dir, ttl=60)
+        session = create_session(cache=cache)
+        with patch.object(HTTPAdapter, 'send', side_effect=lambda request, **kwargs: make_response(request, body=b"<html>v1</html>", headers={'ETag': '"v1"'})) as mock_send:
+            first = session.get(self.url)
+            second = session.get(self.url)
+        self.assertEqual(first.content, b"<html>v1</html>")
+        self.assertEqual(second.content, b"<html>v1</html>")
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(mock_send.call_count, 1)
+        self.assertEqual(cache.lookup(self.url)['etag'], '"v1"')
+
+    def test_expired_entry_sends_conditional_request(self):
+        """Menguji entri kedaluwarsa divalidasi ulang dengan If-None-Match/If-Modified-Since dan 304."""
+        cache = PageCache(self.cache_dir, ttl=0)
+        cache.store(self.url, b"<html>v1</html>", etag='"v1"', last_modified='Wed, 01 Jan 2025 00:00:00 GMT')
+        session = create_session(cache=cache)
+        sent_headers = {}
+
+        def fake_send(request, **kwargs):
+            sent_headers.update(request.headers)
+            return make_response(request, status_code=304)
+
+        with patch.object(HTTPAdapter, 'send', side_effect=fake_send):
+            result = fetching_fashion_content(self.url, session=session)
+        self.assertEqual(result, b"<html>v1</html>")
+        self.assertEqual(sent_headers['If-None-Match'], '"v1"')
+        self.assertEqual(sent_headers['If-Modified-Since'], 'Wed, 01 Jan 2025 00:00:00 GMT')
+
+    @patch('builtins.print')
+    def test_offline_mode_replays_cache_only(self, mock_print):
+        """Menguji mode offline hanya menyajikan halaman dari cache tanpa jaringan."""
+        PageCache(self.cache_dir).store(self.url, b"<html>tersimpan</html>")
+        cache = PageCache(self.cache_dir, ttl=0, offline=True)
+        session = create_session(cache=cache)
+        with patch.object(HTTPAdapter, 'send') as mock_send:
+            self.assertEqual(fetching_fashion_content(self.url, session=session), b"<html>tersimpan</html>")
+            self.assertIsNone(fetching_fashion_content('http://test.com/page9', session=session))
+        mock_send.assert_not_called()
+
+    def test_size_bounded_eviction(self):
+        """Menguji entri yang paling lama tidak diakses dihapus ketika melewati batas ukuran."""
+        cache = PageCache(self.cache_dir, max_bytes=25)
+        cache.store('http://test.com/a', b"a" * 10)
+        time.sleep(0.01)
+        cache.store('http://test.com/b', b"b" * 10)
+        time.sleep(0.01)
+        cache.read_body('http://test.com/a')
+        time.sleep(0.01)
+        cache.store('http://test.com/c', b"c" * 10)
+
+        self.assertIsNotNone(cache.lookup('http://test.com/a'))
+        self.assertIsNone(cache.lookup('http://test.com/b'))
+        self.assertIsNotNone(cache.lookup('http://test.com/c'))
+        self.assertLessEqual(cache.total_size(), 25)
+        # Indeks dibangun ulang dari disk oleh instance baru
+        self.assertEqual(PageCache(self.cache_dir).total_size(), 20)
+
+    @patch('builtins.print')
+    def test_unchanged_page_skips_html_parsing(self, mock_print):
+        """Menguji halaman yang tidak berubah tidak diurai ulang pada scrape berikutnya."""
+        page_content = "<html><body><div class='product-container'><div class='product-details'><h3 class='product-title'>Item 1</h3></div></div></body></html>".encode()
+        cache = PageCache(self.cache_dir, ttl=0)
+        with patch.object(HTTPAdapter, 'send', side_effect=lambda request, **kwargs: make_response(request, body=page_content)):
+            first_run = scrape_fashion('http://test.com', '/page{}', delay=0, cache=cache)
+            # Hasil parsing tersimpan dari run beberapa hari sebelumnya
+            old_records = [{**record, 'Timestamp': '2000-01-01 00:00:00'} for record in first_run]
+            cache.store_parsed('http://test.com', page_content, 'bs4', old_records, False)
+            with patch.object(utils_extract, 'parse_fashion_page') as mock_parse:
+                second_run = scrape_fashion('http://test.com', '/page{}', delay=0, cache=cache)
+        mock_parse.assert_not_called()
+        self.assertEqual([{**record, 'Timestamp': None} for record in first_run], [{**record, 'Timestamp': None} for record in second_run])
+        self.assertEqual(second_run[0]['Title'], 'Item 1')
+        # Timestamp selalu waktu run saat ini, bukan waktu halaman pertama kali diurai
+        self.assertNotEqual(second_run[0]['Timestamp'], '2000-01-01 00:00:00')
+
+if __name__ == '__main__':
+    unittest.main()
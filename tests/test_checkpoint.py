@@ -0,0 +1,157 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import utils.extract as utils_extract
+from utils.checkpoint import ScrapeCheckpoint, ScrapeIncompleteError
+
+BASE_URL = 'http://test.com'
+PAGINATION_PATH = '/page{}'
+
+def page_html(number, has_next=True):
+    next_link = f"<a class='page-link' href='/page{number + 1}'>Next</a>" if has_next else ""
+    return (f"<html><body><div class='product-container'><div class='product-details'>"
+            f"<h3 class='product-title'>Item {number}</h3></div></div>{next_link}</body></html>").encode()
+
+def page_url(number):
+    return BASE_URL if number == 1 else f"{BASE_URL}/page{number}"
+
+class TestScrapeCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        """Menyiapkan file checkpoint sementara dan situs tiruan lima halaman yang gagal di halaman 4."""
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.checkpoint_file = os.path.join(self.checkpoint_dir, 'checkpoint.db')
+        self.pages = {page_url(number): page_html(number, has_next=number < 5) for number in range(1, 6)}
+        self.failing_pages = {page_url(4)}
+
+    def tearDown(self):
+        """Menghapus direktori checkpoint sementara."""
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+
+    def fake_fetch(self, url, session=None):
+        if url in self.failing_pages:
+            return None
+        return self.pages.get(url)
+
+    def scrape(self, resume, workers=1):
+        checkpoint = ScrapeCheckpoint(self.checkpoint_file, resume=resume)
+        try:
+            with patch.object(utils_extract, 'fetching_fashion_content', side_effect=self.fake_fetch) as mock_fetching_content:
+                try:
+                    records = utils_extract.scrape_fashion(BASE_URL, PAGINATION_PATH, delay=0, max_pages=10, workers=workers, checkpoint=checkpoint)
+                except ScrapeIncompleteError as e:
+                    records = e
+            return records, [fetch_call.args[0] for fetch_call in mock_fetching_content.call_args_list]
+        finally:
+            checkpoint.close()
+
+    @patch('builtins.print')
+    def test_failed_scrape_raises_and_resume_fetches_remaining_pages(self, mock_print):
+        """Menguji scraping yang gagal tidak dianggap lengkap dan resume hanya mengambil halaman yang tersisa."""
+        error, fetched = self.scrape(resume=False)
+        self.assertIsInstance(error, ScrapeIncompleteError)
+        self.assertEqual(error.page_number, 4)
+        self.assertEqual(fetched, [page_url(number) for number in range(1, 5)])
+
+        checkpoint = ScrapeCheckpoint(self.checkpoint_file)
+        status = checkpoint.status(ScrapeCheckpoint.run_key(BASE_URL, PAGINATION_PATH))
+        checkpoint.close()
+        self.assertEqual((status['status'], status['pages'], status['failed_page']), ('failed', 3, 4))
+
+        self.failing_pages = set()
+        records, fetched = self.scrape(resume=True)
+        self.assertEqual([record['Title'] for record in records], [f"Item {number}" for number in range(1, 6)])
+        self.assertEqual(fetched, [page_url(4), page_url(5)])
+
+        # Run yang sudah selesai dimulai ulang dari halaman 1 meskipun resume diminta
+        records, fetched = self.scrape(resume=True)
+        self.assertEqual(len(records), 5)
+        self.assertEqual(fetched[0], page_url(1))
+
+    @patch('builtins.print')
+    def test_resume_with_concurrent_workers_starts_after_last_page(self, mock_print):
+        """Menguji mode bersamaan melanjutkan pengambilan spekulatif dari halaman setelah checkpoint."""
+        self.scrape(resume=False, workers=3)
+        self.failing_pages = set()
+        records, fetched = self.scrape(resume=True, workers=3)
+        self.assertEqual([record['Title'] for record in records], [f"Item {number}" for number in range(1, 6)])
+        self.assertNotIn(page_url(1), fetched)
+        self.assertEqual(fetched[0], page_url(4))
+
+    @patch('builtins.print')
+    def test_without_resume_checkpoint_starts_from_first_page(self, mock_print):
+        """Menguji checkpoint tanpa resume menghapus halaman run sebelumnya."""
+        self.scrape(resume=False)
+        self.failing_pages = set()
+        records, fetched = self.scrape(resume=False)
+        self.assertEqual(len(records), 5)
+        self.assertEqual(fetched, [page_url(number) for number in range(1, 6)])
+
+    @patch('builtins.print')
+    def test_streaming_does_not_replay_or_record_unconsumed_pages(self, mock_print):
+        """Menguji halaman hanya dicatat setelah batch-nya dikonsumsi dan tidak dihasilkan ulang tanpa replay."""
+        checkpoint = ScrapeCheckpoint(self.checkpoint_file)
+        with patch.object(utils_extract, 'fetching_fashion_content', side_effect=self.fake_fetch):
+            batches = utils_extract.iter_fashion_pages(BASE_URL, PAGINATION_PATH, delay=0, checkpoint=checkpoint)
+            next(batches)
+            next(batches)
+            # Batch halaman 2 belum selesai diproses saat generator dihentikan
+            batches.close()
+        checkpoint.close()
+
+        self.failing_pages = set()
+        checkpoint = ScrapeCheckpoint(self.checkpoint_file, resume=True)
+        with patch.object(utils_extract, 'fetching_fashion_content', side_effect=self.fake_fetch):
+            titles = [[record['Title'] for record in batch]
+                      for batch in utils_extract.iter_fashion_pages(BASE_URL, PAGINATION_PATH, delay=0, checkpoint=checkpoint, replay_checkpoint=False)]
+        self.assertEqual(checkpoint.resumed_pages, 1)
+        checkpoint.close()
+        self.assertEqual(titles, [['Item 2'], ['Item 3'], ['Item 4'], ['Item 5']])
+
+    @patch('builtins.print')
+    def test_extract_main_returns_empty_frame_for_incomplete_scrape(self, mock_print):
+        """Menguji hasil scraping parsial tidak diteruskan ke tahap berikutnya saat checkpoint dipakai."""
+        checkpoint = ScrapeCheckpoint(self.checkpoint_file)
+        with patch.object(utils_extract, 'BASE_SITE_URL', BASE_URL), \
+                patch.object(utils_extract, 'fetching_fashion_content', side_effect=self.fake_fetch):
+            extracted_df = utils_extract.main(delay=0, checkpoint=checkpoint)
+        checkpoint.close()
+        self.assertTrue(extracted_df.empty)
+        self.assertIn('jalankan ulang dengan mode resume', str(mock_print.call_args_list))
+
+    @patch('builtins.print')
+    def test_streaming_load_failure_is_not_recorded(self, mock_print):
+        """Menguji halaman yang gagal di-load pada mode streaming tidak tercatat sehingga dimuat ulang saat resume."""
+        import main
+
+        self.failing_pages = set()
+        loaded_titles = []
+
+        def sink(df):
+            if df['Title'].iloc[0] == 'Item 2' and not loaded_titles[1:]:
+                loaded_titles.append(None)
+                return False
+            loaded_titles.append(df['Title'].iloc[0])
+            return True
+
+        make_sinks = lambda append, batch_number: {'csv': sink}
+        for resume in (False, True):
+            checkpoint = ScrapeCheckpoint(self.checkpoint_file, resume=resume)
+            # main mengimpor utils.extract saat dipanggil, pastikan modul yang sama dengan yang di-patch
+            with patch.dict(sys.modules, {'utils.extract': utils_extract}), patch.object(utils_extract, 'BASE_SITE_URL', BASE_URL), \
+                    patch.object(utils_extract, 'fetching_fashion_content', side_effect=self.fake_fetch):
+                main.run_streaming_etl(make_sinks=make_sinks, stages=('extract', 'load'),
+                                       extract_options={'delay': 0, 'checkpoint': checkpoint})
+            status = checkpoint.status(ScrapeCheckpoint.run_key(BASE_URL, PAGINATION_PATH))
+            checkpoint.close()
+            if not resume:
+                self.assertEqual((status['status'], status['pages'], status['failed_page']), ('failed', 1, 2))
+        self.assertEqual(status['status'], 'completed')
+        self.assertEqual(loaded_titles, ['Item 1', None, 'Item 2', 'Item 3', 'Item 4', 'Item 5'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import json
+import numpy as np
+import os
+import pandas as pd
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from utils.currency import DEFAULT_EXCHANGE_RATES, convert_prices_to_idr, load_exchange_rates, parse_prices
+from utils.transform import convert_dollar_to_rupiah, transform_data
+
+class TestParsePrices(unittest.TestCase):
+
+    def test_detects_currency_and_separators_per_row(self):
+        """Menguji simbol mata uang serta pemisah ribuan/desimal dideteksi per baris."""
+        prices = pd.Series(['$496.88', 'Rp 150.000', '12,50 €', 'EUR 1.234,50', '$1,234.50', '467.31',
+                            'rp. 25.000,00', '1 234,5 EUR', 'US$ 3', '0.500', 'CHF 10'])
+        parsed = parse_prices(prices)
+        self.assertEqual(parsed['amount'].tolist(), [496.88, 150000.0, 12.5, 1234.5, 1234.5, 467.31,
+                                                     25000.0, 1234.5, 3.0, 0.5, 10.0])
+        self.assertEqual(parsed['currency'].tolist(), ['USD', 'IDR', 'EUR', 'EUR', 'USD', 'USD',
+                                                       'IDR', 'EUR', 'USD', 'USD', 'CHF'])
+
+    def test_invalid_and_missing_prices(self):
+        """Menguji harga tidak valid atau kosong menghasilkan NaN tanpa mata uang."""
+        parsed = parse_prices(pd.Series(['Price Unavailable', 'Invalid Price', None, np.nan, '12abc34'], index=[5, 6, 7, 8, 9]))
+        self.assertTrue(parsed['amount'].isna().all())
+        self.assertTrue(parsed['currency'].isna().all())
+        self.assertEqual(parsed.index.tolist(), [5, 6, 7, 8, 9])
+
+    def test_all_prices_missing(self):
+        """Menguji kolom yang seluruh harganya kosong atau tanpa baris menghasilkan NaN, bukan IndexError."""
+        parsed = parse_prices(pd.Series([None, np.nan], index=[3, 4], dtype=object))
+        self.assertTrue(parsed['amount'].isna().all())
+        self.assertTrue(parsed['currency'].isna().all())
+        self.assertEqual(parsed.index.tolist(), [3, 4])
+        self.assertTrue(parse_prices(pd.Series([], dtype=object)).empty)
+
+    def test_parsing_matches_to_numeric_on_many_rows(self):
+        """Menguji hasil parser tervektorisasi identik dengan pd.to_numeric pada banyak harga unik."""
+        prices = pd.Series([f"${value}.{value % 100:02d}" for value in range(50000)])
+        expected = pd.to_numeric(prices.str.replace('$', '', regex=False))
+        np.testing.assert_array_equal(parse_prices(prices)['amount'].to_numpy(), expected.to_numpy())
+
+class TestConvertPricesToIdr(unittest.TestCase):
+
+    def setUp(self):
+        """Menyiapkan direktori sementara untuk file kurs."""
+        self.rates_dir = tempfile.mkdtemp()
+        self.rates_file = os.path.join(self.rates_dir, 'exchange_rates.json')
+
+    def tearDown(self):
+        """Menghapus direktori sementara."""
+        shutil.rmtree(self.rates_dir, ignore_errors=True)
+
+    @patch('builtins.print')
+    def test_mixed_batch_converted_with_rate_table(self, mock_print):
+        """Menguji batch campuran dollar dan rupiah dikonversi tanpa heuristik nilai maksimum."""
+        prices = pd.Series(['$10.00', 'Rp 150.000', '€2', 'CHF 1'])
+        converted = convert_prices_to_idr(prices, {'USD': 16000.0, 'IDR': 1.0, 'EUR': 17500.0})
+        self.assertEqual(converted.iloc[:3].tolist(), [160000.0, 150000.0, 35000.0])
+        self.assertTrue(np.isnan(converted.iloc[3]))
+        mock_print.assert_called_once_with("Peringatan: kurs untuk mata uang ['CHF'] tidak tersedia, harga tersebut diabaikan.")
+
+    def test_load_exchange_rates_from_file(self):
+        """Menguji kurs dari file JSON digabung dengan kurs bawaan."""
+        with open(self.rates_file, 'w', encoding='utf-8') as rates_file:
+            json.dump({'eur': 17500, 'USD': 16500}, rates_file)
+        rates = load_exchange_rates(self.rates_file)
+        self.assertEqual(rates, {'USD': 16500.0, 'IDR': 1.0, 'EUR': 17500.0})
+        self.assertEqual(load_exchange_rates(os.path.join(self.rates_dir, 'tidak_ada.json')), DEFAULT_EXCHANGE_RATES)
+
+    @patch('builtins.print')
+    def test_corrupt_rates_file_uses_defaults(self, mock_print):
+        """Menguji file kurs yang rusak membuat kurs bawaan dipakai."""
+        with open(self.rates_file, 'w', encoding='utf-8') as rates_file:
+            rates_file.write('[1, 2')
+        self.assertEqual(load_exchange_rates(self.rates_file), DEFAULT_EXCHANGE_RATES)
+        self.assertIn('Gagal membaca kurs mata uang', str(mock_print.call_args_list[-1]))
+
+    def test_transform_pipeline_with_exchange_rates(self):
+        """Menguji transform_data dan convert_dollar_to_rupiah dengan kurs tidak mengalikan harga dua kali."""
+        df = pd.DataFrame({
+            'Title': ['T-shirt 1', 'Batik 2', 'Pants 4', 'Unknown Product'],
+            'Price': ['$100.00', 'Rp 250.000', 'Price Unavailable', '$0.00'],
+            'Rating': ['3.9', '4.8', '3.3', 'N/A'],
+            'Colors': ['3', '3', '3', '0'],
+            'Size': ['M', 'L', 'XL', 'M'],
+            'Gender': ['Women', 'Unisex', 'Men', 'N/A'],
+            'Timestamp': ['2023-01-01 12:00:00'] * 4
+        })
+        for inplace in (False, True):
+            result = convert_dollar_to_rupiah(transform_data(df.copy(), inplace=inplace, exchange_rates=DEFAULT_EXCHANGE_RATES),
+                                              inplace=inplace, exchange_rates=DEFAULT_EXCHANGE_RATES)
+            self.assertEqual(result['Title'].tolist(), ['T-shirt 1', 'Batik 2'])
+            self.assertEqual(result['Price'].tolist(), [1600000.0, 250000.0])
+
+    def test_transform_chunk_without_prices_returns_empty_frame(self):
+        """Menguji chunk yang seluruh Price-nya kosong dibuang tanpa kesalahan seperti sebelum konversi kurs."""
+        df = pd.DataFrame({'Title': ['T-shirt 1', 'Hoodie 3'], 'Price': [np.nan, np.nan], 'Rating': ['3.9', '4.8'],
+                           'Colors': ['3', '3'], 'Size': ['M', 'L'], 'Gender': ['Women', 'Men'],
+                           'Timestamp': ['2023-01-01 12:00:00'] * 2}).astype(object)
+        for inplace in (False, True):
+            result = transform_data(df.copy(), inplace=inplace, exchange_rates=DEFAULT_EXCHANGE_RATES)
+            self.assertTrue(result.empty)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,13 +8,14 @@ import sys
 import time
 import unittest
 from bs4 import BeautifulSoup
-from unittest.mock import patch, Mock, call
+from unittest.mock import patch, Mock, call, ANY
 
 if 'utils.extract' in sys.modules:
     del sys.modules['utils.extract']
 
 try:
-    from utils.extract import HEADERS, extract_fashion_data, fetching_fashion_content, scrape_fashion
+    import utils.extract as utils_extract
+    from utils.extract import HEADERS, create_session, extract_fashion_data, fetching_fashion_content, scrape_fashion
 except ImportError as e:
     print(f"Error: Tidak dapat mengimpor fungsi dari utils.extract. Pastikan extract.py ada dan berada di PYTHONPATH. Error: {e}")
     
@@ -181,9 +182,9 @@ class TestExtractFunctions(unittest.TestCase):
         scraped_data = scrape_fashion(BASE_URL, PAGINATION_PATH, delay=0, max_pages=5)
 
         mock_fetching_content.assert_has_calls([
-            call(BASE_URL),
-            call(f"{BASE_URL}{PAGINATION_PATH.format(2)}"),
-            call(f"{BASE_URL}{PAGINATION_PATH.format(3)}")
+            call(BASE_URL, session=ANY),
+            call(f"{BASE_URL}{PAGINATION_PATH.format(2)}", session=ANY),
+            call(f"{BASE_URL}{PAGINATION_PATH.format(3)}", session=ANY)
         ])
         self.assertEqual(mock_fetching_content.call_count, 3)
         self.assertEqual(mock_extract_data.call_count, 3)
@@ -299,4 +300,293 @@ class TestExtractFunctions(unittest.TestCase):
         mock_fetching_content.assert_called_once()
         self.assertEqual(mock_extract_data_mock.call_count, 2)
         self.assertEqual(len(scraped_data), 1)
-        self.assertEqual(scraped_data[0]['Title'], 'Item A')
\ No newline at end of file
+        self.assertEqual(scraped_data[0]['Title'], 'Item A')
+
+    @patch('builtins.print')
+    def test_scrape_fashion_concurrent_keeps_page_order(self, mock_print):
+        """Menguji mode bersamaan `scrape_fashion` mengembalikan baris sesuai urutan halaman."""
+        BASE_URL = 'http://test.com'
+        PAGINATION_PATH = '/page{}'
+
+        def page_html(number, has_next=True):
+            next_link = f"<a class='page-link' href='/page{number + 1}'>Next</a>" if has_next else ""
+            return (f"<html><body><div class='product-container'><div class='product-details'>"
+                    f"<h3 class='product-title'>Item {number}</h3></div></div>{next_link}</body></html>").encode()
+
+        pages = {
+            BASE_URL: page_html(1),
+            f"{BASE_URL}/page2": page_html(2),
+            f"{BASE_URL}/page3": page_html(3),
+            f"{BASE_URL}/page4": page_html(4, has_next=False),
+        }
+
+        def fake_fetch(url, session=None):
+            # Halaman awal dibuat lebih lambat agar hasil thread selesai tidak berurutan
+            if url == BASE_URL:
+                time.sleep(0.05)
+            return pages.get(url)
+
+        with patch('utils.extract.fetching_fashion_content', side_effect=fake_fetch) as mock_fetching_content:
+            scraped_data = scrape_fashion(BASE_URL, PAGINATION_PATH, delay=0, max_pages=10, workers=3)
+
+        self.assertEqual([item['Title'] for item in scraped_data], ['Item 1', 'Item 2', 'Item 3', 'Item 4'])
+        # Pengambilan spekulatif tidak boleh melewati jendela worker setelah halaman terakhir
+        self.assertLessEqual(mock_fetching_content.call_count, 4 + 3 - 1)
+        mock_print.assert_any_call(f"Tidak ditemukan halaman berikutnya di {BASE_URL}/page4, hentikan proses scraping.")
+
+    @patch('builtins.print')
+    def test_scrape_fashion_concurrent_stops_at_first_empty_page(self, mock_print):
+        """Menguji mode bersamaan berhenti pada halaman kosong pertama dan mematuhi max_pages."""
+        BASE_URL = 'http://test.com'
+        PAGINATION_PATH = '/page{}'
+        page_with_item = "<html><body><div class='product-container'><div class='product-details'><h3>Item</h3></div></div><a class='page-link' href='/next'>Next</a></body></html>".encode()
+        empty_page = "<html><body><div>No items here</div></body></html>".encode()
+
+        def fake_fetch(url, session=None):
+            return empty_page if url == f"{BASE_URL}/page3" else page_with_item
+
+        with patch('utils.extract.fetching_fashion_content', side_effect=fake_fetch) as mock_fetching_content:
+            scraped_data = scrape_fashion(BASE_URL, PAGINATION_PATH, delay=0, max_pages=10, workers=4)
+        self.assertEqual(len(scraped_data), 2)
+        mock_print.assert_any_call(f"Tidak ditemukan kontainer item produk di {BASE_URL}/page3, akhiri proses scraping.")
+
+        with patch('utils.extract.fetching_fashion_content', return_value=page_with_item) as mock_fetching_content:
+            scraped_data = scrape_fashion(BASE_URL, PAGINATION_PATH, delay=0, max_pages=2, workers=4)
+        self.assertEqual(len(scraped_data), 2)
+        self.assertEqual(mock_fetching_content.call_count, 2)
+        mock_print.assert_any_call("Mencapai jumlah halaman maksimum (2), selesaikan proses scraping.")
+
+
+    @patch('utils.extract.fetching_fashion_content')
+    @patch('builtins.print')
+    def test_scrape_fashion_reuses_injected_session(self, mock_print, mock_fetching_content):
+        """Menguji setiap halaman memakai session yang sama ketika session diinjeksikan."""
+        BASE_URL = 'http://test.com'
+        PAGINATION_PATH = '/page{}'
+        page1_content = "<html><body><div class='product-container'><div class='product-details'><h3>Item 1</h3></div></div><a class='page-link' href='/page2'>Next</a></body></html>".encode()
+        page2_content = "<html><body><div class='product-container'><div class='product-details'><h3>Item 2</h3></div></div></body></html>".encode()
+        mock_fetching_content.side_effect = [page1_content, page2_content]
+        shared_session = Mock()
+
+        scrape_fashion(BASE_URL, PAGINATION_PATH, delay=0, max_pages=5, session=shared_session)
+
+        mock_fetching_content.assert_has_calls([
+            call(BASE_URL, session=shared_session),
+            call(f"{BASE_URL}/page2", session=shared_session)
+        ])
+        # Session milik pemanggil tidak boleh ditutup oleh scrape_fashion
+        shared_session.close.assert_not_called()
+
+    def test_create_session_connection_pool(self):
+        """Menguji `create_session` memasang adapter dengan ukuran pool dan keep-alive yang diatur."""
+        session = create_session(pool_size=4)
+        adapter = session.get_adapter('https://fashion-studio.dicoding.dev/')
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertEqual(session.headers['Connection'], 'keep-alive')
+        session.close()
+
+        session_no_keep_alive = create_session(keep_alive=False)
+        self.assertEqual(session_no_keep_alive.headers['Connection'], 'close')
+        session_no_keep_alive.close()
+
+    @patch('utils.extract.fetching_fashion_content')
+    def test_get_front_page_content_is_lazy_and_cached(self, mock_fetching_content):
+        """Menguji halaman depan hanya diambil ketika diminta dan hasilnya disimpan di cache."""
+        import utils.extract
+        utils.extract._front_page_divs = None
+        mock_fetching_content.return_value = b"<div>Satu</div><div>Dua</div>"
+
+        first = utils.extract.get_front_page_content()
+        second = utils.extract.get_front_page_content()
+        self.assertEqual(len(first), 2)
+        self.assertIs(first, second)
+        mock_fetching_content.assert_called_once()
+
+        utils.extract.get_front_page_content(refresh=True)
+        self.assertEqual(mock_fetching_content.call_count, 2)
+        utils.extract._front_page_divs = None
+
+    @patch('utils.extract.datetime')
+    def test_extract_fashion_data_fast_matches_bs4_engine(self, mock_datetime):
+        """Menguji engine 'fast' menghasilkan dict yang sama persis dengan `extract_fashion_data`."""
+        mock_datetime.now.return_value.strftime.return_value = '2024-01-01 00:00:00'
+        samples = [
+            """<div class="product-container"><div class="product-details">
+                <h3 class="product-title">Stylish Shirt</h3>
+                <div class="price-container"><span class="price">$25.50</span></div>
+                <p>Rating: ⭐ 4.5 / 5</p><p>2 Colors</p><p>Size: M</p><p>Gender: Men</p>
+            </div></div>""",
+            """<div class="product-container"><div class="product-details">
+                <h3 class="product-title">Unknown Product</h3>
+                <div class="price-container">$0.00</div>
+                <p>Rating: ⭐ Invalid Rating / 5</p><p>0 Colors</p><p>Size: N/A</p><p>Gender: N/A</p>
+            </div></div>""",
+            """<div class="product-container"><div class="product-details">
+                <h3 class="product-title">Basic Item</h3><div class="price-container">$10.00</div>
+            </div></div>""",
+            """<div class="product-container"><div class="product-details">
+                <h3>Tanpa Kelas</h3><p>Gender: Women</p>
+            </div></div>""",
+            """<div class="product-container"><div>Konten lain</div></div>""",
+        ]
+        for sample_html in samples:
+            article = BeautifulSoup(sample_html, 'html.parser').find('div', class_='product-container')
+            self.assertEqual(utils_extract.extract_fashion_data_fast(article), extract_fashion_data(article))
+
+    @patch('utils.extract.datetime')
+    def test_parse_fashion_page_engines_return_same_records(self, mock_datetime):
+        """Menguji `parse_fashion_page` memberikan hasil identik untuk semua engine parser."""
+        mock_datetime.now.return_value.strftime.return_value = '2024-01-01 00:00:00'
+        page_content = """
+        <html><body>
+            <div class='collection-card'><div class='product-details'><h3 class='product-title'>Item A</h3>
+                <div class='price-container'><span class='price'>$10.00</span></div>
+                <p>Rating: ⭐ 4.0 / 5</p><p>1 Colors</p><p>Size: S</p><p>Gender: Unisex</p></div></div>
+            <div class='collection-card'><div class='product-details'><h3 class='product-title'>Item B</h3>
+                <div class='price-container'>$20.00</div><p>Rating: ⭐ 3.5 / 5</p></div></div>
+            <ul class='pagination'><li><a class='page-link' href='/page2'>Next</a></li></ul>
+        </body></html>
+        """.encode()
+        results = [utils_extract.parse_fashion_page(page_content, engine=engine) for engine in utils_extract.PARSER_ENGINES]
+        for records, has_next_page in results:
+            self.assertEqual(records, results[0][0])
+            self.assertTrue(has_next_page)
+        self.assertEqual([record['Title'] for record in results[0][0]], ['Item A', 'Item B'])
+
+        with self.assertRaises(ValueError):
+            scrape_fashion('http://test.com', '/page{}', delay=0, engine='regex')
+
+    @patch('utils.extract.fetching_fashion_content')
+    @patch('builtins.print')
+    def test_iter_fashion_pages_yields_one_batch_per_page(self, mock_print, mock_fetching_content):
+        """Menguji `iter_fashion_pages` menghasilkan batch per halaman secara bertahap."""
+        BASE_URL = 'http://test.com'
+        PAGINATION_PATH = '/page{}'
+        page1_content = "<html><body><div class='product-container'><div class='product-details'><h3 class='product-title'>Item 1</h3></div></div><div class='product-container'><div class='product-details'><h3 class='product-title'>Item 2</h3></div></div><a class='page-link' href='/page2'>Next</a></body></html>".encode()
+        page2_content = "<html><body><div class='product-container'><div class='product-details'><h3 class='product-title'>Item 3</h3></div></div></body></html>".encode()
+        mock_fetching_content.side_effect = [page1_content, page2_content]
+
+        batches = utils_extract.iter_fashion_pages(BASE_URL, PAGINATION_PATH, delay=0, max_pages=5)
+        first_batch = next(batches)
+        # Halaman kedua belum diambil sebelum batch pertama dikonsumsi
+        self.assertEqual(mock_fetching_content.call_count, 1)
+        self.assertEqual([item['Title'] for item in first_batch], ['Item 1', 'Item 2'])
+        self.assertEqual([[item['Title'] for item in batch] for batch in batches], [['Item 3']])
+        self.assertEqual(mock_fetching_content.call_count, 2)
+
+    @patch('builtins.print')
+    def test_scrape_fashion_process_pool_parsing_matches_sequential(self, mock_print):
+        """Menguji parsing di ProcessPoolExecutor menghasilkan data yang sama dan berurutan seperti mode berurutan."""
+        BASE_URL = 'http://test.com'
+        PAGINATION_PATH = '/page{}'
+        total_pages = 5
+
+        def page_html(number):
+            cards = "".join(
+                f"<div class='product-container'><div class='product-details'><h3 class='product-title'>Item {number}-{i}</h3>"
+                f"<div class='price-container'>${number}.{i}0</div><p>Rating: ⭐ 4.{i} / 5</p><p>{i} Colors</p>"
+                f"<p>Size: M</p><p>Gender: Men</p></div></div>"
+                for i in range(3)
+            )
+            next_link = f"<a class='page-link' href='/page{number + 1}'>Next</a>" if number < total_pages else ""
+            return f"<html><body>{cards}{next_link}</body></html>".encode()
+
+        pages = {utils_extract.build_page_url(BASE_URL, PAGINATION_PATH, n): page_html(n) for n in range(1, total_pages + 1)}
+
+        def fake_fetch(url, session=None):
+            return pages.get(url)
+
+        strip_timestamp = lambda records: [{k: v for k, v in r.items() if k != 'Timestamp'} for r in records]
+        with patch('utils.extract.fetching_fashion_content', side_effect=fake_fetch):
+            sequential = scrape_fashion(BASE_URL, PAGINATION_PATH, delay=0, max_pages=10)
+            multiprocess = scrape_fashion(BASE_URL, PAGINATION_PATH, delay=0, max_pages=10, workers=2, parse_workers=2)
+        self.assertEqual(len(multiprocess), total_pages * 3)
+        self.assertEqual(strip_timestamp(multiprocess), strip_timestamp(sequential))
+
+    def test_parse_pool_does_not_fork_fetcher_threads(self):
+        """Menguji proses parser dibuat dengan forkserver/spawn agar lock milik thread fetcher tidak ikut tersalin."""
+        pool = utils_extract.create_parse_pool(1)
+        try:
+            self.assertIn(pool._mp_context.get_start_method(), ('forkserver', 'spawn'))
+            self.assertEqual(pool.submit(utils_extract.parse_fashion_page, b"<html></html>").result(timeout=60), (None, False))
+        finally:
+            pool.shutdown()
+
+    def test_parse_fashion_page_uses_one_timestamp_per_page(self):
+        """Menguji Timestamp diambil sekali per halaman sehingga semua kartu memiliki nilai yang sama."""
+        page_content = "".join(
+            f"<div class='product-container'><div class='product-details'><h3 class='product-title'>Item {i}</h3></div></div>"
+            for i in range(5)
+        ).encode()
+        with patch('utils.extract.datetime') as mock_datetime:
+            mock_datetime.now.return_value.strftime.side_effect = ['2024-01-01 00:00:00', '2024-01-01 00:00:01']
+            records, _ = utils_extract.parse_fashion_page(page_content, engine='fast')
+        self.assertEqual(mock_datetime.now.call_count, 1)
+        self.assertEqual({record['Timestamp'] for record in records}, {'2024-01-01 00:00:00'})
+
+    def test_card_parse_cache_skips_unchanged_cards(self):
+        """Menguji kartu dengan HTML yang sama diambil dari cache, termasuk saat kartu bergeser ke halaman lain."""
+        card = lambda i: (f"<div class='product-container'><div class='product-details'><h3 class='product-title'>Item {i}</h3>"
+                          f"<div class='price-container'>${i}.00</div><p>Rating: ⭐ 4.0 / 5</p><p>{i} Colors</p>"
+                          f"<p>Size: M</p><p>Gender: Men</p></div></div>")
+        page1 = f"<html><body>{card(1)}{card(2)}<a class='page-link' href='/page2'>Next</a></body></html>".encode()
+        shifted = f"<html><body>{card(0)}{card(1)}{card(2)}<a class='page-link' href='/page3'>Next</a></body></html>".encode()
+        for engine in utils_extract.PARSER_ENGINES:
+            card_cache = utils_extract.CardParseCache(max_entries=10)
+            first, _ = utils_extract.parse_fashion_page(page1, engine=engine, card_cache=card_cache)
+            self.assertEqual((card_cache.hits, card_cache.misses), (0, 2))
+            with patch('utils.extract.extract_fashion_data', wraps=utils_extract.extract_fashion_data) as mock_bs4, \
+                 patch('utils.extract.extract_fashion_data_fast', wraps=utils_extract.extract_fashion_data_fast) as mock_fast:
+                records, has_next_page = utils_extract.parse_fashion_page(shifted, engine=engine, card_cache=card_cache)
+            self.assertEqual(mock_bs4.call_count + mock_fast.call_count, 1)
+            self.assertEqual((card_cache.hits, card_cache.misses), (2, 3))
+            self.assertTrue(has_next_page)
+            self.assertEqual([record['Title'] for record in records], ['Item 0', 'Item 1', 'Item 2'])
+            self.assertEqual(records[1:], [{**record, 'Timestamp': records[0]['Timestamp']} for record in first])
+            # Hasil dari cache adalah salinan, mengubahnya tidak mengubah entri cache
+            records[1]['Title'] = 'Diubah'
+            again, _ = utils_extract.parse_fashion_page(shifted, engine=engine, card_cache=card_cache)
+            self.assertEqual(again[1]['Title'], 'Item 1')
+
+    def test_card_parse_cache_is_bounded_and_skips_mismatched_pages(self):
+        """Menguji cache membuang entri terlama dan tidak dipakai jika HTML mentah tidak dapat dipotong per kartu."""
+        card_cache = utils_extract.CardParseCache(max_entries=2)
+        for key in (b'a', b'b', b'c'):
+            card_cache.put(key, {'Title': key.decode(), 'Timestamp': 'lama'})
+        self.assertEqual(len(card_cache), 2)
+        self.assertIsNone(card_cache.get(b'a', 'baru'))
+        self.assertEqual(card_cache.get(b'c', 'baru'), {'Title': 'c', 'Timestamp': 'baru'})
+
+        content = b"<div class='product-details'><h3>A</h3></div><div class='product-details'><h3>B</h3></div>"
+        self.assertEqual(len(utils_extract.CardParseCache.card_keys(content, 2)), 2)
+        self.assertIsNone(utils_extract.CardParseCache.card_keys(content, 3))
+
+    @patch('builtins.print')
+    def test_scrape_fashion_against_local_fixture_site(self, mock_print):
+        """Menguji `scrape_fashion` melalui HTTP sungguhan terhadap situs tiruan lokal dari suite benchmark."""
+        from benchmarks.fixtures import make_scraped_frame
+        from benchmarks.server import PAGINATION_PATH_PATTERN, FixtureSite
+
+        with FixtureSite(total_pages=3, cards_per_page=4) as site:
+            records = scrape_fashion(site.base_url, PAGINATION_PATH_PATTERN, delay=0, max_pages=10, engine='fast')
+        scraped = pd.DataFrame(records).drop(columns=['Timestamp'])
+        expected = make_scraped_frame(12).drop(columns=['Timestamp'])
+        pd.testing.assert_frame_equal(scraped, expected)
+        mock_print.assert_any_call(f"Tidak ditemukan halaman berikutnya di {site.base_url}{PAGINATION_PATH_PATTERN.format(3)}, hentikan proses scraping.")
+
+    @patch('builtins.print')
+    def test_concurrent_scrape_ignores_fetches_past_last_page(self, mock_print):
+        """Menguji halaman spekulatif setelah halaman terakhir tidak dicetak maupun dihitung sebagai kesalahan fetch."""
+        from benchmarks.server import PAGINATION_PATH_PATTERN, FixtureSite
+        from utils.metrics import FETCH_ERRORS, REGISTRY
+
+        errors_before = REGISTRY.counter(FETCH_ERRORS)
+        with FixtureSite(total_pages=7, cards_per_page=2) as site:
+            records = scrape_fashion(site.base_url, PAGINATION_PATH_PATTERN, delay=0, workers=4)
+            # Kesalahan pada halaman yang benar-benar dibutuhkan tetap dilaporkan
+            self.assertEqual(scrape_fashion(f"{site.base_url}/missing", PAGINATION_PATH_PATTERN, delay=0, workers=4), [])
+        self.assertEqual(len(records), 14)
+        self.assertEqual(REGISTRY.counter(FETCH_ERRORS) - errors_before, 1)
+        errors = [str(print_call) for print_call in mock_print.call_args_list if 'Terjadi kesalahan saat memuat' in str(print_call)]
+        self.assertEqual(len(errors), 1)
+        self.assertIn('/missing', errors[0])
@@ -0,0 +1,71 @@
+import os
+import pandas as pd
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from utils.incremental import ProductFingerprintStore, fingerprint_products
+
+class TestIncrementalFunctions(unittest.TestCase):
+
+    def setUp(self):
+        """Menyiapkan file state sementara dan sampel hasil scraping."""
+        self.state_dir = tempfile.mkdtemp()
+        self.state_file = os.path.join(self.state_dir, 'fingerprints.json')
+        self.df = pd.DataFrame({
+            'Title': ['T-shirt 1', 'Hoodie 3', 'Pants 4'],
+            'Price': ['$100.00', '$496.88', '$467.31'],
+            'Rating': ['3.9', '4.8', '3.3'],
+            'Colors': ['3', '3', '3'],
+            'Size': ['M', 'L', 'XL'],
+            'Gender': ['Women', 'Unisex', 'Men'],
+            'Timestamp': ['2023-01-01 12:00:00', '2023-01-01 12:00:01', '2023-01-01 12:00:02']
+        })
+
+    def tearDown(self):
+        """Menghapus direktori state sementara."""
+        shutil.rmtree(self.state_dir, ignore_errors=True)
+
+    def test_fingerprint_ignores_timestamp(self):
+        """Menguji fingerprint tidak berubah jika hanya Timestamp yang berbeda."""
+        later_df = self.df.assign(Timestamp='2024-06-01 08:00:00')
+        self.assertEqual(fingerprint_products(self.df).tolist(), fingerprint_products(later_df).tolist())
+        changed_df = self.df.assign(Price=['$100.00', '$500.00', '$467.31'])
+        self.assertNotEqual(fingerprint_products(self.df)[1], fingerprint_products(changed_df)[1])
+
+    def test_only_new_or_changed_products_pass_after_commit(self):
+        """Menguji run berikutnya hanya meneruskan produk baru atau berubah."""
+        store = ProductFingerprintStore(self.state_file)
+        self.assertEqual(len(store.filter_changed(self.df)), 3)
+        store.commit()
+
+        next_run = pd.concat([
+            self.df.assign(Timestamp='2024-06-01 08:00:00'),
+            pd.DataFrame([{'Title': 'Jacket 9', 'Price': '$50.00', 'Rating': '4.0', 'Colors': '2',
+                           'Size': 'S', 'Gender': 'Men', 'Timestamp': '2024-06-01 08:00:00'}])
+        ], ignore_index=True)
+        next_run.loc[next_run['Title'] == 'Hoodie 3', 'Price'] = '$399.00'
+
+        reloaded_store = ProductFingerprintStore(self.state_file)
+        changed_df = reloaded_store.filter_changed(next_run)
+        self.assertEqual(sorted(changed_df['Title']), ['Hoodie 3', 'Jacket 9'])
+
+    def test_fingerprints_not_persisted_without_commit(self):
+        """Menguji fingerprint tidak disimpan jika load gagal dan commit tidak dipanggil."""
+        store = ProductFingerprintStore(self.state_file)
+        store.filter_changed(self.df)
+        self.assertFalse(os.path.exists(self.state_file))
+        self.assertEqual(len(ProductFingerprintStore(self.state_file).filter_changed(self.df)), 3)
+
+    @patch('builtins.print')
+    def test_corrupt_state_file_treated_as_empty(self, mock_print):
+        """Menguji file state yang rusak membuat semua produk dianggap baru."""
+        with open(self.state_file, 'w', encoding='utf-8') as state_file:
+            state_file.write('{bukan json')
+        store = ProductFingerprintStore(self.state_file)
+        self.assertEqual(len(store.filter_changed(self.df)), 3)
+        self.assertIn('Gagal membaca fingerprint produk', str(mock_print.call_args_list[-1]))
+
+if __name__ == '__main__':
+    unittest.main()
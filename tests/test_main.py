@@ -0,0 +1,172 @@
+import os
+import pandas as pd
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import main
+from utils.currency import DEFAULT_EXCHANGE_RATES
+from utils.load import export_to_csv
+from utils.transform import convert_dollar_to_rupiah, transform_data
+
+class TestReprocessCommand(unittest.TestCase):
+
+    def setUp(self):
+        """Menjalankan setiap pengujian di direktori kerja sementara berisi riwayat hasil pipeline."""
+        self.original_dir = os.getcwd()
+        self.work_dir = tempfile.mkdtemp()
+        os.chdir(self.work_dir)
+        scraped_df = pd.DataFrame({
+            'Title': ['T-shirt 1', 'Hoodie 3', 'Pants 4', 'Jacket 5'],
+            'Price': ['$102.15', '$496.88', '$467.31', '$80.00'],
+            'Rating': ['3.9', '4.8', '3.3', '4.1'],
+            'Colors': ['3', '3', '3', '2'],
+            'Size': ['M', 'L', 'XL', 'S'],
+            'Gender': ['Women', 'Unisex', 'Men', 'Men'],
+            'Timestamp': ['2024-01-01 00:00:00'] * 4
+        })
+        self.pipeline_df = convert_dollar_to_rupiah(transform_data(scraped_df, exchange_rates=DEFAULT_EXCHANGE_RATES),
+                                                    exchange_rates=DEFAULT_EXCHANGE_RATES)
+        with patch('builtins.print'):
+            export_to_csv(self.pipeline_df, 'history.csv')
+
+    def tearDown(self):
+        """Kembali ke direktori kerja semula dan menghapus direktori sementara."""
+        os.chdir(self.original_dir)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    @patch('builtins.print')
+    def test_reprocess_pipeline_output_keeps_rupiah_prices(self, mock_print):
+        """Menguji riwayat dalam format keluaran pipeline sendiri tidak dikonversi ke rupiah untuk kedua kalinya."""
+        main.main(['--reprocess', 'history.csv', '--sinks', 'file', '--chunksize', '2'])
+        reprocessed = pd.read_csv('products.csv')
+        self.assertEqual(reprocessed['Price'].tolist(), self.pipeline_df['Price'].tolist())
+        self.assertEqual(reprocessed['Price'].iloc[0], 1634400.0)
+
+    @patch('builtins.print')
+    def test_reprocess_refuses_to_overwrite_input(self, mock_print):
+        """Menguji --reprocess menolak file riwayat yang sama dengan file tujuan sink file."""
+        os.replace('history.csv', 'products.csv')
+        with patch('sys.stderr'), self.assertRaises(SystemExit):
+            main.main(['--reprocess', os.path.join(self.work_dir, 'products.csv'), '--sinks', 'file'])
+        self.assertEqual(len(pd.read_csv('products.csv')), len(self.pipeline_df))
+        self.assertTrue(main.writes_to_input('products-00003.parquet', 'parquet'))
+        self.assertFalse(main.writes_to_input('products-00003.parquet', 'csv'))
+
+class TestFingerprintCommit(unittest.TestCase):
+
+    @patch('builtins.print')
+    def test_fingerprints_committed_only_when_every_sink_succeeds(self, mock_print):
+        """Menguji fingerprint tidak disimpan jika salah satu sink gagal atau timeout."""
+        store = Mock()
+        main.commit_fingerprints(store, {'csv': {'success': True}, 'postgresql': {'success': False}})
+        main.commit_fingerprints(store, {})
+        store.commit.assert_not_called()
+        self.assertIn('postgresql', str(mock_print.call_args_list[0]))
+
+        main.commit_fingerprints(store, {'csv': {'success': True}, 'postgresql': {'success': True}})
+        store.commit.assert_called_once()
+        main.commit_fingerprints(None, {'csv': {'success': True}})
+
+    @patch('builtins.print')
+    def test_streaming_discards_fingerprints_of_failed_batch(self, mock_print):
+        """Menguji fingerprint batch yang gagal di-load tidak ikut tersimpan oleh batch berikutnya yang berhasil."""
+        import utils.extract as utils_extract
+        from utils.incremental import ProductFingerprintStore
+
+        batches = [pd.DataFrame({'Title': ['A'], 'Price': ['$1.00'], 'Size': ['M'], 'Gender': ['Men']}),
+                   pd.DataFrame({'Title': ['B'], 'Price': ['$2.00'], 'Size': ['M'], 'Gender': ['Men']})]
+        sink_results = iter([False, True])
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, 'fp.json')
+            with patch.dict(sys.modules, {'utils.extract': utils_extract}), patch.object(utils_extract, 'iter_main', return_value=(batch for batch in batches)):
+                main.run_streaming_etl(make_sinks=lambda append, batch_number: {'csv': lambda df: next(sink_results)},
+                                       stages=('extract', 'load'), fingerprint_store=ProductFingerprintStore(path))
+            next_run = ProductFingerprintStore(path)
+            self.assertEqual(next_run.filter_changed(batches[0])['Title'].tolist(), ['A'])
+            self.assertTrue(next_run.filter_changed(batches[1]).empty)
+        printed = [str(call) for call in mock_print.call_args_list]
+        self.assertTrue(any('Batch 1 gagal di-load ke sink: csv' in line for line in printed))
+        self.assertTrue(any('1 dari 2 batch gagal di-load' in line for line in printed))
+        self.assertFalse(any('Load data lengkap' in line for line in printed))
+
+class TestFileSink(unittest.TestCase):
+
+    def test_file_sink_path_per_batch_and_run(self):
+        """Menguji nama file sink per batch dan per run untuk format yang tidak mendukung append."""
+        self.assertEqual(main.file_sink_path('csv', 3, '20240101-120000'), 'products.csv')
+        self.assertEqual(main.file_sink_path('parquet'), 'products.parquet')
+        self.assertEqual(main.file_sink_path('parquet', 3), 'products-00003.parquet')
+        self.assertEqual(main.file_sink_path('feather', run_id='20240101-120000'), 'products-20240101-120000.feather')
+        self.assertEqual(main.file_sink_path('parquet', 3, '20240101-120000'), 'products-20240101-120000-00003.parquet')
+
+    @patch('builtins.print')
+    def test_incremental_columnar_run_writes_its_own_file(self, mock_print):
+        """Menguji run incremental Parquet tidak menimpa file hasil run sebelumnya."""
+        with patch('main.run_batch_etl') as mock_run, \
+                patch('main.REGISTRY.write_json', return_value={'summary': {'stage_seconds': {}}}):
+            main.main(['--incremental', '--format', 'parquet', '--sinks', 'file'])
+            main.main(['--format', 'parquet', '--sinks', 'file'])
+        incremental_sinks, full_sinks = [call.kwargs['make_sinks'] for call in mock_run.call_args_list]
+        self.assertRegex(incremental_sinks.keywords['run_id'], r'^\d{8}-\d{6}$')
+        self.assertIsNone(full_sinks.keywords['run_id'])
+
+    @patch('builtins.print')
+    def test_compression_validated_at_parse_time(self, mock_print):
+        """Menguji --compression yang tidak dikenal atau tidak berlaku untuk format ditolak sebelum run dimulai."""
+        for argv in (['--format', 'parquet', '--compression', 'lz5'], ['--format', 'feather', '--compression', 'snappy'],
+                     ['--compression', 'zstd']):
+            with patch('main.run_batch_etl') as mock_run, patch('sys.stderr'), self.assertRaises(SystemExit):
+                main.main(argv + ['--sinks', 'file'])
+            mock_run.assert_not_called()
+
+class TestExtractOptions(unittest.TestCase):
+
+    @patch('builtins.print')
+    def test_rate_flags_build_adaptive_rate_limiter(self, mock_print):
+        """Menguji --rate dan --max-rate meneruskan rate limiter adaptif ke tahap extract."""
+        with patch('main.run_batch_etl') as mock_run, \
+                patch('main.REGISTRY.write_json', return_value={'summary': {'stage_seconds': {}}}):
+            main.main(['--rate', '2', '--max-rate', '10', '--sinks', 'file'])
+            main.main(['--sinks', 'file'])
+        limiter = mock_run.call_args_list[0].kwargs['extract_options']['rate_limiter']
+        self.assertEqual((limiter.rate, limiter.max_rate), (2.0, 10.0))
+        self.assertIsNone(mock_run.call_args_list[1].kwargs['extract_options']['rate_limiter'])
+        with patch('sys.stderr'), self.assertRaises(SystemExit):
+            main.main(['--max-rate', '10'])
+
+    @patch('builtins.print')
+    def test_offline_replays_page_cache(self, mock_print):
+        """Menguji --offline meneruskan cache halaman dalam mode offline ke tahap extract."""
+        with tempfile.TemporaryDirectory() as work_dir, patch('main.run_batch_etl') as mock_run, \
+                patch('main.REGISTRY.write_json', return_value={'summary': {'stage_seconds': {}}}):
+            main.main(['--offline', '--page-cache', os.path.join(work_dir, 'cache'), '--sinks', 'file'])
+        cache = mock_run.call_args.kwargs['extract_options']['cache']
+        self.assertTrue(cache.offline)
+        self.assertEqual(cache.directory, os.path.join(work_dir, 'cache'))
+
+    @patch('builtins.print')
+    def test_card_cache_persists_between_runs(self, mock_print):
+        """Menguji --card-cache memuat entri dari run sebelumnya dan menyimpannya kembali di akhir run."""
+        from utils.extract import CardParseCache
+
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, 'cards.json')
+            previous = CardParseCache(path=path)
+            previous.put(b'kartu-1', {'Title': 'Item 1', 'Price': '$10.00', 'Timestamp': 'lama'})
+            previous.save()
+
+            def scrape_one_card(extract_options, **kwargs):
+                card_cache = extract_options['card_cache']
+                self.assertEqual(card_cache.get(b'kartu-1', 'baru'), {'Title': 'Item 1', 'Price': '$10.00', 'Timestamp': 'baru'})
+                card_cache.put(b'kartu-2', {'Title': 'Item 2', 'Price': '$20.00', 'Timestamp': 'baru'})
+
+            with patch('main.run_batch_etl', side_effect=scrape_one_card), \
+                    patch('main.REGISTRY.write_json', return_value={'summary': {'stage_seconds': {}}}):
+                main.main(['--card-cache', path, '--sinks', 'file'])
+            self.assertEqual(len(CardParseCache(path=path)), 2)
+
+if __name__ == '__main__':
+    unittest.main()
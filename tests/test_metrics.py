@@ -0,0 +1,127 @@
+import json
+import os
+import pandas as pd
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from utils.extract import fetching_fashion_content, parse_fashion_page
+from utils.load import load_to_sinks
+from utils.metrics import (BYTES_DOWNLOADED, CARDS_PARSED, FETCH_TIMER, LOAD_FAILURES, LOAD_TIMER, REGISTRY,
+                           MetricsRegistry)
+
+class FakeClock:
+    """Jam palsu yang maju sebesar `step` detik setiap kali dibaca"""
+
+    def __init__(self, step=0.5):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def setUp(self):
+        """Menyiapkan direktori keluaran sementara."""
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Menghapus direktori keluaran sementara."""
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def test_counters_and_timers_with_labels(self):
+        """Menguji counter dan timer dicatat per label dan dapat dijumlahkan tanpa label."""
+        registry = MetricsRegistry(clock=FakeClock(step=0.5))
+        registry.increment(BYTES_DOWNLOADED, 100)
+        registry.increment(BYTES_DOWNLOADED, 50)
+        with registry.timer(LOAD_TIMER, sink='csv'):
+            pass
+        registry.observe(LOAD_TIMER, 2.0, sink='postgresql')
+        with self.assertRaises(RuntimeError):
+            with registry.timer(LOAD_TIMER, sink='csv'):
+                raise RuntimeError("sink gagal")
+
+        self.assertEqual(registry.counter(BYTES_DOWNLOADED), 150)
+        self.assertEqual(registry.durations(LOAD_TIMER, sink='csv'), [0.5, 0.5])
+        self.assertEqual(sorted(registry.durations(LOAD_TIMER)), [0.5, 0.5, 2.0])
+        self.assertEqual(registry.report()['summary']['load_seconds'], {'csv': 1.0, 'postgresql': 2.0})
+
+    def test_report_summary_and_json_output(self):
+        """Menguji laporan JSON memuat latensi fetch, byte, dan kartu per detik."""
+        registry = MetricsRegistry()
+        for seconds in (0.1, 0.2, 0.3, 0.4):
+            registry.observe(FETCH_TIMER, seconds)
+        registry.observe('extract.parse', 0.5)
+        registry.increment(CARDS_PARSED, 40)
+        path = os.path.join(self.output_dir, 'report.json')
+        registry.write_json(path, mode='batch')
+
+        with open(path, encoding='utf-8') as report_file:
+            report = json.load(report_file)
+        summary = report['summary']
+        self.assertEqual(report['run'], {'mode': 'batch'})
+        self.assertEqual(summary['fetch_requests'], 4)
+        self.assertAlmostEqual(summary['fetch_latency_seconds']['mean'], 0.25)
+        self.assertEqual(summary['fetch_latency_seconds']['p50'], 0.2)
+        self.assertEqual(summary['fetch_latency_seconds']['max'], 0.4)
+        self.assertEqual(summary['cards_per_second'], 80.0)
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+    def test_prometheus_textfile_format(self):
+        """Menguji textfile Prometheus berisi counter dan summary dengan label yang di-escape."""
+        registry = MetricsRegistry()
+        registry.increment(LOAD_FAILURES, sink='google_sheets')
+        registry.observe(LOAD_TIMER, 1.5, sink='csv')
+        registry.observe(LOAD_TIMER, 0.5, sink='sink "aneh"')
+        path = os.path.join(self.output_dir, 'fashion_etl.prom')
+        registry.write_prometheus(path)
+
+        with open(path, encoding='utf-8') as textfile:
+            lines = textfile.read().splitlines()
+        self.assertIn('# TYPE fashion_etl_load_failures_total counter', lines)
+        self.assertIn('fashion_etl_load_failures_total{sink="google_sheets"} 1', lines)
+        self.assertEqual(lines.count('# TYPE fashion_etl_load_sink_seconds summary'), 1)
+        self.assertIn('fashion_etl_load_sink_seconds{sink="csv",quantile="0.5"} 1.5', lines)
+        self.assertIn('fashion_etl_load_sink_seconds_count{sink="csv"} 1', lines)
+        self.assertIn('fashion_etl_load_sink_seconds_sum{sink="sink \\"aneh\\""} 0.5', lines)
+
+class TestPipelineInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        """Mengosongkan registry bersama sebelum setiap pengujian."""
+        REGISTRY.reset()
+
+    def tearDown(self):
+        REGISTRY.reset()
+
+    def test_extract_records_fetch_bytes_and_cards(self):
+        """Menguji fetch dan parse halaman mencatat latensi, byte yang diunduh, dan jumlah kartu."""
+        content = b"<div class='product-details'><h3 class='product-title'>A</h3></div><div class='product-details'><h3>B</h3></div>"
+        session = Mock()
+        session.get.return_value = Mock(content=content, raise_for_status=Mock())
+        fetched = fetching_fashion_content('http://test.com', session=session)
+        records, _ = parse_fashion_page(fetched, engine='fast')
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual(len(REGISTRY.durations(FETCH_TIMER)), 1)
+        self.assertEqual(REGISTRY.counter(BYTES_DOWNLOADED), len(content))
+        self.assertEqual(REGISTRY.counter(CARDS_PARSED), 2)
+        self.assertIsNotNone(REGISTRY.report()['summary']['cards_per_second'])
+
+    @patch('builtins.print')
+    def test_load_records_duration_per_sink(self, mock_print):
+        """Menguji `load_to_sinks` mencatat durasi setiap sink dan menghitung sink yang gagal."""
+        df = pd.DataFrame({'Title': ['A', 'B']})
+        load_to_sinks(df, {'csv': lambda frame: True, 'postgresql': lambda frame: False})
+
+        self.assertEqual(len(REGISTRY.durations(LOAD_TIMER, sink='csv')), 1)
+        self.assertEqual(len(REGISTRY.durations(LOAD_TIMER, sink='postgresql')), 1)
+        self.assertEqual(REGISTRY.counter(LOAD_FAILURES, sink='postgresql'), 1)
+        self.assertEqual(REGISTRY.counter(LOAD_FAILURES, sink='csv'), 0)
+        self.assertEqual(REGISTRY.counter('load.rows', sink='csv'), 2)
+
+if __name__ == '__main__':
+    unittest.main()
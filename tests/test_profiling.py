@@ -0,0 +1,103 @@
+import os
+import pstats
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+import unittest
+from unittest.mock import patch
+
+from utils.profiling import StageProfiler, profiling_requested
+
+def build_payload(size):
+    """Fungsi contoh yang mengalokasikan memori agar terlihat di profil"""
+    return [str(number) * 10 for number in range(size)]
+
+class TestStageProfiler(unittest.TestCase):
+
+    def setUp(self):
+        """Menyiapkan direktori profil sementara."""
+        self.profile_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Menghapus direktori profil sementara."""
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    def test_disabled_profiler_returns_original_objects(self):
+        """Menguji profiler nonaktif tidak membungkus apa pun dan tidak membuat direktori."""
+        profile_dir = os.path.join(self.profile_dir, 'tidak-dibuat')
+        profiler = StageProfiler(profile_dir, enabled=False)
+        batches = iter([1, 2])
+        self.assertIs(profiler.wrap('load-csv', build_payload), build_payload)
+        self.assertIs(profiler.iterate('extract', batches), batches)
+        with profiler.stage('transform'):
+            build_payload(10)
+        self.assertFalse(os.path.exists(profile_dir))
+        self.assertEqual(profiler.summary(), {})
+
+    def test_stage_writes_profile_and_allocation_snapshot(self):
+        """Menguji setiap tahap menghasilkan file .prof, snapshot alokasi, dan ringkasan fungsi terpanas."""
+        profiler = StageProfiler(self.profile_dir, top_n=5)
+        with profiler.stage('transform'):
+            payload = build_payload(20000)
+
+        stats = pstats.Stats(profiler.profile_path('transform'))
+        self.assertTrue(any(function[2] == 'build_payload' for function in stats.stats))
+        with open(profiler.allocations_path('transform'), encoding='utf-8') as allocations_file:
+            allocations = allocations_file.read()
+        self.assertIn('Tahap transform, pemanggilan ke-1', allocations)
+        self.assertIn('test_profiling.py', allocations)
+
+        summary = profiler.summary()['transform']
+        self.assertEqual(summary['calls'], 1)
+        self.assertGreater(summary['peak_memory_bytes'], 0)
+        self.assertLessEqual(len(summary['hottest_functions']), 5)
+        self.assertTrue(any('build_payload' in function['function'] for function in summary['hottest_functions']))
+        self.assertFalse(tracemalloc.is_tracing())
+        del payload
+
+    def test_iterate_and_wrap_accumulate_per_stage(self):
+        """Menguji generator dan fungsi di thread lain diprofilkan dan diakumulasikan per tahap."""
+        profiler = StageProfiler(self.profile_dir)
+        batches = list(profiler.iterate('extract', (build_payload(100) for _ in range(3))))
+        self.assertEqual(len(batches), 3)
+
+        running = []
+        overlaps = []
+
+        def sink(size):
+            # Sink di thread lain tidak boleh diprofilkan bersamaan (satu cProfile aktif sejak Python 3.12)
+            running.append(size)
+            overlaps.append(len(running) > 1)
+            time.sleep(0.05)
+            build_payload(size)
+            running.remove(size)
+
+        sinks = [profiler.wrap('load-csv', sink), profiler.wrap('load-parquet', sink)]
+        threads = [threading.Thread(target=wrapped, args=(1000 + index,)) for index, wrapped in enumerate(sinks * 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(overlaps, [False] * 4)
+
+        summary = profiler.summary()
+        # Tiga batch ditambah satu pemanggilan `next` terakhir yang mengakhiri generator
+        self.assertEqual(summary['extract']['calls'], 4)
+        self.assertEqual(summary['load-csv']['calls'], 2)
+        self.assertEqual(summary['load-parquet']['calls'], 2)
+        self.assertTrue(os.path.exists(profiler.profile_path('load-csv')))
+        with patch('builtins.print') as mock_print:
+            profiler.print_summary()
+        self.assertIn('Ringkasan profiling per tahap', str(mock_print.call_args_list[0]))
+
+    def test_profiling_requested_from_environment(self):
+        """Menguji mode profiling dapat diaktifkan lewat variabel lingkungan."""
+        self.assertTrue(profiling_requested({'FASHION_ETL_PROFILE': '1'}))
+        self.assertTrue(profiling_requested({'FASHION_ETL_PROFILE': 'true'}))
+        self.assertFalse(profiling_requested({'FASHION_ETL_PROFILE': '0'}))
+        self.assertFalse(profiling_requested({}))
+
+if __name__ == '__main__':
+    unittest.main()
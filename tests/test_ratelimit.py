@@ -0,0 +1,130 @@
+import requests
+import unittest
+from requests.adapters import HTTPAdapter
+from unittest.mock import patch
+
+from http_fakes import make_response
+from utils.extract import create_session, fetching_fashion_content
+from utils.ratelimit import RetryPolicy, ThrottledHTTPAdapter, TokenBucketRateLimiter
+
+class FakeClock:
+    """Jam palsu yang maju hanya ketika `sleep` dipanggil"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+class TestTokenBucketRateLimiter(unittest.TestCase):
+
+    def test_acquire_respects_rate_after_burst(self):
+        """Menguji token bucket mengizinkan burst lalu menahan permintaan sesuai laju."""
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+        for _ in range(4):
+            limiter.acquire()
+        # Dua permintaan pertama memakai burst, dua berikutnya menunggu 0.5 detik per token
+        self.assertAlmostEqual(clock.now, 1.0)
+
+    def test_adaptive_rate_on_throttle_and_success(self):
+        """Menguji laju dipotong setengah saat dibatasi server dan naik perlahan saat berhasil."""
+        limiter = TokenBucketRateLimiter(rate=4.0, min_rate=1.0, max_rate=4.2, increase_step=0.1)
+        limiter.on_throttle()
+        self.assertEqual(limiter.rate, 2.0)
+        limiter.on_throttle()
+        limiter.on_throttle()
+        self.assertEqual(limiter.rate, 1.0)
+        for _ in range(50):
+            limiter.on_success()
+        self.assertAlmostEqual(limiter.rate, 4.2)
+
+    def test_pause_holds_every_caller_until_it_ends(self):
+        """Menguji jeda Retry-After menahan permintaan berikutnya dari thread mana pun tanpa burst setelahnya."""
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+        limiter.pause(120)
+        limiter.acquire()
+        self.assertAlmostEqual(clock.now, 120.5)
+        limiter.acquire()
+        self.assertAlmostEqual(clock.now, 121.0)
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_backoff_exponential_with_cap(self):
+        """Menguji backoff eksponensial tanpa jitter dibatasi max_backoff."""
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3.0, jitter=False)
+        self.assertEqual([policy.backoff(attempt) for attempt in range(1, 5)], [0.5, 1.0, 2.0, 3.0])
+
+    def test_backoff_jitter_and_retry_after(self):
+        """Menguji jitter berada dalam rentang backoff dan Retry-After menjadi waktu tunggu minimum."""
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=30.0, jitter=True)
+        for _ in range(20):
+            self.assertTrue(0 <= policy.backoff(3) <= 4.0)
+        self.assertGreaterEqual(policy.backoff(1, retry_after='7'), 7.0)
+        # Retry-After tidak dipotong max_backoff
+        self.assertEqual(policy.backoff(1, retry_after='120'), 120.0)
+        self.assertEqual(RetryPolicy.parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0.0)
+        self.assertIsNone(RetryPolicy.parse_retry_after('bukan tanggal'))
+
+class TestThrottledHTTPAdapter(unittest.TestCase):
+
+    @patch('builtins.print')
+    def test_retries_transient_errors_then_succeeds(self, mock_print):
+        """Menguji permintaan diulang saat 503/429 dan koneksi terputus, lalu berhasil."""
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=10.0, clock=clock, sleep=clock.sleep)
+        session = create_session(rate_limiter=limiter, retry_policy=RetryPolicy(max_retries=3, jitter=False))
+        session.get_adapter('http://test.com').sleep = clock.sleep
+        responses = iter([
+            lambda request: make_response(request, status_code=503),
+            lambda request: (_ for _ in ()).throw(requests.exceptions.ConnectionError("putus")),
+            lambda request: make_response(request, status_code=429, headers={'Retry-After': '5'}),
+            lambda request: make_response(request, body=b"<html>ok</html>"),
+        ])
+        with patch.object(HTTPAdapter, 'send', side_effect=lambda request, **kwargs: next(responses)(request)) as mock_send:
+            result = fetching_fashion_content('http://test.com/page2', session=session)
+        self.assertEqual(result, b"<html>ok</html>")
+        self.assertEqual(mock_send.call_count, 4)
+        self.assertIn(5.0, clock.sleeps)
+        self.assertLess(limiter.rate, 10.0)
+
+    @patch('builtins.print')
+    def test_gives_up_after_max_retries(self, mock_print):
+        """Menguji respons terakhir dikembalikan setelah batas percobaan habis."""
+        adapter = ThrottledHTTPAdapter(retry_policy=RetryPolicy(max_retries=2, jitter=False), sleep=lambda seconds: None)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        with patch.object(HTTPAdapter, 'send', side_effect=lambda request, **kwargs: make_response(request, status_code=500)) as mock_send:
+            self.assertIsNone(fetching_fashion_content('http://test.com/', session=session))
+        self.assertEqual(mock_send.call_count, 3)
+
+    @patch('builtins.print')
+    def test_long_retry_after_pauses_limiter_or_gives_up(self, mock_print):
+        """Menguji Retry-After menjeda rate limiter bersama, dan Retry-After di atas batas tidak diulang."""
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=10.0, clock=clock, sleep=clock.sleep)
+        adapter = ThrottledHTTPAdapter(rate_limiter=limiter, retry_policy=RetryPolicy(max_retries=2, jitter=False, max_retry_after=200),
+                                       sleep=clock.sleep)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        responses = iter([make_response_for(429, {'Retry-After': '120'}), make_response_for(200)])
+        with patch.object(HTTPAdapter, 'send', side_effect=lambda request, **kwargs: next(responses)(request)):
+            self.assertEqual(fetching_fashion_content('http://test.com/page2', session=session), b"<html>ok</html>")
+        self.assertIn(120.0, clock.sleeps)
+        self.assertGreaterEqual(limiter.paused_until, 120.0)
+
+        with patch.object(HTTPAdapter, 'send', side_effect=lambda request, **kwargs: make_response_for(429, {'Retry-After': '3600'})(request)) as mock_send:
+            self.assertIsNone(fetching_fashion_content('http://test.com/page3', session=session))
+        self.assertEqual(mock_send.call_count, 1)
+
+def make_response_for(status_code, headers=None):
+    return lambda request: make_response(request, status_code=status_code, body=b"<html>ok</html>", headers=headers)
+
+if __name__ == '__main__':
+    unittest.main()
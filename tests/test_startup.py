@@ -0,0 +1,98 @@
+import os
+import pandas as pd
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Batas waktu impor modul ETL (detik). Permintaan jaringan saat impor akan melampaui batas ini
+# ketika situs lambat atau tidak dapat dijangkau.
+IMPORT_BUDGET_SECONDS = 5.0
+
+class TestStartupTime(unittest.TestCase):
+
+    def test_import_extract_has_no_network_side_effect(self):
+        """Menguji impor `utils.extract` tidak melakukan permintaan jaringan apa pun."""
+        original_module = sys.modules.pop('utils.extract', None)
+        try:
+            with patch('requests.get') as mock_get, patch('requests.Session.get') as mock_session_get:
+                import utils.extract
+            mock_get.assert_not_called()
+            mock_session_get.assert_not_called()
+            self.assertFalse(hasattr(utils.extract, 'all_content_global'))
+        finally:
+            # Kembalikan modul asli agar patch di berkas uji lain tetap mengenai fungsi yang sama
+            if original_module is not None:
+                sys.modules['utils.extract'] = original_module
+                sys.modules['utils'].extract = original_module
+
+    def test_import_etl_modules_within_budget(self):
+        """Menguji impor extract, transform, dan load dalam proses baru tetap di bawah batas waktu."""
+        code = (
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "import utils.extract, utils.transform, utils.load\n"
+            "print(time.perf_counter() - start)\n"
+        )
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60)
+        wall_time = time.perf_counter() - start
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+
+        import_time = float(completed.stdout.strip().splitlines()[-1])
+        self.assertLess(import_time, IMPORT_BUDGET_SECONDS, f"Impor modul ETL memakan waktu {import_time:.2f} detik")
+        self.assertLess(wall_time, IMPORT_BUDGET_SECONDS * 2)
+
+    def test_csv_only_cold_start_skips_heavy_clients(self):
+        """Menguji run CSV saja dari proses baru selesai di bawah batas waktu tanpa mengimpor SQLAlchemy,
+        klien Google API, maupun modul scraping, dan sink postgresql dilewati jika DSN tidak diberikan."""
+        with tempfile.TemporaryDirectory() as work_dir:
+            pd.DataFrame({
+                'Title': ['T-shirt 1', 'Unknown Product'], 'Price': ['$10.00', '$5.00'], 'Rating': ['4.0', 'N/A'],
+                'Colors': ['3', '1'], 'Size': ['M', 'L'], 'Gender': ['Men', 'Women'],
+                'Timestamp': ['2024-01-01 00:00:00', '2024-01-01 00:00:00']
+            }).to_csv(os.path.join(work_dir, 'history.csv'), index=False)
+            code = (
+                "import sys, time\n"
+                "start = time.perf_counter()\n"
+                "import main\n"
+                "main.main(['--reprocess', 'history.csv', '--sinks', 'file,postgresql', '--metrics-report', 'report.json'])\n"
+                "elapsed = time.perf_counter() - start\n"
+                "heavy = [name for name in ('sqlalchemy', 'googleapiclient', 'google.oauth2', 'bs4', 'utils.extract') if name in sys.modules]\n"
+                "print(elapsed)\n"
+                "print('modul berat:', ','.join(heavy))\n"
+            )
+            environment = {key: value for key, value in os.environ.items() if key != 'FASHION_ETL_DB_URL'}
+            environment['PYTHONPATH'] = PROJECT_ROOT
+            completed = subprocess.run([sys.executable, '-c', code], cwd=work_dir, env=environment,
+                                       capture_output=True, text=True, timeout=60)
+            self.assertEqual(completed.returncode, 0, completed.stderr)
+            # Tidak ada lagi cetakan debug sys.path saat startup
+            self.assertNotIn('sys.path', completed.stdout)
+            self.assertIn('sink postgresql dilewati', completed.stdout)
+
+            elapsed, heavy = completed.stdout.strip().splitlines()[-2:]
+            self.assertEqual(heavy, 'modul berat:')
+            self.assertLess(float(elapsed), IMPORT_BUDGET_SECONDS, f"Run CSV saja memakan waktu {float(elapsed):.2f} detik")
+            self.assertEqual(len(pd.read_csv(os.path.join(work_dir, 'products.csv'))), 1)
+
+    def test_cli_help_and_stage_validation(self):
+        """Menguji --help berjalan di bawah batas waktu dan tahap extract tidak dapat dilewati tanpa --reprocess."""
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, 'main.py', '--help'], cwd=PROJECT_ROOT,
+                                   capture_output=True, text=True, timeout=60)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertLess(time.perf_counter() - start, IMPORT_BUDGET_SECONDS)
+        self.assertIn('--db-url', completed.stdout)
+
+        completed = subprocess.run([sys.executable, 'main.py', '--stages', 'transform,load'], cwd=PROJECT_ROOT,
+                                   capture_output=True, text=True, timeout=60)
+        self.assertNotEqual(completed.returncode, 0)
+        self.assertIn('--reprocess', completed.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,7 +10,8 @@ from unittest.mock import patch, Mock
 if 'utils.transform' in sys.modules:
     del sys.modules['utils.transform']
 try:
-    from utils.transform import transform_data, convert_dollar_to_rupiah
+    from utils.transform import (RowFingerprintSet, compare_memory_usage, convert_dollar_to_rupiah, enforce_schema,
+                                 read_in_chunks, transform_data, transform_in_chunks)
 except ImportError as e:
     print(f"Error: Gagal mengimpor fungsi transform dari utils.transform, pastikan transform.py tersedia dan berada di PYTHONPATH. Error: {e}")
 
@@ -221,4 +222,174 @@ class TestTransformFunctions(unittest.TestCase):
         })
         transformed_df_extra = transform_data(df_with_extra.copy())
         converted_df_extra = convert_dollar_to_rupiah(transformed_df_extra.copy())
-        self.assertEqual(list(converted_df_extra.columns), ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender', 'ExtraCol', 'Timestamp'])
\ No newline at end of file
+        self.assertEqual(list(converted_df_extra.columns), ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender', 'ExtraCol', 'Timestamp'])
+
+class TestTransformSchemaFunctions(unittest.TestCase):
+
+    def setUp(self):
+        """Buat sampel DataFrame hasil scraping untuk menguji skema ringkas."""
+        self.df = pd.DataFrame({
+            'Title': ['T-shirt 1', 'Hoodie 3', 'Pants 4', 'Outerwear 5'],
+            'Price': ['$100.00', '$496.88', '$467.31', '$321.59'],
+            'Rating': ['3.9', '4.8', '3.3', 'N/A'],
+            'Colors': ['3', '3', '5', 'N/A'],
+            'Size': ['M', 'L', 'M', 'XXL'],
+            'Gender': ['Women', 'Unisex', 'Men', 'N/A'],
+            'Timestamp': ['2023-01-01 12:00:00', '2023-01-01 12:00:01', '2023-01-01 12:00:02', '2023-01-01 12:00:03']
+        })
+
+    def test_compact_schema_dtypes(self):
+        """Menguji transform_data(compact=True) menghasilkan kategori, float32, int8, dan datetime64."""
+        compact_df = convert_dollar_to_rupiah(transform_data(self.df.copy(), compact=True))
+
+        self.assertIsInstance(compact_df['Size'].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(compact_df['Gender'].dtype, pd.CategoricalDtype)
+        self.assertEqual(compact_df['Rating'].dtype, np.float32)
+        self.assertEqual(compact_df['Colors'].dtype, np.int8)
+        self.assertTrue(pd.api.types.is_datetime64_dtype(compact_df['Timestamp']))
+        self.assertEqual(compact_df['Price'].dtype, np.float64)
+        self.assertEqual(compact_df.loc[compact_df['Title'] == 'T-shirt 1', 'Price'].iloc[0], 1600000.0)
+        self.assertEqual(compact_df.loc[compact_df['Title'] == 'Outerwear 5', 'Gender'].iloc[0], 'Unisex')
+
+        # Nilai sama dengan mode bawaan, hanya tipe datanya yang berbeda
+        default_df = convert_dollar_to_rupiah(transform_data(self.df.copy()))
+        self.assertEqual(compact_df['Size'].astype(str).tolist(), default_df['Size'].tolist())
+        np.testing.assert_allclose(compact_df['Rating'].astype(float), default_df['Rating'], rtol=1e-6)
+
+    def test_enforce_schema_colors_out_of_int8_range(self):
+        """Menguji Colors yang melebihi rentang int8 tidak meluap."""
+        df = pd.DataFrame({'Colors': [1, 300]})
+        self.assertEqual(enforce_schema(df)['Colors'].tolist(), [1, 300])
+
+    def test_compare_memory_usage_reports_savings(self):
+        """Menguji laporan memori menunjukkan penghematan pada data berulang."""
+        df = convert_dollar_to_rupiah(transform_data(pd.concat([self.df] * 500, ignore_index=True)))
+        df = pd.concat([df] * 50, ignore_index=True)
+        report = compare_memory_usage(df, enforce_schema(df.copy()))
+        self.assertIn('Total', report.index)
+        self.assertLess(report.loc['Total', 'after'], report.loc['Total', 'before'] / 2)
+        self.assertGreater(report.loc['Size', 'saved_pct'], 80)
+
+
+class TestTransformInplaceFunctions(unittest.TestCase):
+
+    def setUp(self):
+        """Buat sampel DataFrame hasil scraping, termasuk nilai tidak valid dan duplikat."""
+        self.df = pd.DataFrame({
+            'Title': ['T-shirt 1', 'Unknown Product', 'Hoodie 3', 'Pants 4', 'Shirt 6', 'T-shirt 1', 'Jacket 7'],
+            'Price': ['$100.00', '$0.00', '$496.88', '467.31', 'Invalid Price', '$100.00', None],
+            'Rating': ['3.9', 'N/A', '4.8', '3.3', 'N/A', '3.9', '4.1'],
+            'Colors': ['3', '0', '3', 'N/A', '2', '3', '1'],
+            'Size': ['M', 'N/A', 'L', 'XL', 'S', 'M', 'M'],
+            'Gender': ['Women', 'N/A', None, 'Men', 'Unisex', 'Women', 'Men'],
+            'Timestamp': ['2023-01-01 12:00:00'] * 7
+        })
+
+    def test_inplace_matches_default_transform(self):
+        """Menguji mode inplace menghasilkan DataFrame yang sama dengan mode bawaan."""
+        for df in (self.df, self.df.drop(columns=['Gender']), self.df.rename(columns={'Price': 'Rupiah'})):
+            expected = convert_dollar_to_rupiah(transform_data(df.copy()))
+            actual = convert_dollar_to_rupiah(transform_data(df.copy(), inplace=True), inplace=True)
+            pd.testing.assert_frame_equal(expected, actual)
+
+        compact_expected = transform_data(self.df.copy(), compact=True)
+        compact_actual = transform_data(self.df.copy(), compact=True, inplace=True)
+        pd.testing.assert_frame_equal(compact_expected, compact_actual)
+
+    def test_inplace_does_not_copy_input(self):
+        """Menguji mode inplace mengubah kolom DataFrame input alih-alih menyalinnya."""
+        df = self.df.copy()
+        transform_data(df, inplace=True)
+        self.assertTrue(pd.api.types.is_float_dtype(df['Price']))
+        self.assertTrue(pd.api.types.is_integer_dtype(df['Colors']))
+
+    def test_inplace_peak_memory_on_one_million_rows(self):
+        """Menguji memori puncak (tracemalloc) mode inplace lebih rendah daripada mode bawaan pada 1 juta baris."""
+        import tracemalloc
+
+        def make_frame(rows):
+            index = np.arange(rows)
+            return pd.DataFrame({
+                'Title': np.array(['T-shirt', 'Hoodie', 'Pants', 'Jacket', 'Unknown Product'], dtype=object)[index % 5],
+                'Rupiah': (index % 500 + 0.99) * 16000,
+                'Rating': (index % 50) / 10,
+                'Colors': index % 5 + 1,
+                'Size': np.array(['S', 'M', 'L', 'XL', 'XXL'], dtype=object)[index % 5],
+                'Gender': np.array(['Men', 'Women', 'Unisex'], dtype=object)[index % 3],
+                'Timestamp': index
+            })
+
+        def peak_memory(inplace):
+            df = make_frame(1_000_000)
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            result = convert_dollar_to_rupiah(transform_data(df, inplace=inplace), inplace=inplace)
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            tracemalloc.stop()
+            return peak, result
+
+        default_peak, default_result = peak_memory(False)
+        inplace_peak, inplace_result = peak_memory(True)
+        pd.testing.assert_frame_equal(default_result, inplace_result)
+        self.assertLess(inplace_peak, default_peak * 0.8)
+
+
+class TestTransformChunkedFunctions(unittest.TestCase):
+
+    def setUp(self):
+        """Buat file riwayat scraping sementara dengan duplikat yang tersebar di beberapa chunk."""
+        import tempfile
+        self.history_dir = tempfile.mkdtemp()
+        rows = []
+        for run in range(3):
+            rows += [
+                ['T-shirt 1', '$100.00', '3.9', '3', 'M', 'Women', '2023-01-01 12:00:00'],
+                ['Hoodie 3', '$496.88', '4.8', '3', 'L', 'N/A', '2023-01-01 12:00:00'],
+                ['Unknown Product', '$0.00', 'N/A', '0', 'N/A', 'N/A', '2023-01-01 12:00:00'],
+                [f'Pants {run}', '$467.31', 'N/A', '', 'XL', 'Men', f'2023-01-0{run + 1} 12:00:00'],
+            ]
+        self.history = pd.DataFrame(rows, columns=['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender', 'Timestamp'])
+
+    def tearDown(self):
+        """Menghapus direktori sementara."""
+        import shutil
+        shutil.rmtree(self.history_dir, ignore_errors=True)
+
+    def expected_result(self):
+        """Hasil transform satu kali pada seluruh riwayat di memori"""
+        return convert_dollar_to_rupiah(transform_data(self.history.copy())).reset_index(drop=True)
+
+    def test_csv_chunks_match_in_memory_transform(self):
+        """Menguji transform per chunk CSV menghasilkan baris yang sama dengan transform di memori, termasuk dedup lintas chunk."""
+        import os
+        path = os.path.join(self.history_dir, 'history.csv')
+        self.history.to_csv(path, index=False)
+
+        chunks = list(transform_in_chunks(read_in_chunks(path, chunksize=3)))
+        self.assertGreater(len(chunks), 1)
+        result = pd.concat(chunks).reset_index(drop=True)
+        pd.testing.assert_frame_equal(self.expected_result(), result)
+
+    def test_parquet_chunks_match_in_memory_transform(self):
+        """Menguji transform per chunk dari file Parquet."""
+        import os
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest("pyarrow tidak terinstal")
+        path = os.path.join(self.history_dir, 'history.parquet')
+        self.history.to_parquet(path, index=False)
+
+        result = pd.concat(transform_in_chunks(read_in_chunks(path, chunksize=5))).reset_index(drop=True)
+        pd.testing.assert_frame_equal(self.expected_result(), result)
+
+    def test_row_fingerprint_set_across_many_batches(self):
+        """Menguji himpunan fingerprint hanya menandai kemunculan pertama di seluruh batch."""
+        fingerprints = RowFingerprintSet()
+        self.assertEqual(fingerprints.add_new([5, 7, 5]).tolist(), [True, True, False])
+        self.assertEqual(fingerprints.add_new([7, 9]).tolist(), [False, True])
+        for start in range(0, 1000, 100):
+            fingerprints.add_new(np.arange(start, start + 150))
+        self.assertEqual(len(fingerprints), 1050)
+        self.assertFalse(fingerprints.add_new(np.arange(1050)).any())
+        self.assertLessEqual(len(fingerprints.runs), 11)
@@ -0,0 +1,217 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.models import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+from utils.defaults import DEFAULT_PAGE_CACHE_DIR, DEFAULT_PAGE_CACHE_TTL
+from utils.ratelimit import ThrottledHTTPAdapter
+
+DEFAULT_CACHE_DIR = DEFAULT_PAGE_CACHE_DIR
+DEFAULT_TTL = DEFAULT_PAGE_CACHE_TTL
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+class PageCache:
+    """Cache halaman di disk per URL yang menyimpan body, ETag, dan Last-Modified.
+    Entri yang masih dalam `ttl` (detik) disajikan langsung dari disk, entri yang kedaluwarsa
+    divalidasi ulang dengan conditional request. Total ukuran body dibatasi `max_bytes`,
+    entri yang paling lama tidak diakses dihapus lebih dulu. Dengan `offline=True`,
+    seluruh halaman disajikan dari disk tanpa akses jaringan."""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES, offline=False):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        # Indeks di memori: key -> (ukuran body, waktu akses terakhir)
+        self._index = {}
+        for filename in os.listdir(directory):
+            if filename.endswith('.json'):
+                meta = self._read_meta(filename[:-len('.json')])
+                if meta is not None:
+                    self._index[filename[:-len('.json')]] = (meta['size'], meta['accessed_at'])
+
+    @staticmethod
+    def key_for(url):
+        """Nama file cache untuk sebuah URL. URL dinormalisasi seperti oleh requests ('http://a.com' menjadi
+        'http://a.com/') agar adapter dan hasil parsing tersimpan memakai entri yang sama."""
+        request = PreparedRequest()
+        request.prepare_url(url, None)
+        return hashlib.sha256(request.url.encode()).hexdigest()
+
+    def _meta_path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _body_path(self, key):
+        return os.path.join(self.directory, f"{key}.html")
+
+    def _read_meta(self, key):
+        try:
+            with open(self._meta_path(key), encoding='utf-8') as meta_file:
+                return json.load(meta_file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, key, meta):
+        temp_path = f"{self._meta_path(key)}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as meta_file:
+            json.dump(meta, meta_file)
+        os.replace(temp_path, self._meta_path(key))
+
+    def lookup(self, url):
+        """Mengembalikan metadata entri untuk `url`, atau None jika belum tersimpan"""
+        with self._lock:
+            return self._read_meta(self.key_for(url))
+
+    def is_fresh(self, meta):
+        """Entri masih segar jika umurnya belum melewati TTL"""
+        return time.time() - meta['stored_at'] < self.ttl
+
+    def read_body(self, url):
+        """Membaca body halaman dari disk dan memperbarui waktu akses terakhir"""
+        key = self.key_for(url)
+        with self._lock:
+            meta = self._read_meta(key)
+            if meta is None:
+                return None
+            try:
+                with open(self._body_path(key), 'rb') as body_file:
+                    body = body_file.read()
+            except OSError:
+                return None
+            meta['accessed_at'] = time.time()
+            self._write_meta(key, meta)
+            self._index[key] = (meta['size'], meta['accessed_at'])
+            return body
+
+    @staticmethod
+    def conditional_headers(meta):
+        """Header conditional request berdasarkan validator yang tersimpan"""
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url, body, etag=None, last_modified=None):
+        """Menyimpan body beserta validatornya, lalu menjalankan eviction jika melewati batas ukuran.
+        Hasil parsing tersimpan tetap dipakai jika body sama, misalnya dari server tanpa dukungan ETag."""
+        key = self.key_for(url)
+        now = time.time()
+        digest = hashlib.sha1(body).hexdigest()
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': now,
+            'accessed_at': now,
+            'size': len(body),
+            'digest': digest,
+            'parsed': {}
+        }
+        with self._lock:
+            previous = self._read_meta(key)
+            if previous is not None and previous['digest'] == digest:
+                meta['parsed'] = previous['parsed']
+            temp_path = f"{self._body_path(key)}.tmp"
+            with open(temp_path, 'wb') as body_file:
+                body_file.write(body)
+            os.replace(temp_path, self._body_path(key))
+            self._write_meta(key, meta)
+            self._index[key] = (meta['size'], now)
+            self._evict()
+
+    def touch(self, url):
+        """Menandai entri sebagai segar kembali setelah server membalas 304 Not Modified"""
+        key = self.key_for(url)
+        with self._lock:
+            meta = self._read_meta(key)
+            if meta is None:
+                return
+            meta['stored_at'] = meta['accessed_at'] = time.time()
+            self._write_meta(key, meta)
+            self._index[key] = (meta['size'], meta['accessed_at'])
+
+    def load_parsed(self, url, content, engine):
+        """Mengembalikan hasil parsing tersimpan (records, has_next_page) jika body halaman tidak berubah"""
+        with self._lock:
+            meta = self._read_meta(self.key_for(url))
+        if meta is None or meta['digest'] != hashlib.sha1(content).hexdigest():
+            return None
+        parsed = meta['parsed'].get(engine)
+        if parsed is None:
+            return None
+        return parsed['records'], parsed['has_next_page']
+
+    def store_parsed(self, url, content, engine, records, has_next_page):
+        """Menyimpan hasil parsing halaman agar halaman yang tidak berubah tidak perlu diurai ulang"""
+        key = self.key_for(url)
+        with self._lock:
+            meta = self._read_meta(key)
+            if meta is None or meta['digest'] != hashlib.sha1(content).hexdigest():
+                return
+            meta['parsed'][engine] = {'records': records, 'has_next_page': has_next_page}
+            self._write_meta(key, meta)
+
+    def _evict(self):
+        total_size = sum(size for size, _ in self._index.values())
+        for key, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if total_size <= self.max_bytes:
+                break
+            for path in (self._meta_path(key), self._body_path(key)):
+                if os.path.exists(path):
+                    os.remove(path)
+            del self._index[key]
+            total_size -= size
+
+    def total_size(self):
+        """Total ukuran body yang tersimpan di cache (byte)"""
+        with self._lock:
+            return sum(size for size, _ in self._index.values())
+
+class CachingHTTPAdapter(ThrottledHTTPAdapter):
+    """HTTPAdapter yang melayani permintaan GET melalui `PageCache`. Hanya permintaan yang benar-benar
+    dikirim ke jaringan yang dikenai rate limit dan retry dari `ThrottledHTTPAdapter`."""
+
+    def __init__(self, cache, **kwargs):
+        self.cache = cache
+        super().__init__(**kwargs)
+
+    def _cached_response(self, request, body, cache_status):
+        response = Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response._content = body
+        response.headers = CaseInsensitiveDict({'X-Cache': cache_status})
+        response.url = request.url
+        response.request = request
+        return response
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+        meta = self.cache.lookup(request.url)
+        if meta is not None and (self.cache.offline or self.cache.is_fresh(meta)):
+            body = self.cache.read_body(request.url)
+            if body is not None:
+                return self._cached_response(request, body, 'HIT')
+        if self.cache.offline:
+            raise RequestsConnectionError(f"Mode offline: {request.url} tidak tersedia di cache", request=request)
+
+        if meta is not None:
+            request.headers.update(PageCache.conditional_headers(meta))
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and meta is not None:
+            body = self.cache.read_body(request.url)
+            if body is not None:
+                self.cache.touch(request.url)
+                return self._cached_response(request, body, 'REVALIDATED')
+        if response.status_code == 200:
+            self.cache.store(request.url, response.content, etag=response.headers.get('ETag'),
+                             last_modified=response.headers.get('Last-Modified'))
+        return response
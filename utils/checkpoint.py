@@ -0,0 +1,137 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+DEFAULT_CHECKPOINT_FILE = 'scrape_checkpoint.db'
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+# Status run yang tersimpan di tabel runs
+STATUS_RUNNING = 'running'
+STATUS_FAILED = 'failed'
+STATUS_COMPLETED = 'completed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_key TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    failed_page INTEGER,
+    last_error TEXT
+);
+CREATE TABLE IF NOT EXISTS pages (
+    run_key TEXT NOT NULL,
+    page_number INTEGER NOT NULL,
+    records TEXT NOT NULL,
+    has_next_page INTEGER NOT NULL,
+    completed_at TEXT NOT NULL,
+    PRIMARY KEY (run_key, page_number)
+);
+"""
+
+class ScrapeIncompleteError(RuntimeError):
+    """Scraping berhenti sebelum halaman terakhir (gagal fetch atau parsing) saat checkpoint dipakai.
+    Halaman yang sudah selesai tetap tersimpan di checkpoint dan dapat dilanjutkan dengan mode resume."""
+
+    def __init__(self, page_number, reason):
+        super().__init__(f"Scraping berhenti di halaman {page_number}: {reason}")
+        self.page_number = page_number
+        self.reason = reason
+
+def _now():
+    return datetime.now().strftime(TIMESTAMP_FORMAT)
+
+class ScrapeCheckpoint:
+    """Checkpoint scraping di file SQLite: setiap halaman yang selesai disimpan beserta hasil parsingnya
+    dalam transaksi sendiri, sehingga run yang gagal di tengah jalan dapat dilanjutkan dari halaman terakhir
+    yang berhasil. Setiap situs (URL dasar dan pola paginasi) memiliki run sendiri.
+    Dengan `resume=False`, halaman milik run sebelumnya dihapus dan scraping dimulai dari halaman 1;
+    dengan `resume=True`, run yang belum selesai dilanjutkan, sedangkan run yang sudah selesai dimulai ulang."""
+
+    def __init__(self, path=DEFAULT_CHECKPOINT_FILE, resume=False):
+        self.path = path
+        self.resume = resume
+        # Jumlah halaman yang diambil dari checkpoint pada pemanggilan `begin` terakhir
+        self.resumed_pages = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        # WAL dan synchronous=NORMAL: commit per halaman tetap tahan crash proses tanpa fsync setiap transaksi
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(SCHEMA)
+
+    @staticmethod
+    def run_key(base_site_url, pagination_path_pattern):
+        """Identitas run untuk sebuah situs"""
+        return f"{base_site_url}|{pagination_path_pattern}"
+
+    def begin(self, run_key):
+        """Memulai atau melanjutkan run `run_key` dan mengembalikan halaman yang sudah selesai
+        sebagai list (nomor halaman, records, has_next_page) terurut menurut nomor halaman"""
+        with self._lock, self._connection:
+            row = self._connection.execute('SELECT status FROM runs WHERE run_key = ?', (run_key,)).fetchone()
+            if not self.resume or row is None or row[0] == STATUS_COMPLETED:
+                self._connection.execute('DELETE FROM pages WHERE run_key = ?', (run_key,))
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO runs (run_key, status, started_at, updated_at) VALUES (?, ?, ?, ?)',
+                    (run_key, STATUS_RUNNING, _now(), _now()))
+                pages = []
+            else:
+                self._connection.execute(
+                    'UPDATE runs SET status = ?, updated_at = ?, failed_page = NULL, last_error = NULL WHERE run_key = ?',
+                    (STATUS_RUNNING, _now(), run_key))
+                pages = self._completed_pages(run_key)
+        self.resumed_pages = len(pages)
+        return pages
+
+    def _completed_pages(self, run_key):
+        # Hanya awalan halaman yang berurutan yang dipakai, halaman setelah celah akan di-scrape ulang
+        pages = []
+        rows = self._connection.execute(
+            'SELECT page_number, records, has_next_page FROM pages WHERE run_key = ? ORDER BY page_number', (run_key,))
+        for page_number, records, has_next_page in rows:
+            if page_number != len(pages) + 1:
+                break
+            pages.append((page_number, json.loads(records), bool(has_next_page)))
+        return pages
+
+    def record_page(self, run_key, page_number, records, has_next_page):
+        """Menyimpan hasil parsing halaman yang selesai dalam transaksi sendiri"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO pages (run_key, page_number, records, has_next_page, completed_at) VALUES (?, ?, ?, ?, ?)',
+                (run_key, page_number, json.dumps(records), int(bool(has_next_page)), _now()))
+            self._connection.execute('UPDATE runs SET updated_at = ? WHERE run_key = ?', (_now(), run_key))
+
+    def mark_failed(self, run_key, page_number, error):
+        """Menandai run gagal di `page_number` agar dapat dilanjutkan dengan mode resume"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                'UPDATE runs SET status = ?, updated_at = ?, failed_page = ?, last_error = ? WHERE run_key = ?',
+                (STATUS_FAILED, _now(), page_number, str(error), run_key))
+
+    def mark_completed(self, run_key):
+        """Menandai seluruh halaman run sudah selesai di-scrape"""
+        with self._lock, self._connection:
+            self._connection.execute('UPDATE runs SET status = ?, updated_at = ? WHERE run_key = ?',
+                                     (STATUS_COMPLETED, _now(), run_key))
+
+    def status(self, run_key):
+        """Status run beserta jumlah halaman tersimpan, atau None jika run belum pernah dimulai"""
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT status, started_at, updated_at, failed_page, last_error FROM runs WHERE run_key = ?', (run_key,)).fetchone()
+            if row is None:
+                return None
+            page_count = self._connection.execute('SELECT COUNT(*) FROM pages WHERE run_key = ?', (run_key,)).fetchone()[0]
+        status, started_at, updated_at, failed_page, last_error = row
+        return {'status': status, 'started_at': started_at, 'updated_at': updated_at, 'failed_page': failed_page,
+                'last_error': last_error, 'pages': page_count}
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,116 @@
+import json
+import os
+import re
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    # Operasi .str pada string Arrow dijalankan oleh kernel C++ tanpa loop Python per baris
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = object
+
+DEFAULT_RATES_FILE = 'exchange_rates.json'
+DEFAULT_CURRENCY = 'USD'
+# Kurs ke rupiah (IDR per 1 unit mata uang); mata uang lain ditambahkan lewat file JSON kurs
+DEFAULT_EXCHANGE_RATES = {'USD': 16000.0, 'IDR': 1.0}
+# Simbol atau kode yang dikenali di depan/belakang angka beserta kode ISO 4217-nya
+CURRENCY_ALIASES = {
+    'US$': 'USD', '$': 'USD', 'USD': 'USD',
+    'Rp.': 'IDR', 'Rp': 'IDR', 'IDR': 'IDR',
+    '€': 'EUR', 'EUR': 'EUR',
+    '£': 'GBP', 'GBP': 'GBP',
+    '¥': 'JPY', 'JPY': 'JPY',
+    'S$': 'SGD', 'SGD': 'SGD',
+    'RM': 'MYR', 'MYR': 'MYR',
+}
+_SYMBOLS = '|'.join(re.escape(symbol) for symbol in sorted(CURRENCY_ALIASES, key=len, reverse=True))
+# Harga valid: simbol/kode opsional di depan atau belakang angka; flag inline agar juga dapat dijalankan oleh RE2 (Arrow)
+PRICE_PATTERN = rf"(?i)^\s*(?:{_SYMBOLS}|[a-z]{{3}})?\s*[-+]?\d[\d.,'\s]*?\s*(?:{_SYMBOLS}|[a-z]{{3}})?\s*$"
+NUMBER_CHARACTERS = r"[-+\d.,'\s]+"
+_ALIASES_LOWER = {symbol.lower(): code for symbol, code in CURRENCY_ALIASES.items()}
+
+def load_exchange_rates(path=DEFAULT_RATES_FILE, base_rates=DEFAULT_EXCHANGE_RATES):
+    """Memuat kurs ke rupiah dari file JSON ({"USD": 16000, "EUR": 17500, ...}) dan menggabungkannya
+    dengan `base_rates`. Jika file tidak ada atau rusak, kurs bawaan yang dipakai."""
+    rates = dict(base_rates)
+    if path is None or not os.path.exists(path):
+        return rates
+    try:
+        with open(path, encoding='utf-8') as rates_file:
+            loaded = json.load(rates_file)
+        rates.update({str(code).upper(): float(rate) for code, rate in loaded.items()})
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        print(f"Gagal membaca kurs mata uang dari {path}: {e}, gunakan kurs bawaan.")
+    return rates
+
+def _flag(strings, pattern):
+    """Mask boolean numpy dari pencarian regex pada kolom string"""
+    return strings.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+
+def _normalize_numbers(number):
+    """Mengubah teks angka dengan pemisah ribuan/desimal apa pun menjadi float.
+    Jika titik dan koma muncul bersamaan, pemisah terakhir adalah desimal; jika hanya satu jenis muncul sekali
+    dan tidak diikuti tepat tiga digit (atau bagian bulatnya 0), pemisah itu desimal; selain itu pemisah ribuan.
+    Semua pemisah dibuang lalu hasilnya dibagi 10^(jumlah digit desimal), sehingga tidak perlu menyusun string per baris."""
+    digits = number.str.replace(r"['\s]", '', regex=True)
+    has_dot = _flag(digits, r'\.')
+    has_comma = _flag(digits, ',')
+    single_dot = _flag(digits, r'^[^.]*\.[^.]*$')
+    single_comma = _flag(digits, r'^[^,]*,[^,]*$')
+    three_after = _flag(digits, r'[.,]\d{3}$')
+    leading_zero = _flag(digits, r'^[-+]?0[.,]')
+    single_separator = (single_dot & ~has_comma) | (single_comma & ~has_dot)
+    has_decimal = (has_dot & has_comma) | (single_separator & (~three_after | leading_zero))
+
+    fraction_digits = digits.str.replace(r'^.*[.,]', '', regex=True).str.len().to_numpy(dtype=float)
+    # Pola harga sudah divalidasi, sisa angka tanpa pemisah selalu dapat di-cast langsung ke float
+    mantissa = digits.str.replace(r'[.,]', '', regex=True).astype(float).to_numpy(dtype=float)
+    return mantissa / 10.0 ** np.where(has_decimal, fraction_digits, 0)
+
+def parse_prices(prices, default_currency=DEFAULT_CURRENCY):
+    """Mengurai kolom harga teks ('$496.88', 'Rp 150.000', '12,50 €', 'EUR 1.234,50') secara tervektorisasi.
+    Mengembalikan DataFrame dengan kolom `amount` (float) dan `currency` (kode ISO, `default_currency` jika tanpa simbol).
+    Hanya nilai unik yang diurai, lalu hasilnya disebar kembali dengan kode faktorisasi."""
+    codes, uniques = pd.factorize(prices)
+    if len(uniques) == 0:
+        # Kolom kosong atau seluruh harganya kosong: tidak ada nilai yang dapat diambil dengan kode faktorisasi
+        return pd.DataFrame({'amount': np.full(len(prices), np.nan), 'currency': np.full(len(prices), np.nan, dtype=object)},
+                            index=prices.index)
+    unique_text = pd.Series(uniques, dtype=object).astype(str).astype(STRING_DTYPE)
+    is_price = unique_text.str.match(PRICE_PATTERN).to_numpy(dtype=bool)
+    # Hanya teks yang cocok dengan pola harga yang diurai; sisanya tidak memiliki angka maupun mata uang
+    price_text = unique_text[is_price]
+    # Setelah pola divalidasi, angka dan simbol cukup dipisahkan dengan membuang karakter satu sama lain
+    number = price_text.str.replace(rf"(?i){_SYMBOLS}|[a-z]{{3}}", '', regex=True)
+    symbol = price_text.str.replace(NUMBER_CHARACTERS, '', regex=True)
+    amount = np.full(len(unique_text), np.nan)
+    amount[is_price] = _normalize_numbers(number)
+    # Simbol mata uang hanya sedikit jenisnya, cukup dipetakan per simbol unik
+    symbol_codes, symbols = pd.factorize(symbol.astype(object))
+    symbols = pd.Series(symbols, dtype=object)
+    symbol_currency = symbols.str.lower().map(_ALIASES_LOWER).fillna(symbols.str.upper()).mask(symbols == '', default_currency)
+    currency = np.full(len(unique_text), np.nan, dtype=object)
+    currency[is_price] = symbol_currency.to_numpy(dtype=object).take(symbol_codes)
+
+    amount_values = amount.take(codes)
+    currency_values = currency.take(codes)
+    # Kode -1 menandai nilai kosong pada kolom asli
+    missing = codes < 0
+    amount_values[missing] = np.nan
+    currency_values[missing] = np.nan
+    return pd.DataFrame({'amount': amount_values, 'currency': currency_values}, index=prices.index)
+
+def convert_prices_to_idr(prices, exchange_rates=DEFAULT_EXCHANGE_RATES, default_currency=DEFAULT_CURRENCY):
+    """Mengonversi kolom harga ke rupiah dengan tabel kurs `exchange_rates`.
+    Kolom numerik dianggap bernilai `default_currency`; mata uang tanpa kurs menghasilkan NaN."""
+    if pd.api.types.is_numeric_dtype(prices):
+        rate = exchange_rates.get(default_currency, np.nan)
+        return (prices.astype(float) * rate).rename(prices.name)
+    parsed = parse_prices(prices, default_currency)
+    rates = parsed['currency'].map(exchange_rates)
+    unknown = parsed['currency'][parsed['currency'].notna() & rates.isna()].unique()
+    if len(unknown):
+        print(f"Peringatan: kurs untuk mata uang {sorted(unknown)} tidak tersedia, harga tersebut diabaikan.")
+    return (parsed['amount'] * rates.astype(float)).rename(prices.name)
@@ -0,0 +1,12 @@
+# Nilai bawaan yang dipakai bersama oleh main.py dan modul utils. Modul ini sengaja tanpa impor apa pun,
+# sehingga --help dan mode --reprocess tidak perlu memuat utils.extract (requests, BeautifulSoup)
+
+# Engine parser yang tersedia: 'bs4' (pencarian BeautifulSoup berulang) dan 'fast' (satu lintasan per kartu)
+PARSER_ENGINES = ('bs4', 'fast')
+
+# Direktori dan TTL (detik) cache halaman di disk
+DEFAULT_PAGE_CACHE_DIR = '.page_cache'
+DEFAULT_PAGE_CACHE_TTL = 3600
+
+# File JSON cache hasil parsing kartu produk antar run
+DEFAULT_CARD_CACHE_FILE = '.card_cache.json'
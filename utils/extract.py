@@ -1,9 +1,22 @@
+import hashlib
+import json
+import multiprocessing
+import os
 import pandas as pd
 import re
 import requests
+import threading
 import time
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from utils.cache import CachingHTTPAdapter
+from utils.checkpoint import ScrapeIncompleteError
+from utils.defaults import DEFAULT_CARD_CACHE_FILE, PARSER_ENGINES  # noqa: F401
+from utils.metrics import BYTES_DOWNLOADED, CARDS_PARSED, FETCH_ERRORS, FETCH_TIMER, PAGES_RESUMED, PARSE_TIMER, REGISTRY
+from utils.ratelimit import RetryPolicy, ThrottledHTTPAdapter
 
 HEADERS = {
     "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
@@ -12,19 +25,76 @@ HEADERS = {
 }
 
 url = 'https://fashion-studio.dicoding.dev/'
+BASE_SITE_URL = 'https://fashion-studio.dicoding.dev'
+PAGINATION_PATH_PATTERN = '/page{}'
+
+DEFAULT_POOL_SIZE = 10
+# Kesalahan sementara (429/5xx, koneksi terputus) diulang sebelum halaman dianggap gagal
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# Pola regex dikompilasi sekali untuk semua kartu produk
+RATING_PATTERN = re.compile(r'⭐\s*(\d+\.?\d*)')
+COLORS_PATTERN = re.compile(r'(\d+)\s*Colors')
+SIZE_PATTERN = re.compile(r'Size:\s*(\S+)')
+GENDER_PATTERN = re.compile(r'Gender:\s*(Men|Women|Unisex)')
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+DEFAULT_CARD_CACHE_SIZE = 4096
+# Awal kartu produk (div product-details) dan tautan paginasi pada HTML mentah, dipakai untuk
+# memotong byte setiap kartu sebagai kunci `CardParseCache` tanpa menyerialisasi ulang pohon
+CARD_BOUNDARY_PATTERN = re.compile(rb'<(?:div|a)\b[^>]*\bclass\s*=\s*["\']?[^"\'>]*\b(product-details|page-link)\b', re.IGNORECASE)
+
+# Proses parser tidak di-fork dari proses yang sudah menjalankan thread fetcher: lock (REGISTRY, urllib3, stdout)
+# yang sedang dipegang thread lain saat fork akan terkunci selamanya di proses anak
+PARSE_POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
 
 try:
-    initial_response = requests.get(url, headers=HEADERS)
-    initial_response.raise_for_status()
-    initial_content_soup = BeautifulSoup(initial_response.content.decode(), 'html.parser')
-    all_content_global = initial_content_soup.find_all('div', recursive=False)
-except requests.exceptions.RequestException as e:
-    print(f"Terjadi kesalahan saat mengambil konten awal dari {url}: {e}")
-    all_content_global = []
-
-def extract_fashion_data(article):
+    import lxml  # noqa: F401
+    FAST_TREE_BUILDER = 'lxml'
+except ImportError:
+    FAST_TREE_BUILDER = 'html.parser'
+
+# Engine 'fast' hanya membangun pohon untuk kartu produk dan tautan paginasi
+FAST_PAGE_STRAINER = SoupStrainer(class_=['product-details', 'page-link'])
+
+def create_session(pool_size=DEFAULT_POOL_SIZE, keep_alive=True, cache=None, rate_limiter=None, retry_policy=None):
+    """Membuat session HTTP berumur panjang dengan connection pool yang dapat diatur,
+       sehingga setiap halaman memakai ulang koneksi TCP/TLS yang sama.
+       Jika `cache` (PageCache) diberikan, permintaan GET dilayani melalui cache halaman di disk.
+       `rate_limiter` (TokenBucketRateLimiter) dan `retry_policy` (RetryPolicy) mengatur laju
+       permintaan dan pengulangan saat terjadi kesalahan sementara."""
+    session = requests.Session()
+    adapter_options = dict(rate_limiter=rate_limiter, retry_policy=retry_policy,
+                           pool_connections=pool_size, pool_maxsize=pool_size)
+    if cache is not None:
+        adapter = CachingHTTPAdapter(cache, **adapter_options)
+    else:
+        adapter = ThrottledHTTPAdapter(**adapter_options)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+    return session
+
+_front_page_divs = None
+
+def get_front_page_content(session=None, refresh=False):
+    """Mengambil elemen div tingkat atas dari halaman depan Fashion Studio secara eksplisit.
+       Hasil disimpan di cache sehingga permintaan jaringan hanya terjadi sekali,
+       kecuali `refresh=True`."""
+    global _front_page_divs
+    if _front_page_divs is not None and not refresh:
+        return _front_page_divs
+    content = fetching_fashion_content(url, session=session)
+    if content is None:
+        return []
+    initial_content_soup = BeautifulSoup(content.decode(), 'html.parser')
+    _front_page_divs = initial_content_soup.find_all('div', recursive=False)
+    return _front_page_divs
+
+def extract_fashion_data(article, timestamp=None):
     """Mengambil data Fashion Studio yang mencakup Title (Judul), Price (Harga),
-       Rating (Peringkat), Colors (Warna), Size (Ukuran), dan Gender (Jenis Kelamin)"""
+       Rating (Peringkat), Colors (Warna), Size (Ukuran), dan Gender (Jenis Kelamin).
+       `timestamp` dipakai sebagai Timestamp; jika tidak diberikan, waktu saat ini yang dipakai."""
     try:
         product_details = article.find('div', class_='product-details')
         if not product_details:
@@ -42,28 +112,28 @@ def extract_fashion_data(article):
         # 1. Proses extract 'Rating' (contoh, "Rating: ⭐ 3.9 / 5" atau "Rating: ⭐ Invalid Rating / 5")
         if len(paragraphs) > 0:
             rating_text = paragraphs[0].text.strip()
-            match_rating = re.search(r'⭐\s*(\d+\.?\d*)', rating_text)
+            match_rating = RATING_PATTERN.search(rating_text)
             if match_rating:
                 numeric_rating = match_rating.group(1)
         
         # 2. Proses extract 'Colors' (contoh, "3 Colors")
         if len(paragraphs) > 1:
             colors_text = paragraphs[1].text.strip()
-            match_colors = re.search(r'(\d+)\s*Colors', colors_text)
+            match_colors = COLORS_PATTERN.search(colors_text)
             if match_colors:
                 num_colors = match_colors.group(1)
 
         # 3. Proses extract 'Size' (contoh, "Size: M")
         if len(paragraphs) > 2:
             size_text = paragraphs[2].text.strip()
-            match_size = re.search(r'Size:\s*(\S+)', size_text)
+            match_size = SIZE_PATTERN.search(size_text)
             if match_size:
                 extracted_size = match_size.group(1)
 
         # 4. Mengiterasi seluruh paragraf untuk menemukan 'Gender'
         for p_tag in paragraphs:
             text = p_tag.text.strip()
-            match_gender = re.search(r'Gender:\s*(Men|Women|Unisex)', text)
+            match_gender = GENDER_PATTERN.search(text)
             if match_gender:
                 gender_value = match_gender.group(1)
                 break
@@ -75,81 +145,485 @@ def extract_fashion_data(article):
             "Colors": num_colors,
             "Size": extracted_size,
             "Gender": gender_value,
-            "Timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            "Timestamp": timestamp if timestamp is not None else datetime.now().strftime(TIMESTAMP_FORMAT)
         }
         return extracted_data
     except Exception as e:
         print(f"Gagal memuat data:{e}, lewati proses scraping untuk artikel ini")
         return None
 
-def fetching_fashion_content(url):
-    """Mengambil konten dari URL Fashion Studio"""
+def extract_fashion_data_fast(article, timestamp=None):
+    """Versi cepat `extract_fashion_data`: keenam kolom diambil dalam satu lintasan
+       elemen kartu produk dengan pola regex yang sudah dikompilasi.
+       `article` boleh berupa kontainer produk atau div product-details itu sendiri."""
+    try:
+        if article.name == 'div' and 'product-details' in article.get('class', ()):
+            product_details = article
+        else:
+            product_details = article.find('div', class_='product-details')
+        if not product_details:
+            return None
+
+        fashion_title = None
+        price = None
+        paragraphs = []
+        for tag in product_details.find_all(('h3', 'div', 'p')):
+            name = tag.name
+            if name == 'p':
+                paragraphs.append(tag.text.strip())
+            elif name == 'h3':
+                if fashion_title is None and 'product-title' in tag.get('class', ()):
+                    fashion_title = tag.text.strip()
+            elif price is None and 'price-container' in tag.get('class', ()):
+                price = tag.text.strip()
+
+        numeric_rating = "N/A"
+        num_colors = "N/A"
+        extracted_size = "N/A"
+        gender_value = "N/A"
+        if len(paragraphs) > 0:
+            match_rating = RATING_PATTERN.search(paragraphs[0])
+            if match_rating:
+                numeric_rating = match_rating.group(1)
+        if len(paragraphs) > 1:
+            match_colors = COLORS_PATTERN.search(paragraphs[1])
+            if match_colors:
+                num_colors = match_colors.group(1)
+        if len(paragraphs) > 2:
+            match_size = SIZE_PATTERN.search(paragraphs[2])
+            if match_size:
+                extracted_size = match_size.group(1)
+        for text in paragraphs:
+            match_gender = GENDER_PATTERN.search(text)
+            if match_gender:
+                gender_value = match_gender.group(1)
+                break
+
+        return {
+            "Title": fashion_title if fashion_title is not None else "N/A",
+            "Price": price if price is not None else "N/A",
+            "Rating": numeric_rating,
+            "Colors": num_colors,
+            "Size": extracted_size,
+            "Gender": gender_value,
+            "Timestamp": timestamp if timestamp is not None else datetime.now().strftime(TIMESTAMP_FORMAT)
+        }
+    except Exception as e:
+        print(f"Gagal memuat data:{e}, lewati proses scraping untuk artikel ini")
+        return None
+
+# Status per thread untuk menunda laporan kesalahan fetch spekulatif, lihat `deferred_fetch_errors`
+_fetch_state = threading.local()
+
+def _report_fetch_error(message):
+    REGISTRY.increment(FETCH_ERRORS)
+    print(message)
+
+@contextmanager
+def deferred_fetch_errors():
+    """Selama blok ini, kesalahan `fetching_fashion_content` di thread yang sama tidak dicetak maupun dihitung,
+       melainkan dikumpulkan ke list yang dikembalikan. Dipakai `PagePrefetcher` agar halaman spekulatif
+       setelah halaman terakhir tidak tercatat sebagai kesalahan."""
+    errors = []
+    _fetch_state.deferred = errors
+    try:
+        yield errors
+    finally:
+        _fetch_state.deferred = None
+
+def fetching_fashion_content(url, session=None):
+    """Mengambil konten dari URL Fashion Studio.
+       Gunakan `session` dari `create_session` agar koneksi dipakai ulang antar halaman."""
     try:
-        session = requests.Session()
-        response = session.get(url, headers=HEADERS)
-        response.raise_for_status()
-        return response.content
+        if session is None:
+            session = requests.Session()
+        with REGISTRY.timer(FETCH_TIMER):
+            response = session.get(url, headers=HEADERS)
+            response.raise_for_status()
+            content = response.content
+        REGISTRY.increment(BYTES_DOWNLOADED, len(content))
+        return content
     except requests.exceptions.RequestException as e:
-        print(f"Terjadi kesalahan saat memuat {url}: {e}")
+        message = f"Terjadi kesalahan saat memuat {url}: {e}"
+        deferred = getattr(_fetch_state, 'deferred', None)
+        if deferred is not None:
+            deferred.append(message)
+        else:
+            _report_fetch_error(message)
         return None
 
-def scrape_fashion(base_site_url, pagination_path_pattern, delay=2, max_pages=None):
-    """Fungsi untuk mengambil semua data, mulai dari request hingga variabel data"""
-    data = []
+def build_page_url(base_site_url, pagination_path_pattern, page_number):
+    """Membentuk URL halaman katalog berdasarkan nomor halaman"""
+    if page_number == 1:
+        return base_site_url
+    return f"{base_site_url}{pagination_path_pattern.format(page_number)}"
+
+class CardParseCache:
+    """Cache LRU di memori untuk hasil parsing kartu produk, dengan kunci hash HTML mentah kartu.
+    Kartu yang markup-nya tidak berubah (re-scrape, atau produk yang bergeser ke halaman lain sehingga
+    cache halaman tidak berlaku) tidak perlu diurai ulang. Timestamp tidak ikut disimpan dan selalu
+    diisi waktu halaman saat ini. Jumlah entri dibatasi `max_entries`, entri terlama dibuang lebih dulu.
+    Dengan `path`, entri dimuat dari file JSON saat dibuat dan ditulis kembali oleh `save`, sehingga
+    cache juga berlaku antar run CLI, bukan hanya untuk parsing ulang di dalam satu proses."""
+
+    def __init__(self, max_entries=DEFAULT_CARD_CACHE_SIZE, path=None):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if path is not None:
+            self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def card_keys(content, card_count):
+        """Memotong HTML mentah halaman per kartu (dari awal div product-details hingga kartu atau
+        tautan paginasi berikutnya) lalu mengembalikan hash setiap potongan. Mengembalikan None jika
+        jumlah potongan berbeda dari `card_count` hasil parser, sehingga halaman diurai tanpa cache."""
+        if isinstance(content, str):
+            content = content.encode()
+        boundaries = list(CARD_BOUNDARY_PATTERN.finditer(content))
+        keys = []
+        for index, match in enumerate(boundaries):
+            if match.group(1).lower() != b'product-details':
+                continue
+            end = boundaries[index + 1].start() if index + 1 < len(boundaries) else len(content)
+            keys.append(hashlib.blake2b(content[match.start():end], digest_size=16).digest())
+        return keys if len(keys) == card_count else None
+
+    def get(self, key, timestamp):
+        """Mengembalikan salinan hasil parsing kartu dengan Timestamp `timestamp`, atau None"""
+        with self._lock:
+            fields = self._entries.get(key)
+            if fields is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return {**fields, "Timestamp": timestamp}
+
+    def put(self, key, record):
+        """Menyimpan hasil parsing kartu tanpa Timestamp"""
+        fields = {column: value for column, value in record.items() if column != "Timestamp"}
+        with self._lock:
+            self._entries[key] = fields
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as cache_file:
+                stored = json.load(cache_file)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Cache kartu {self.path} tidak dapat dibaca ({e}), mulai dengan cache kosong.")
+            return
+        # Entri tersimpan dari yang terlama hingga terbaru, sehingga urutan LRU tetap terjaga
+        for key, fields in list(stored.items())[-self.max_entries:]:
+            self._entries[bytes.fromhex(key)] = fields
+
+    def save(self):
+        """Menulis seluruh entri ke `path` secara atomik (file sementara lalu os.replace)"""
+        if self.path is None:
+            return
+        with self._lock:
+            stored = {key.hex(): fields for key, fields in self._entries.items()}
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(stored, cache_file)
+        os.replace(temp_path, self.path)
+
+def parse_fashion_page(content, engine='bs4', card_cache=None):
+    """Mengurai satu halaman katalog menjadi (daftar produk, status halaman berikutnya).
+       Daftar produk bernilai None jika halaman tidak memiliki kontainer produk.
+       `engine='fast'` memakai tree builder tercepat yang tersedia, membatasi pohon ke
+       kartu produk dan paginasi, lalu mengurai setiap kartu dalam satu lintasan.
+       Timestamp diambil sekali untuk seluruh halaman. Dengan `card_cache` (CardParseCache),
+       kartu yang HTML-nya sudah pernah diurai diambil dari cache."""
+    with REGISTRY.timer(PARSE_TIMER):
+        records, has_next_page = _parse_fashion_page(content, engine, card_cache)
+    if records:
+        REGISTRY.increment(CARDS_PARSED, len(records))
+    return records, has_next_page
+
+def _parse_fashion_page(content, engine, card_cache):
+    if engine == 'fast':
+        soup = BeautifulSoup(content, FAST_TREE_BUILDER, parse_only=FAST_PAGE_STRAINER)
+        articles_element = soup.find_all('div', class_='product-details')
+        extract_card = extract_fashion_data_fast
+    elif engine == 'bs4':
+        soup = BeautifulSoup(content, 'html.parser')
+        product_detail_divs = soup.find_all('div', class_='product-details')
+        articles_element = []
+        for pd_div in product_detail_divs:
+            parent_product_container = pd_div.find_parent()
+            if parent_product_container:
+                articles_element.append(parent_product_container)
+        extract_card = extract_fashion_data
+    else:
+        raise ValueError(f"Engine parser tidak dikenal: {engine}, gunakan salah satu dari {PARSER_ENGINES}")
+    if not articles_element:
+        return None, False
+    timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+    card_keys = card_cache.card_keys(content, len(articles_element)) if card_cache is not None else None
+    records = []
+    for index, article in enumerate(articles_element):
+        fashion = card_cache.get(card_keys[index], timestamp) if card_keys is not None else None
+        if fashion is None:
+            fashion = extract_card(article, timestamp=timestamp)
+            if fashion and card_keys is not None:
+                card_cache.put(card_keys[index], fashion)
+        if fashion:
+            records.append(fashion)
+    next_page_link = soup.find('a', class_='page-link', string='Next')
+    has_next_page = bool(next_page_link and next_page_link.get('href'))
+    return records, has_next_page
+
+def parse_fashion_page_cached(content, url, engine='bs4', cache=None, card_cache=None):
+    """Seperti `parse_fashion_page`, tetapi memakai hasil parsing tersimpan di `cache`
+       jika body halaman sama dengan saat terakhir diurai. Timestamp hasil tersimpan diganti
+       waktu halaman saat ini, sama seperti `CardParseCache.get`."""
+    if cache is None:
+        return parse_fashion_page(content, engine=engine, card_cache=card_cache)
+    parsed = cache.load_parsed(url, content, engine)
+    if parsed is not None:
+        records, has_next_page = parsed
+        if records:
+            timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+            records = [{**record, "Timestamp": timestamp} for record in records]
+        return records, has_next_page
+    records, has_next_page = parse_fashion_page(content, engine=engine, card_cache=card_cache)
+    if records is not None:
+        cache.store_parsed(url, content, engine, records, has_next_page)
+    return records, has_next_page
+
+def create_parse_pool(parse_workers):
+    """ProcessPoolExecutor untuk parsing HTML dengan start method `PARSE_POOL_START_METHOD` (bukan fork)"""
+    return ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context(PARSE_POOL_START_METHOD))
+
+class PagePrefetcher:
+    """Mengambil halaman secara spekulatif dengan sekumpulan worker (thread) terbatas.
+       Halaman tetap dikembalikan sesuai urutan nomor halaman melalui `get`.
+       Jika `parse_pool` (ProcessPoolExecutor) diberikan, setiap thread fetcher langsung
+       mengirim byte halaman ke pool parser begitu halaman selesai diunduh.
+       Pengambilan dimulai dari `start_page`, misalnya saat melanjutkan dari checkpoint.
+       Kesalahan fetch baru dilaporkan saat halamannya diambil melalui `get`; halaman spekulatif
+       setelah halaman terakhir dibatalkan atau dibuang tanpa dicatat sebagai kesalahan."""
+
+    def __init__(self, base_site_url, pagination_path_pattern, workers, delay=0, max_pages=None, session=None,
+                 parse_pool=None, engine='bs4', cache=None, window=None, start_page=1):
+        self.base_site_url = base_site_url
+        self.pagination_path_pattern = pagination_path_pattern
+        self.workers = workers
+        self.window = window or workers
+        self.delay = delay
+        self.max_pages = max_pages
+        self.session = session
+        self.parse_pool = parse_pool
+        self.engine = engine
+        self.cache = cache
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.futures = {}
+        self.start_page = start_page
+        self.next_page_to_submit = start_page
+
+    def _fetch(self, url):
+        with deferred_fetch_errors() as errors:
+            content = fetching_fashion_content(url, session=self.session)
+        if not content or self.parse_pool is None:
+            return content, None, errors
+        if self.cache is not None and self.cache.load_parsed(url, content, self.engine) is not None:
+            # Hasil parsing tersimpan di cache, tidak perlu dikirim ke pool parser
+            return content, None, errors
+        return content, self.parse_pool.submit(parse_fashion_page, content, self.engine), errors
+
+    def _submit_until(self, last_page_number):
+        while self.next_page_to_submit <= last_page_number:
+            if self.max_pages is not None and self.next_page_to_submit > self.max_pages:
+                break
+            if self.next_page_to_submit > self.start_page:
+                # Jaga jarak antar permintaan sesuai `delay`, sama seperti mode berurutan
+                time.sleep(self.delay)
+            url = build_page_url(self.base_site_url, self.pagination_path_pattern, self.next_page_to_submit)
+            self.futures[self.next_page_to_submit] = self.executor.submit(self._fetch, url)
+            self.next_page_to_submit += 1
+
+    def get(self, page_number):
+        """Mengembalikan (konten, future hasil parsing atau None) halaman `page_number`
+           dan menjadwalkan halaman berikutnya"""
+        self._submit_until(page_number + self.window - 1)
+        future = self.futures.pop(page_number, None)
+        if future is None:
+            return None, None
+        content, parse_future, errors = future.result()
+        for message in errors:
+            _report_fetch_error(message)
+        return content, parse_future
+
+    def close(self):
+        """Membatalkan halaman spekulatif yang belum berjalan dan menghentikan worker"""
+        for future in self.futures.values():
+            future.cancel()
+        self.futures.clear()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown(wait=True, cancel_futures=True)
+
+def iter_fashion_pages(base_site_url, pagination_path_pattern, delay=2, max_pages=None, workers=1, session=None, engine='bs4', cache=None,
+                       parse_workers=0, rate_limiter=None, retry_policy=DEFAULT_RETRY_POLICY, card_cache=None,
+                       checkpoint=None, replay_checkpoint=True):
+    """Generator yang menghasilkan daftar produk per halaman sesuai urutan halaman (bersamaan jika `workers` > 1).
+       Dengan `checkpoint`, halaman baru dicatat saat batch berikutnya diminta; menutup generator lebih awal menandai run gagal."""
+    if engine not in PARSER_ENGINES:
+        raise ValueError(f"Engine parser tidak dikenal: {engine}, gunakan salah satu dari {PARSER_ENGINES}")
     page_number = 1
+    run_key = None
+    if checkpoint is not None:
+        run_key = checkpoint.run_key(base_site_url, pagination_path_pattern)
+        completed_pages = checkpoint.begin(run_key)
+        if completed_pages:
+            print(f"Melanjutkan scraping dari checkpoint {checkpoint.path}: {len(completed_pages)} halaman sudah selesai.")
+            REGISTRY.increment(PAGES_RESUMED, len(completed_pages))
+            if replay_checkpoint:
+                for _, records, _ in completed_pages:
+                    yield records
+            if not completed_pages[-1][2]:
+                print("Halaman terakhir sudah tersimpan di checkpoint, tidak ada halaman yang perlu di-scrape.")
+                checkpoint.mark_completed(run_key)
+                return
+            page_number = len(completed_pages) + 1
+    owns_session = session is None
+    if owns_session:
+        session = create_session(pool_size=max(DEFAULT_POOL_SIZE, workers), cache=cache,
+                                 rate_limiter=rate_limiter, retry_policy=retry_policy)
+    prefetcher = None
+    if parse_workers > 0:
+        prefetcher = PagePrefetcher(base_site_url, pagination_path_pattern, workers, delay=delay, max_pages=max_pages, session=session,
+                                    parse_pool=create_parse_pool(parse_workers), engine=engine, cache=cache,
+                                    window=max(workers, parse_workers), start_page=page_number)
+    elif workers > 1:
+        prefetcher = PagePrefetcher(base_site_url, pagination_path_pattern, workers, delay=delay, max_pages=max_pages, session=session,
+                                    start_page=page_number)
 
-    while True:
-        if max_pages is not None and page_number > max_pages:
-            print(f"Mencapai jumlah halaman maksimum ({max_pages}), selesaikan proses scraping.")
-            break
-        if page_number == 1:
-            url = base_site_url
-        else:
-            url = f"{base_site_url}{pagination_path_pattern.format(page_number)}"
+    failure = None
+    try:
+        while True:
+            if max_pages is not None and page_number > max_pages:
+                print(f"Mencapai jumlah halaman maksimum ({max_pages}), selesaikan proses scraping.")
+                break
+            url = build_page_url(base_site_url, pagination_path_pattern, page_number)
 
-        print(f"Scraping halaman: {url}")
+            print(f"Scraping halaman: {url}")
 
-        content = fetching_fashion_content(url)
-        if content:
+            parse_future = None
+            if prefetcher is not None:
+                content, parse_future = prefetcher.get(page_number)
+            else:
+                content = fetching_fashion_content(url, session=session)
+            if not content:
+                print(f"Gagal mengambil konten untuk {url}, akhiri proses scraping.")
+                failure = f"gagal mengambil konten {url}"
+                break
             try:
-                soup = BeautifulSoup(content, 'html.parser')
-                product_detail_divs = soup.find_all('div', class_='product-details')
-                articles_element = []
-                for pd_div in product_detail_divs:
-                    parent_product_container = pd_div.find_parent()
-                    if parent_product_container:
-                        articles_element.append(parent_product_container)
-                if not articles_element:
-                    print(f"Tidak ditemukan kontainer item produk di {url}, akhiri proses scraping.")
-                    break
-                for article in articles_element:
-                    fashion = extract_fashion_data(article)
-                    if fashion:
-                        data.append(fashion)
-
-                next_page_link = soup.find('a', class_='page-link', string='Next')
-                if next_page_link and next_page_link.get('href'):
-                    page_number += 1
-                    time.sleep(delay)
+                if parse_future is not None:
+                    records, has_next_page = parse_future.result()
+                    if records:
+                        # Metrik di proses parser tidak terbawa ke proses utama, cukup catat jumlah kartunya
+                        REGISTRY.increment(CARDS_PARSED, len(records))
+                    if cache is not None and records is not None:
+                        cache.store_parsed(url, content, engine, records, has_next_page)
                 else:
-                    print(f"Tidak ditemukan halaman berikutnya di {url}, hentikan proses scraping.")
-                    break
+                    records, has_next_page = parse_fashion_page_cached(content, url, engine=engine, cache=cache, card_cache=card_cache)
             except Exception as e:
                 print(f"Terjadi kesalahan saat memproses halaman {url}: {e}")
+                failure = f"kesalahan saat memproses {url}: {e}"
                 break
-        else:
-            print(f"Gagal mengambil konten untuk {url}, akhiri proses scraping.")
-            break
+            if records is None:
+                print(f"Tidak ditemukan kontainer item produk di {url}, akhiri proses scraping.")
+                failure = f"tidak ditemukan kontainer item produk di {url}"
+                break
+
+            try:
+                yield records
+            except GeneratorExit:
+                # Konsumen berhenti sebelum batch ini selesai diproses (misalnya load gagal), halaman tidak dicatat
+                if checkpoint is not None:
+                    checkpoint.mark_failed(run_key, page_number, "batch halaman belum selesai diproses")
+                raise
+            if checkpoint is not None:
+                checkpoint.record_page(run_key, page_number, records, has_next_page)
+
+            if not has_next_page:
+                print(f"Tidak ditemukan halaman berikutnya di {url}, hentikan proses scraping.")
+                break
+            page_number += 1
+            if prefetcher is None:
+                time.sleep(delay)
+        if checkpoint is not None:
+            if failure is not None:
+                checkpoint.mark_failed(run_key, page_number, failure)
+                raise ScrapeIncompleteError(page_number, failure)
+            checkpoint.mark_completed(run_key)
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+        if owns_session:
+            session.close()
+
+def scrape_fashion(base_site_url, pagination_path_pattern, delay=2, max_pages=None, workers=1, session=None, engine='bs4', cache=None,
+                   parse_workers=0, rate_limiter=None, retry_policy=DEFAULT_RETRY_POLICY, card_cache=None, checkpoint=None):
+    """Fungsi untuk mengambil semua data, mulai dari request hingga variabel data.
+       Argumen sama dengan `iter_fashion_pages`, tetapi seluruh produk dikumpulkan dalam satu list.
+       Dengan `checkpoint`, list berisi seluruh katalog termasuk halaman dari run sebelumnya,
+       atau `ScrapeIncompleteError` dimunculkan jika scraping tidak selesai."""
+    data = []
+    for records in iter_fashion_pages(base_site_url, pagination_path_pattern, delay=delay, max_pages=max_pages,
+                                      workers=workers, session=session, engine=engine, cache=cache,
+                                      parse_workers=parse_workers, rate_limiter=rate_limiter, retry_policy=retry_policy,
+                                      card_cache=card_cache, checkpoint=checkpoint):
+        data.extend(records)
     return data
 
-def main(delay=0.1):
-    """Mengambil waktu pada proses scraping Title, Price, Rating, Colors, Size, dan Gender"""
+def iter_main(delay=0.1, workers=1, session=None, engine='bs4', cache=None, parse_workers=0,
+              rate_limiter=None, retry_policy=DEFAULT_RETRY_POLICY, card_cache=None, checkpoint=None):
+    """Versi streaming dari `main`: menghasilkan satu DataFrame untuk setiap halaman yang berhasil di-scrape.
+       Halaman yang tersimpan di `checkpoint` sudah diproses run sebelumnya sehingga tidak dihasilkan ulang."""
+    pages = iter_fashion_pages(BASE_SITE_URL, PAGINATION_PATH_PATTERN, delay=delay, max_pages=None,
+                               workers=workers, session=session, engine=engine, cache=cache,
+                               parse_workers=parse_workers, rate_limiter=rate_limiter, retry_policy=retry_policy,
+                               card_cache=card_cache, checkpoint=checkpoint, replay_checkpoint=False)
+    # closing: menutup generator ini juga langsung menutup iter_fashion_pages, sehingga halaman terakhir tidak dicatat
+    with closing(pages):
+        for records in pages:
+            if records:
+                yield pd.DataFrame(records)
+
+def main(delay=0.1, workers=1, session=None, engine='bs4', cache=None, parse_workers=0,
+         rate_limiter=None, retry_policy=DEFAULT_RETRY_POLICY, card_cache=None, checkpoint=None):
+    """Mengambil waktu pada proses scraping Title, Price, Rating, Colors, Size, dan Gender.
+       Dengan `checkpoint`, scraping yang berhenti di tengah jalan mengembalikan DataFrame kosong
+       agar hasil parsial tidak di-load; halaman yang sudah selesai dapat dilanjutkan dengan mode resume."""
     try:
         print(f"Proses scraping dimulai pada: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         start_time = datetime.now()
-        BASE_SITE_URL = 'https://fashion-studio.dicoding.dev'
-        PAGINATION_PATH_PATTERN = '/page{}'
-        all_content_data = scrape_fashion(BASE_SITE_URL, PAGINATION_PATH_PATTERN, delay=delay, max_pages=None)
+        all_content_data = scrape_fashion(BASE_SITE_URL, PAGINATION_PATH_PATTERN, delay=delay, max_pages=None, workers=workers, session=session, engine=engine, cache=cache,
+                                          parse_workers=parse_workers, rate_limiter=rate_limiter, retry_policy=retry_policy,
+                                          card_cache=card_cache, checkpoint=checkpoint)
 
         if all_content_data:
             df = pd.DataFrame(all_content_data)
@@ -159,6 +633,9 @@ def main(delay=0.1):
         else:
             print("Tidak tersedia data untuk di-scrape.")
             return pd.DataFrame()
+    except ScrapeIncompleteError as e:
+        print(f"{e}. Hasil parsial tidak di-load, jalankan ulang dengan mode resume untuk melanjutkan dari checkpoint.")
+        return pd.DataFrame()
     except Exception as e:
         print(f"Gagal melakukan scraping website secara keseluruhan: {e}")
         return pd.DataFrame()
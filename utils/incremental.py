@@ -0,0 +1,66 @@
+import hashlib
+import json
+import os
+import pandas as pd
+
+DEFAULT_STATE_FILE = 'product_fingerprints.json'
+# Kolom yang menentukan identitas produk dan kolom yang dihitung ke dalam fingerprint
+DEFAULT_KEY_COLUMNS = ['Title', 'Size', 'Gender']
+FINGERPRINT_COLUMNS = ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender']
+FIELD_SEPARATOR = '\x1f'
+
+def _join_columns(df, columns):
+    """Menggabungkan nilai beberapa kolom menjadi satu string per baris"""
+    available = [col for col in columns if col in df.columns]
+    if not available:
+        return pd.Series('', index=df.index)
+    return df[available].astype(str).agg(FIELD_SEPARATOR.join, axis=1)
+
+def fingerprint_products(df, columns=FINGERPRINT_COLUMNS):
+    """Menghitung fingerprint (hash SHA-1) kolom-kolom kartu produk untuk setiap baris.
+    Timestamp tidak ikut dihitung sehingga produk yang sama pada run berbeda memiliki fingerprint yang sama."""
+    return _join_columns(df, columns).map(lambda value: hashlib.sha1(value.encode()).hexdigest())
+
+class ProductFingerprintStore:
+    """Menyimpan fingerprint terakhir setiap produk di file JSON agar hanya produk baru
+    atau berubah yang diteruskan ke tahap transform dan load."""
+
+    def __init__(self, path=DEFAULT_STATE_FILE, key_columns=DEFAULT_KEY_COLUMNS):
+        self.path = path
+        self.key_columns = list(key_columns)
+        self.fingerprints = {}
+        self.pending = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as state_file:
+                    self.fingerprints = json.load(state_file)
+            except (OSError, ValueError) as e:
+                print(f"Gagal membaca fingerprint produk dari {path}: {e}, semua produk dianggap baru.")
+                self.fingerprints = {}
+
+    def filter_changed(self, df):
+        """Mengembalikan baris yang baru atau berubah dibandingkan run sebelumnya.
+        Fingerprint baris tersebut baru disimpan permanen setelah `commit` dipanggil."""
+        if df.empty:
+            return df
+        keys = _join_columns(df, self.key_columns)
+        fingerprints = fingerprint_products(df)
+        previous = keys.map(self.fingerprints)
+        changed_mask = previous.isna() | (previous != fingerprints)
+        self.pending.update(zip(keys[changed_mask], fingerprints[changed_mask]))
+        return df[changed_mask]
+
+    def commit(self):
+        """Menyimpan fingerprint yang tertunda ke file setelah data berhasil di-load"""
+        if not self.pending:
+            return
+        self.fingerprints.update(self.pending)
+        self.pending = {}
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as state_file:
+            json.dump(self.fingerprints, state_file)
+        os.replace(temp_path, self.path)
+
+    def discard(self):
+        """Membuang fingerprint yang tertunda setelah load gagal, agar produknya dianggap baru lagi"""
+        self.pending = {}
@@ -1,61 +1,163 @@
 import csv
+import io
 import os
 import pandas as pd
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
-try:
-    from google.oauth2.service_account import Credentials
-    from googleapiclient.discovery import build
+from utils.metrics import LOAD_FAILURES, LOAD_ROWS, LOAD_TIMER, REGISTRY
+from utils.ratelimit import RetryPolicy
 
-    SERVICE_ACCOUNT_FILE = 'google-sheets-api.json'
-    SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+SERVICE_ACCOUNT_FILE = 'google-sheets-api.json'
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+SPREADSHEET_ID = '1TI_Tx-X3I-ruwbepiE_KeUbj4YSLktWH7lu_Nlrldaw'
+RANGE_NAME = 'Sheet1'
 
-    # Buatkan kredensial jika file tersedia
-    if os.path.exists(SERVICE_ACCOUNT_FILE):
-        credential = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-        google_sheets_available = True
-    else:
-        print(f"Peringatan: '{SERVICE_ACCOUNT_FILE}' tidak ditemukan, gagal melakukan ekspor ke Google Sheets.")
-        credential = None
-        google_sheets_available = False
+# Kredensial Google baru dimuat saat ekspor Google Sheets pertama, sehingga run yang tidak memakai
+# Google Sheets tidak mengimpor klien Google API. None berarti ketersediaannya belum diperiksa.
+credential = None
+google_sheets_available = None
+_credential_lock = threading.Lock()
 
-    SPREADSHEET_ID = '1TI_Tx-X3I-ruwbepiE_KeUbj4YSLktWH7lu_Nlrldaw'
-    RANGE_NAME = 'Sheet1'
-
-except ImportError:
-    print("Peringatan: library klien Google API (google-auth, google-api-python-client) tidak terinstal, gagal mengekspor data ke Google Sheets.")
-    credential = None
-    google_sheets_available = False
-except Exception as e:
-    print(f"Terjadi kesalahan saat inisiasi API Google Sheets: {e}. tidak tersedia ekspor data ke Google Sheets.")
-    credential = None
-    google_sheets_available = False
+def get_sheets_credential():
+    """Memuat kredensial service account Google sekali saja dan mengembalikannya,
+    atau None jika library klien Google API atau file kredensial tidak tersedia"""
+    global credential, google_sheets_available
+    with _credential_lock:
+        if google_sheets_available is not None:
+            return credential
+        google_sheets_available = False
+        try:
+            from google.oauth2.service_account import Credentials
+        except ImportError:
+            print("Peringatan: library klien Google API (google-auth, google-api-python-client) tidak terinstal, gagal mengekspor data ke Google Sheets.")
+            return None
+        if not os.path.exists(SERVICE_ACCOUNT_FILE):
+            print(f"Peringatan: '{SERVICE_ACCOUNT_FILE}' tidak ditemukan, gagal melakukan ekspor ke Google Sheets.")
+            return None
+        try:
+            credential = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+            google_sheets_available = True
+        except Exception as e:
+            print(f"Terjadi kesalahan saat inisiasi API Google Sheets: {e}. tidak tersedia ekspor data ke Google Sheets.")
+        return credential
 
-def export_to_csv(df, filename='products.csv'):
-    """Mengekspor data ke csv"""
+def export_to_csv(df, filename='products.csv', append=False):
+    """Mengekspor data ke csv. Jika `append=True`, baris ditambahkan ke file yang sudah ada
+    tanpa menulis ulang header (dipakai oleh pipeline streaming per batch)."""
     try:
         print(f"Mulai mengekspor data ke dalam format CSV: {filename}")
-        df.to_csv(filename, index=False)
+        write_header = not (append and os.path.exists(filename))
+        df.to_csv(filename, index=False, mode='a' if append else 'w', header=write_header)
         print(f"Berhasil mengekspor data ke dalam format CSV: {filename}")
         return True
     except Exception as e:
         print(f"Gagal mengekspor data ke dalam format CSV: {e}")
         return False
 
-def export_to_google_sheet(df, spreadsheet_id=SPREADSHEET_ID, range_name=RANGE_NAME):
-    """Mengekspor data ke Google Sheets dengan nilai-nilai dari DataFrame.
-    Buat header terlebih dahulu jika sheet kosong, lalu tambahkan baris data."""
-    global google_sheets_available
+# Format kolumnar menyimpan tipe data (float, int, kategori) sehingga pembaca tidak perlu menebak ulang tipe
+FILE_FORMATS = ('csv', 'parquet', 'feather')
+PARQUET_COMPRESSIONS = ('snappy', 'gzip', 'brotli', 'zstd', 'lz4', 'none')
+FEATHER_COMPRESSIONS = ('lz4', 'zstd', 'uncompressed')
+
+def export_to_parquet(df, filename='products.parquet', compression='snappy'):
+    """Mengekspor data ke Parquet (membutuhkan pyarrow) dengan kompresi `compression`.
+    Tipe data kolom, termasuk kategori, ikut tersimpan di skema file."""
+    if compression not in PARQUET_COMPRESSIONS:
+        raise ValueError(f"Kompresi Parquet tidak dikenal: {compression}, gunakan salah satu dari {PARQUET_COMPRESSIONS}")
+    try:
+        print(f"Mulai mengekspor data ke dalam format Parquet: {filename}")
+        df.to_parquet(filename, index=False, compression=None if compression == 'none' else compression)
+        print(f"Berhasil mengekspor data ke dalam format Parquet: {filename}")
+        return True
+    except ImportError as e:
+        print(f"Peringatan: library pyarrow tidak terinstal, gagal mengekspor data ke dalam format Parquet: {e}")
+        return False
+    except Exception as e:
+        print(f"Gagal mengekspor data ke dalam format Parquet: {e}")
+        return False
 
-    if not google_sheets_available or credential is None:
+def export_to_feather(df, filename='products.feather', compression='lz4'):
+    """Mengekspor data ke Arrow/Feather v2 (membutuhkan pyarrow) dengan kompresi `compression`"""
+    if compression not in FEATHER_COMPRESSIONS:
+        raise ValueError(f"Kompresi Feather tidak dikenal: {compression}, gunakan salah satu dari {FEATHER_COMPRESSIONS}")
+    try:
+        print(f"Mulai mengekspor data ke dalam format Feather: {filename}")
+        # Feather hanya menerima index bawaan (RangeIndex), hasil filter transform perlu di-reset
+        df.reset_index(drop=True).to_feather(filename, compression=compression)
+        print(f"Berhasil mengekspor data ke dalam format Feather: {filename}")
+        return True
+    except ImportError as e:
+        print(f"Peringatan: library pyarrow tidak terinstal, gagal mengekspor data ke dalam format Feather: {e}")
+        return False
+    except Exception as e:
+        print(f"Gagal mengekspor data ke dalam format Feather: {e}")
+        return False
+
+# Jumlah baris per permintaan append agar payload tetap di bawah batas ukuran Sheets API
+DEFAULT_SHEETS_ROWS_PER_REQUEST = 1000
+# Kuota Sheets API dihitung per menit, sehingga backoff dibuat lebih panjang daripada untuk scraping
+SHEETS_RETRY_POLICY = RetryPolicy(max_retries=5, backoff_factor=2.0, max_backoff=64.0)
+
+_sheets_service = None
+_sheets_service_lock = threading.Lock()
+
+def get_sheets_service():
+    """Mengembalikan klien Google Sheets API yang dibuat sekali dan dipakai ulang oleh setiap ekspor"""
+    global _sheets_service
+    with _sheets_service_lock:
+        if _sheets_service is None:
+            from googleapiclient.discovery import build
+            _sheets_service = build('sheets', 'v4', credentials=get_sheets_credential())
+        return _sheets_service
+
+def _is_quota_error(error, retry_policy):
+    """Memeriksa apakah HttpError dari Sheets API berasal dari batas kuota atau gangguan sementara server"""
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    try:
+        status = int(status)
+    except (TypeError, ValueError):
+        return False
+    if status in retry_policy.retry_statuses:
+        return True
+    return status == 403 and 'ratelimitexceeded' in str(error).lower()
+
+def _execute_with_retry(request, retry_policy, sleep=time.sleep):
+    """Menjalankan permintaan Sheets API dan mengulanginya dengan backoff saat kuota terlampaui"""
+    attempt = 0
+    while True:
+        try:
+            return request.execute()
+        except Exception as e:
+            if not _is_quota_error(e, retry_policy) or attempt >= retry_policy.max_retries:
+                raise
+            attempt += 1
+            delay = retry_policy.backoff(attempt)
+            print(f"Kuota Google Sheets API terlampaui ({e}), ulangi percobaan ke-{attempt} dalam {delay:.2f} detik.")
+            sleep(delay)
+
+def export_to_google_sheet(df, spreadsheet_id=SPREADSHEET_ID, range_name=RANGE_NAME, service=None,
+                           rows_per_request=DEFAULT_SHEETS_ROWS_PER_REQUEST, retry_policy=SHEETS_RETRY_POLICY):
+    """Mengekspor data ke Google Sheets dengan nilai-nilai dari DataFrame.
+    Buat header terlebih dahulu jika sel pertama sheet kosong, lalu tambahkan baris data
+    per `rows_per_request` baris. Permintaan yang terkena batas kuota diulang sesuai `retry_policy`."""
+    if service is None and get_sheets_credential() is None:
         print("Lewati proses ekspor data ke dalam format Google Sheets: Google Sheets API tidak ada atau hilangnya kredensial.")
         return False
     try:
         print(f"Mulai mengekspor data ke dalam format Google Sheets (ID: {spreadsheet_id}, Range: {range_name})")
-        service = build('sheets', 'v4', credentials=credential)
+        if service is None:
+            service = get_sheets_service()
         sheet = service.spreadsheets()
-        result = sheet.values().get(spreadsheetId=spreadsheet_id, range=range_name).execute()
+        # Cukup baca satu sel untuk mengetahui apakah header sudah ada
+        result = _execute_with_retry(sheet.values().get(spreadsheetId=spreadsheet_id, range=f"{range_name}!A1"), retry_policy)
         existing_values = result.get('values', [])
         headers = df.columns.tolist()
+        # Kolom datetime (skema ringkas) dikirim sebagai teks karena nilai Sheets API harus dapat diserialisasi ke JSON
+        datetime_columns = df.select_dtypes(include='datetime').columns
+        if len(datetime_columns):
+            df = df.assign(**{col: df[col].dt.strftime('%Y-%m-%d %H:%M:%S') for col in datetime_columns})
         values = df.values.tolist()
         # Jika tidak tersedia nilai, buat header terlebih dahulu
         if not existing_values:
@@ -63,45 +165,291 @@ def export_to_google_sheet(df, spreadsheet_id=SPREADSHEET_ID, range_name=RANGE_N
             body = {
                 'values': [headers]
             }
-            sheet.values().append(
+            _execute_with_retry(sheet.values().append(
                 spreadsheetId=spreadsheet_id,
                 range=range_name,
                 valueInputOption='RAW',
                 body=body
-            ).execute()
+            ), retry_policy)
         print("Mengisi nilai data ke dalam format Google Sheets.")
-        body = {
-            'values': values
-        }
-        result = sheet.values().append(
-            spreadsheetId=spreadsheet_id,
-            range=range_name,
-            valueInputOption='RAW',
-            body=body
-        ).execute()
-        print(f"Berhasil mengekspor data ke dalam format Google Sheets. {result.get('updates').get('updatedCells')} sel diperbarui.")
+        updated_cells = 0
+        for start in range(0, len(values), rows_per_request):
+            body = {
+                'values': values[start:start + rows_per_request]
+            }
+            result = _execute_with_retry(sheet.values().append(
+                spreadsheetId=spreadsheet_id,
+                range=range_name,
+                valueInputOption='RAW',
+                body=body
+            ), retry_policy)
+            updated_cells += result.get('updates', {}).get('updatedCells', 0)
+        print(f"Berhasil mengekspor data ke dalam format Google Sheets. {updated_cells} sel diperbarui.")
         return True
     except Exception as e:
         print(f"Gagal mengekspor data ke dalam format Google Sheets: {e}")
         return False
 
-def export_to_postgre(df, db_url, table_name='fashion_data', engine=None):
-    """Mengekspor data ke dalam format PostgreSQL"""
-    from sqlalchemy import create_engine
+# Metode load PostgreSQL: 'to_sql' (executemany), 'multi' (insert multi-baris), 'copy' (COPY FROM STDIN)
+LOAD_METHODS = ('to_sql', 'multi', 'copy')
+DEFAULT_CHUNKSIZE = 10000
+# Mode load: 'append' menambahkan semua baris, 'upsert' memperbarui baris dengan natural key yang sama
+LOAD_MODES = ('append', 'upsert')
+DEFAULT_UPSERT_KEY = ('Title', 'Size', 'Gender')
+# Batas parameter per statement (SQLite 32766, PostgreSQL 65535) untuk insert multi-baris
+MAX_BIND_PARAMETERS = 32766
+
+# Pengaturan connection pool bawaan untuk engine yang dibagikan antar pemanggilan export_to_postgre
+DEFAULT_DB_POOL_SIZE = 5
+DEFAULT_DB_MAX_OVERFLOW = 10
+DEFAULT_DB_POOL_RECYCLE = 1800
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+def get_engine(db_url, pool_size=DEFAULT_DB_POOL_SIZE, max_overflow=DEFAULT_DB_MAX_OVERFLOW, pool_pre_ping=True,
+               pool_recycle=DEFAULT_DB_POOL_RECYCLE):
+    """Mengembalikan engine SQLAlchemy yang dibagikan dalam satu proses untuk setiap URL database,
+    sehingga load berulang atau per batch memakai ulang koneksi yang sudah terbuka.
+    Pengaturan pool hanya dipakai saat engine untuk URL tersebut pertama kali dibuat."""
+    with _engines_lock:
+        engine = _engines.get(db_url)
+        if engine is None:
+            from sqlalchemy import create_engine
+            from sqlalchemy.engine import make_url
+
+            options = {'pool_pre_ping': pool_pre_ping, 'pool_recycle': pool_recycle}
+            # Pool SQLite dipilih otomatis oleh dialeknya dan tidak semuanya menerima ukuran pool
+            if make_url(db_url).get_backend_name() != 'sqlite':
+                options.update(pool_size=pool_size, max_overflow=max_overflow)
+            engine = create_engine(db_url, **options)
+            _engines[db_url] = engine
+        return engine
+
+def dispose_engines():
+    """Menutup semua koneksi pada engine yang tersimpan dan mengosongkan registry"""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+
+def _quote_identifier(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+def _insert_multi(df, table_name, con, chunksize):
+    """Insert multi-baris dengan ukuran chunk yang tidak melewati batas parameter database"""
+    rows_per_statement = max(1, min(chunksize, MAX_BIND_PARAMETERS // max(1, len(df.columns))))
+    df.to_sql(table_name, con=con, if_exists='append', index=False, method='multi', chunksize=rows_per_statement)
+
+def _copy_rows(df, table_name, con, chunksize):
+    """Mengirim baris DataFrame ke tabel yang sudah ada dengan COPY FROM STDIN, per chunk"""
+    columns = ', '.join(_quote_identifier(col) for col in df.columns)
+    copy_sql = f"COPY {_quote_identifier(table_name)} ({columns}) FROM STDIN WITH (FORMAT csv)"
+    cursor = con.connection.cursor()
+    try:
+        for start in range(0, len(df), chunksize):
+            buffer = io.StringIO()
+            df.iloc[start:start + chunksize].to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+            cursor.copy_expert(copy_sql, buffer)
+    finally:
+        cursor.close()
+
+def _copy_from_stdin(df, table_name, con, chunksize):
+    """Memuat DataFrame dengan PostgreSQL COPY FROM STDIN melalui buffer CSV di memori, per chunk"""
+    # Buat tabel terlebih dahulu (jika belum ada) dengan skema dari DataFrame
+    df.head(0).to_sql(table_name, con=con, if_exists='append', index=False)
+    _copy_rows(df, table_name, con, chunksize)
+
+def _deduplicate_existing_rows(table_name, con, key_columns):
+    """Tabel lama yang dimuat dengan mode append dapat berisi natural key ganda sehingga unique index gagal dibuat.
+    Sebelum index dibuat, hanya baris terakhir yang dimasukkan untuk setiap key yang dipertahankan.
+    Baris dengan key NULL tidak melanggar unique index sehingga tidak disentuh."""
+    from sqlalchemy import inspect, text
+
+    if f"{table_name}_upsert_key" in {index['name'] for index in inspect(con).get_indexes(table_name)}:
+        return
+    table = _quote_identifier(table_name)
+    keys = ', '.join(_quote_identifier(col) for col in key_columns)
+    not_null = ' AND '.join(f"{_quote_identifier(col)} IS NOT NULL" for col in key_columns)
+    duplicates = con.execute(text(f"SELECT COALESCE(SUM(n - 1), 0) FROM (SELECT COUNT(*) AS n FROM {table} WHERE {not_null} "
+                                  f"GROUP BY {keys} HAVING COUNT(*) > 1) AS duplicate_keys")).scalar()
+    if not duplicates:
+        return
+    dialect = con.dialect.name
+    if dialect == 'sqlite':
+        delete_sql = (f"DELETE FROM {table} WHERE {not_null} AND rowid NOT IN "
+                      f"(SELECT MAX(rowid) FROM {table} WHERE {not_null} GROUP BY {keys})")
+    elif dialect == 'postgresql':
+        same_key = ' AND '.join(f"older.{_quote_identifier(col)} = newer.{_quote_identifier(col)}" for col in key_columns)
+        delete_sql = f"DELETE FROM {table} AS older USING {table} AS newer WHERE {same_key} AND older.ctid < newer.ctid"
+    else:
+        raise ValueError(f"Tabel {table_name} berisi {duplicates} baris dengan natural key ({keys}) ganda; hapus duplikat "
+                         f"tersebut atau buat unique index {table_name}_upsert_key secara manual sebelum memakai mode upsert")
+    print(f"Tabel {table_name} berisi {duplicates} baris dengan natural key ganda dari load append sebelumnya, "
+          f"hanya baris terakhir untuk setiap key yang dipertahankan.")
+    con.execute(text(delete_sql))
+
+def _upsert(df, table_name, con, key_columns, use_copy, chunksize):
+    """Memuat DataFrame ke tabel staging sementara, lalu menggabungkannya ke tabel tujuan
+    dengan satu INSERT ... ON CONFLICT DO UPDATE berdasarkan `key_columns`"""
+    from sqlalchemy import DateTime, bindparam, text
+
+    missing_keys = [col for col in key_columns if col not in df.columns]
+    if missing_keys:
+        raise ValueError(f"Kolom natural key tidak tersedia di DataFrame: {missing_keys}")
+    # Satu statement ON CONFLICT tidak boleh memperbarui baris yang sama dua kali
+    df = df.drop_duplicates(subset=list(key_columns), keep='last')
+    table = _quote_identifier(table_name)
+    # Tabel staging selalu tabel sementara, tidak pernah tabel permanen bernama sama: di PostgreSQL tabel
+    # sementara dihapus saat commit, di SQLite namanya dikualifikasi skema temp
+    is_postgresql = con.dialect.name == 'postgresql'
+    staging = _quote_identifier(f"{table_name}_staging")
+    if not is_postgresql:
+        staging = f"temp.{staging}"
+    columns = ', '.join(_quote_identifier(col) for col in df.columns)
+    keys = ', '.join(_quote_identifier(col) for col in key_columns)
+
+    df.head(0).to_sql(table_name, con=con, if_exists='append', index=False)
+    _deduplicate_existing_rows(table_name, con, key_columns)
+    index_name = _quote_identifier(f"{table_name}_upsert_key")
+    con.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {table} ({keys})"))
+    on_commit = " ON COMMIT DROP" if is_postgresql else ""
+    con.execute(text(f"CREATE TEMPORARY TABLE {staging}{on_commit} AS SELECT {columns} FROM {table} WHERE 1 = 0"))
+    if use_copy:
+        _copy_rows(df, f"{table_name}_staging", con, chunksize)
+    else:
+        placeholders = ', '.join(f":p{i}" for i in range(len(df.columns)))
+        values = df.astype(object).where(df.notna(), None)
+        # Driver database tidak mengenal pd.Timestamp (misalnya Timestamp hasil --compact-schema); kolom datetime
+        # dikirim sebagai datetime Python dengan tipe DateTime agar dialek mengonversinya sendiri
+        datetime_params = []
+        for i, col in enumerate(df.columns):
+            if pd.api.types.is_datetime64_any_dtype(df[col]):
+                values[col] = pd.Series([None if pd.isna(value) else value.to_pydatetime() for value in df[col]], index=df.index, dtype=object)
+                datetime_params.append(bindparam(f"p{i}", type_=DateTime()))
+        insert_staging = text(f"INSERT INTO {staging} ({columns}) VALUES ({placeholders})").bindparams(*datetime_params)
+        rows = [dict(zip((f"p{i}" for i in range(len(df.columns))), row)) for row in values.itertuples(index=False, name=None)]
+        for start in range(0, len(rows), chunksize):
+            con.execute(insert_staging, rows[start:start + chunksize])
+
+    update_columns = [col for col in df.columns if col not in key_columns]
+    if update_columns:
+        assignments = ', '.join(f"{_quote_identifier(col)} = EXCLUDED.{_quote_identifier(col)}" for col in update_columns)
+        conflict_action = f"DO UPDATE SET {assignments}"
+    else:
+        conflict_action = "DO NOTHING"
+    # WHERE true diperlukan SQLite agar ON CONFLICT tidak dibaca sebagai bagian dari klausa JOIN
+    con.execute(text(f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} WHERE true "
+                     f"ON CONFLICT ({keys}) {conflict_action}"))
+    if not is_postgresql:
+        con.execute(text(f"DROP TABLE {staging}"))
+
+def export_to_postgre(df, db_url, table_name='fashion_data', engine=None, method='to_sql', chunksize=DEFAULT_CHUNKSIZE,
+                      mode='append', key_columns=DEFAULT_UPSERT_KEY):
+    """Mengekspor data ke dalam format PostgreSQL.
+    `method='copy'` memakai COPY FROM STDIN (psycopg2) per `chunksize` baris dan otomatis beralih ke
+    `to_sql` ber-chunk (executemany) untuk database selain PostgreSQL atau driver selain psycopg2, yang pada SQLite lebih cepat
+    daripada insert multi-baris (lihat benchmarks/bench_load.py).
+    Jika `engine` tidak diberikan, engine bersama dari `get_engine(db_url)` dipakai.
+    `mode='upsert'` membuat tabel idempoten: baris dimuat ke tabel staging sementara lalu digabung dengan
+    INSERT ... ON CONFLICT DO UPDATE pada `key_columns`; unique index dibuat jika belum ada, setelah
+    baris lama dengan key ganda dibersihkan (baris terakhir untuk setiap key dipertahankan)."""
+    if method not in LOAD_METHODS:
+        raise ValueError(f"Metode load tidak dikenal: {method}, gunakan salah satu dari {LOAD_METHODS}")
+    if mode not in LOAD_MODES:
+        raise ValueError(f"Mode load tidak dikenal: {mode}, gunakan salah satu dari {LOAD_MODES}")
     try:
         print(f"Mulai mengekspor data ke dalam format PostgreSQL. Tabel: {table_name}")
         if engine is None:
-            engine = create_engine(db_url)
-        with engine.connect() as con:
-            df.to_sql(table_name, con=con, if_exists='append', index=False)
+            engine = get_engine(db_url)
+        if method == 'copy' and engine.dialect.name != 'postgresql':
+            print(f"COPY hanya tersedia di PostgreSQL, gunakan to_sql ber-chunk untuk dialek {engine.dialect.name}.")
+            method = 'to_sql'
+        elif method == 'copy' and engine.dialect.driver != 'psycopg2':
+            # copy_expert hanya dimiliki cursor psycopg2, driver lain (psycopg 3, asyncpg, pg8000) tidak
+            print(f"COPY membutuhkan driver psycopg2, gunakan to_sql ber-chunk untuk driver {engine.dialect.driver}.")
+            method = 'to_sql'
+        if mode == 'upsert':
+            with engine.begin() as con:
+                _upsert(df, table_name, con, key_columns, method == 'copy', chunksize)
+        elif method == 'to_sql':
+            with engine.connect() as con:
+                df.to_sql(table_name, con=con, if_exists='append', index=False, chunksize=chunksize)
+        else:
+            with engine.begin() as con:
+                if method == 'copy':
+                    _copy_from_stdin(df, table_name, con, chunksize)
+                else:
+                    _insert_multi(df, table_name, con, chunksize)
         print(f"Berhasil mengekspor data ke dalam format PostgreSQL. Tabel: {table_name}")
         return True
     except Exception as e:
         print(f"Gagal mengekspor data ke dalam format PostgreSQL: {e}")
         return False
 
+# Batas waktu default (detik) untuk satu sink pada tahap load paralel
+DEFAULT_SINK_TIMEOUT = 300
+
+def _run_sink(sink, df):
+    """Menjalankan satu fungsi ekspor dan mengukur durasinya"""
+    started_at = time.perf_counter()
+    try:
+        success, error = bool(sink(df)), None
+    except Exception as e:
+        success, error = False, str(e)
+    return success, time.perf_counter() - started_at, error
+
+def load_to_sinks(df, sinks, timeout=DEFAULT_SINK_TIMEOUT):
+    """Menjalankan semua sink (dict nama -> fungsi ekspor yang menerima DataFrame) secara bersamaan.
+    `timeout` berupa detik untuk semua sink atau dict per nama sink; sink yang melewati batas waktu
+    dicatat gagal tanpa menahan sink lain. Mengembalikan dict nama -> hasil
+    ({'success', 'rows', 'duration', 'timed_out', 'error'})."""
+    if not sinks:
+        return {}
+    executor = ThreadPoolExecutor(max_workers=len(sinks), thread_name_prefix='load-sink')
+    started_at = time.perf_counter()
+    futures = {name: executor.submit(_run_sink, sink, df) for name, sink in sinks.items()}
+    results = {}
+    for name, future in futures.items():
+        sink_timeout = timeout.get(name, DEFAULT_SINK_TIMEOUT) if isinstance(timeout, dict) else timeout
+        remaining = None if sink_timeout is None else max(0.0, started_at + sink_timeout - time.perf_counter())
+        try:
+            success, duration, error = future.result(timeout=remaining)
+            timed_out = False
+        except FuturesTimeoutError:
+            success, duration, timed_out = False, time.perf_counter() - started_at, True
+            error = f"melewati batas waktu {sink_timeout} detik"
+        results[name] = {
+            'success': success,
+            'rows': len(df) if success else 0,
+            'duration': duration,
+            'timed_out': timed_out,
+            'error': error
+        }
+        REGISTRY.observe(LOAD_TIMER, duration, sink=name)
+        REGISTRY.increment(LOAD_ROWS, results[name]['rows'], sink=name)
+        if not success:
+            REGISTRY.increment(LOAD_FAILURES, sink=name)
+    # Sink yang timeout tetap berjalan di thread-nya sendiri, jangan tunggu di sini
+    executor.shutdown(wait=False)
+    report_load_results(results)
+    return results
+
+def report_load_results(results):
+    """Mencetak ringkasan hasil per sink dan mengembalikan nama sink paling lambat (bottleneck)"""
+    if not results:
+        return None
+    bottleneck = max(results, key=lambda name: results[name]['duration'])
+    print("Ringkasan proses load per sink:")
+    for name, result in results.items():
+        status = 'berhasil' if result['success'] else f"gagal ({result['error']})" if result['error'] else 'gagal'
+        print(f"  {name}: {status}, {result['rows']} baris, {result['duration']:.2f} detik")
+    print(f"Bottleneck tahap load: {bottleneck} ({results[bottleneck]['duration']:.2f} detik)")
+    return bottleneck
+
 if __name__ == "__main__":
     if 'final_df' in globals() and isinstance(final_df, pd.DataFrame) and not final_df.empty:
         print("DataFrame akhir tersedia, lanjutkan dengan opsi ekspor.")
     else:
-        print("DataFrame 'final_df' tidak tersedia atau kosong, pastikan tahapan sebelumnya berhasil dijalankan.")
\ No newline at end of file
+        print("DataFrame 'final_df' tidak tersedia atau kosong, pastikan tahapan sebelumnya berhasil dijalankan.")
@@ -0,0 +1,195 @@
+import json
+import math
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+DEFAULT_REPORT_FILE = 'etl_metrics.json'
+PROMETHEUS_PREFIX = 'fashion_etl'
+SUMMARY_QUANTILES = (0.5, 0.9, 0.99)
+
+# Nama metrik yang dicatat tahap-tahap pipeline
+FETCH_TIMER = 'extract.fetch'
+FETCH_ERRORS = 'extract.fetch_errors'
+BYTES_DOWNLOADED = 'extract.bytes_downloaded'
+PARSE_TIMER = 'extract.parse'
+CARDS_PARSED = 'extract.cards_parsed'
+PAGES_RESUMED = 'extract.pages_resumed'
+STAGE_TIMER = 'pipeline.stage'
+TRANSFORM_TIMER = 'transform.step'
+LOAD_TIMER = 'load.sink'
+LOAD_ROWS = 'load.rows'
+LOAD_FAILURES = 'load.failures'
+
+def _quantile(sorted_values, quantile):
+    """Quantile nearest-rank dari daftar nilai yang sudah terurut"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(quantile * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+class MetricsRegistry:
+    """Penampung counter dan timer ringan untuk tahap-tahap pipeline, aman dipakai dari banyak thread.
+    Setiap metrik diidentifikasi nama dan label opsional (misalnya `sink='csv'`). Hasilnya dapat
+    ditulis sebagai laporan run JSON (`write_json`) atau textfile Prometheus (`write_prometheus`)."""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Menghapus semua metrik dan memulai ulang waktu run"""
+        with self._lock:
+            self._counters = {}
+            self._timers = {}
+            self.started_at = datetime.now()
+            self._started = self.clock()
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+    def increment(self, name, value=1, **labels):
+        """Menambah counter `name` sebesar `value`"""
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """Mencatat satu durasi (detik) pada timer `name`"""
+        key = self._key(name, labels)
+        with self._lock:
+            self._timers.setdefault(key, []).append(seconds)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Context manager yang mencatat durasi blok di dalamnya pada timer `name`, termasuk jika blok gagal"""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.observe(name, self.clock() - start, **labels)
+
+    def counter(self, name, **labels):
+        """Nilai counter `name`; tanpa label, dijumlahkan untuk semua label"""
+        with self._lock:
+            if labels:
+                return self._counters.get(self._key(name, labels), 0)
+            return sum(value for (counter_name, _), value in self._counters.items() if counter_name == name)
+
+    def durations(self, name, **labels):
+        """Daftar durasi timer `name`; tanpa label, digabung untuk semua label"""
+        with self._lock:
+            if labels:
+                return list(self._timers.get(self._key(name, labels), []))
+            return [value for (timer_name, _), values in self._timers.items() if timer_name == name for value in values]
+
+    def _timer_totals(self, name, label):
+        """Total durasi timer `name` per nilai label `label`"""
+        totals = {}
+        with self._lock:
+            for (timer_name, labels), values in self._timers.items():
+                if timer_name == name:
+                    label_value = dict(labels).get(label)
+                    totals[label_value] = totals.get(label_value, 0.0) + sum(values)
+        return totals
+
+    @staticmethod
+    def _describe(values):
+        ordered = sorted(values)
+        description = {
+            'count': len(ordered),
+            'sum': sum(ordered),
+            'min': ordered[0] if ordered else None,
+            'max': ordered[-1] if ordered else None,
+            'mean': sum(ordered) / len(ordered) if ordered else None,
+        }
+        for quantile in SUMMARY_QUANTILES:
+            description[f"p{int(quantile * 100)}"] = _quantile(ordered, quantile)
+        return description
+
+    def report(self, **run_info):
+        """Menyusun laporan run: ringkasan per tahap beserta seluruh counter dan timer mentah.
+        `run_info` (mode, format, ...) disertakan apa adanya di bagian `run`."""
+        fetch_latency = self.durations(FETCH_TIMER)
+        cards_parsed = self.counter(CARDS_PARSED)
+        parse_seconds = sum(self.durations(PARSE_TIMER))
+        with self._lock:
+            counters = [{'name': name, 'labels': dict(labels), 'value': value}
+                        for (name, labels), value in sorted(self._counters.items())]
+            timers = [{'name': name, 'labels': dict(labels), **self._describe(values)}
+                      for (name, labels), values in sorted(self._timers.items())]
+        return {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'duration_seconds': self.clock() - self._started,
+            'run': run_info,
+            'summary': {
+                'stage_seconds': self._timer_totals(STAGE_TIMER, 'stage'),
+                'fetch_requests': len(fetch_latency),
+                'fetch_errors': self.counter(FETCH_ERRORS),
+                'bytes_downloaded': self.counter(BYTES_DOWNLOADED),
+                'fetch_latency_seconds': self._describe(fetch_latency),
+                'cards_parsed': cards_parsed,
+                'parse_seconds': parse_seconds,
+                'cards_per_second': cards_parsed / parse_seconds if parse_seconds > 0 else None,
+                'transform_seconds': self._timer_totals(TRANSFORM_TIMER, 'step'),
+                'load_seconds': self._timer_totals(LOAD_TIMER, 'sink'),
+            },
+            'counters': counters,
+            'timers': timers,
+        }
+
+    def write_json(self, path=DEFAULT_REPORT_FILE, **run_info):
+        """Menulis laporan run sebagai JSON dan mengembalikan isi laporannya"""
+        report = self.report(**run_info)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as report_file:
+            json.dump(report, report_file, indent=2, default=str)
+        os.replace(temp_path, path)
+        return report
+
+    def write_prometheus(self, path, prefix=PROMETHEUS_PREFIX):
+        """Menulis metrik dalam format textfile Prometheus (untuk textfile collector node_exporter).
+        File ditulis ke file sementara lalu diganti secara atomik agar collector tidak membaca file setengah jadi."""
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            timers = sorted(self._timers.items())
+        declared = set()
+        for (name, labels), value in counters:
+            metric = f"{_prometheus_name(prefix, name)}_total"
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} counter")
+                declared.add(metric)
+            lines.append(f"{metric}{_prometheus_labels(labels)} {value}")
+        for (name, labels), values in timers:
+            metric = f"{_prometheus_name(prefix, name)}_seconds"
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} summary")
+                declared.add(metric)
+            ordered = sorted(values)
+            for quantile in SUMMARY_QUANTILES:
+                lines.append(f"{metric}{_prometheus_labels(labels + (('quantile', str(quantile)),))} {_quantile(ordered, quantile)}")
+            lines.append(f"{metric}_sum{_prometheus_labels(labels)} {sum(ordered)}")
+            lines.append(f"{metric}_count{_prometheus_labels(labels)} {len(ordered)}")
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as textfile:
+            textfile.write("\n".join(lines) + "\n")
+        os.replace(temp_path, path)
+
+def _prometheus_name(prefix, name):
+    return re.sub(r'[^a-zA-Z0-9_]', '_', f"{prefix}_{name}")
+
+def _prometheus_labels(labels):
+    if not labels:
+        return ''
+    escape = lambda value: value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{label}="{escape(value)}"' for label, value in labels) + '}'
+
+# Registry bersama yang dipakai seluruh tahap pipeline dalam satu proses
+REGISTRY = MetricsRegistry()
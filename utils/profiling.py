@@ -0,0 +1,168 @@
+import cProfile
+import os
+import pstats
+import threading
+import tracemalloc
+from contextlib import closing, contextmanager, nullcontext
+
+PROFILE_ENV_VAR = 'FASHION_ETL_PROFILE'
+PROFILE_DIR_ENV_VAR = 'FASHION_ETL_PROFILE_DIR'
+DEFAULT_PROFILE_DIR = 'profiles'
+DEFAULT_TOP_N = 10
+# Frame milik tracemalloc dan mesin impor tidak relevan untuk alokasi pipeline
+ALLOCATION_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+def profiling_requested(environ=None):
+    """Mengembalikan True jika variabel lingkungan FASHION_ETL_PROFILE meminta mode profiling"""
+    value = (os.environ if environ is None else environ).get(PROFILE_ENV_VAR, '')
+    return value.strip().lower() not in ('', '0', 'false', 'no', 'off')
+
+def _format_bytes(size):
+    return f"{size / (1024 * 1024):.2f} MB"
+
+class StageProfiler:
+    """Profiling cProfile dan tracemalloc per tahap pipeline yang hanya aktif jika diminta.
+    Setiap tahap menghasilkan `<tahap>.prof` (dapat dibuka dengan pstats/snakeviz) dan
+    `<tahap>-allocations.txt` berisi `top_n` baris kode dengan alokasi memori terbesar selama tahap.
+    Tahap yang dijalankan berulang kali (mode streaming) diakumulasikan ke profil yang sama.
+    cProfile hanya mengukur thread yang menjalankan tahap, sedangkan tracemalloc mencatat seluruh proses.
+    Tahap diprofilkan satu per satu, sehingga sink tahap load yang dibungkus `wrap` berjalan berurutan selama profiling.
+    Jika `enabled=False`, `stage`, `wrap`, dan `iterate` mengembalikan objek aslinya tanpa overhead."""
+
+    def __init__(self, output_dir=DEFAULT_PROFILE_DIR, top_n=DEFAULT_TOP_N, enabled=True):
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self.enabled = enabled
+        self._profiles = {}
+        self._calls = {}
+        self._peaks = {}
+        self._active = 0
+        self._owns_tracing = False
+        self._lock = threading.Lock()
+        self._stage_lock = threading.Lock()
+        if enabled:
+            os.makedirs(output_dir, exist_ok=True)
+
+    def stage(self, name):
+        """Context manager yang memprofilkan blok di dalamnya sebagai tahap `name`"""
+        if not self.enabled:
+            return nullcontext()
+        return self._profile_stage(name)
+
+    def wrap(self, name, function):
+        """Membungkus `function` agar setiap pemanggilannya diprofilkan sebagai tahap `name`,
+        berguna untuk fungsi yang dijalankan di thread lain (misalnya sink tahap load)"""
+        if not self.enabled:
+            return function
+        def profiled(*args, **kwargs):
+            with self._profile_stage(name):
+                return function(*args, **kwargs)
+        return profiled
+
+    def iterate(self, name, iterable):
+        """Memprofilkan pekerjaan generator `iterable` (setiap `next`) sebagai tahap `name`"""
+        if not self.enabled:
+            return iterable
+        return self._iterate(name, iter(iterable))
+
+    def _iterate(self, name, iterator):
+        with closing(iterator):
+            while True:
+                with self._profile_stage(name):
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                yield item
+
+    @contextmanager
+    def _profile_stage(self, name):
+        # Sejak Python 3.12 cProfile memakai sys.monitoring yang hanya mengizinkan satu profiler aktif,
+        # dan reset_peak tracemalloc berlaku untuk seluruh proses: tahap tidak boleh diprofilkan bersamaan
+        with self._stage_lock, self._profile_stage_unlocked(name):
+            yield
+
+    @contextmanager
+    def _profile_stage_unlocked(self, name):
+        with self._lock:
+            if self._active == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracing = True
+            self._active += 1
+            profile = self._profiles.setdefault(name, cProfile.Profile())
+            call_number = self._calls[name] = self._calls.get(name, 0) + 1
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot().filter_traces(ALLOCATION_FILTERS)
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            after = tracemalloc.take_snapshot().filter_traces(ALLOCATION_FILTERS)
+            peak = tracemalloc.get_traced_memory()[1]
+            self._write_allocations(name, call_number, after.compare_to(before, 'lineno'), peak)
+            with self._lock:
+                self._peaks[name] = max(self._peaks.get(name, 0), peak)
+                self._active -= 1
+                if self._active == 0 and self._owns_tracing:
+                    tracemalloc.stop()
+                    self._owns_tracing = False
+                profile.dump_stats(self.profile_path(name))
+
+    def profile_path(self, name):
+        return os.path.join(self.output_dir, f"{name}.prof")
+
+    def allocations_path(self, name):
+        return os.path.join(self.output_dir, f"{name}-allocations.txt")
+
+    def _write_allocations(self, name, call_number, differences, peak):
+        mode = 'w' if call_number == 1 else 'a'
+        with open(self.allocations_path(name), mode, encoding='utf-8') as allocations_file:
+            allocations_file.write(f"Tahap {name}, pemanggilan ke-{call_number}: memori puncak {_format_bytes(peak)}\n")
+            for difference in differences[:self.top_n]:
+                allocations_file.write(f"  {difference.size_diff / 1024:+12.1f} KB ({difference.count_diff:+d} blok): "
+                                       f"{difference.traceback[0]}\n")
+
+    def hottest_functions(self, name):
+        """Daftar `top_n` fungsi dengan waktu eksekusi sendiri (tottime) terbesar pada tahap `name`"""
+        with self._lock:
+            profile = self._profiles.get(name)
+            if profile is None:
+                return []
+            stats = pstats.Stats(profile).stats
+        ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:self.top_n]
+        return [{'function': pstats.func_std_string(function), 'calls': calls, 'self_seconds': self_time,
+                 'cumulative_seconds': cumulative_time}
+                for function, (_, calls, self_time, cumulative_time, _) in ranked]
+
+    def summary(self):
+        """Ringkasan per tahap: lokasi file, jumlah pemanggilan, memori puncak, dan fungsi terpanas"""
+        return {
+            name: {
+                'profile': self.profile_path(name),
+                'allocations': self.allocations_path(name),
+                'calls': calls,
+                'peak_memory_bytes': self._peaks.get(name),
+                'hottest_functions': self.hottest_functions(name),
+            }
+            for name, calls in self._calls.items()
+        }
+
+    def print_summary(self):
+        """Mencetak fungsi terpanas dan memori puncak setiap tahap ke log run"""
+        summary = self.summary()
+        if not summary:
+            return summary
+        print(f"\nRingkasan profiling per tahap (file .prof dan alokasi di {self.output_dir}):")
+        for name, stage in summary.items():
+            peak = _format_bytes(stage['peak_memory_bytes']) if stage['peak_memory_bytes'] is not None else '-'
+            print(f"  {name}: {stage['calls']} pemanggilan, memori puncak {peak}")
+            for function in stage['hottest_functions']:
+                print(f"    {function['self_seconds']:8.3f} dtk sendiri {function['cumulative_seconds']:8.3f} dtk kumulatif "
+                      f"{function['calls']:>8} panggilan  {function['function']}")
+        return summary
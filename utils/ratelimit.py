@@ -0,0 +1,163 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Retry-After lebih lama dari batas ini (detik) tidak ditunggu, permintaan dihentikan
+DEFAULT_MAX_RETRY_AFTER = 300.0
+
+class TokenBucketRateLimiter:
+    """Token bucket yang membatasi laju permintaan (permintaan per detik) dengan burst `capacity`.
+    Laju menyesuaikan diri (AIMD): dipotong setengah saat server membalas 429/5xx dan
+    dinaikkan sedikit demi sedikit setiap permintaan berhasil, hingga `max_rate`.
+    `pause` menahan semua thread yang memakai limiter yang sama, misalnya selama Retry-After dari server."""
+
+    def __init__(self, rate=5.0, capacity=None, min_rate=0.2, max_rate=None, increase_step=0.1,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate * 4
+        self.increase_step = increase_step
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = self.capacity
+        self.updated_at = clock()
+        self.paused_until = self.updated_at
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        # Selama jeda, updated_at berada di masa depan sehingga token tidak terisi
+        self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.updated_at) * self.rate)
+        self.updated_at = max(self.updated_at, now)
+
+    def acquire(self):
+        """Menunggu hingga jeda berakhir dan satu token tersedia, lalu memakainya"""
+        while True:
+            with self._lock:
+                now = self.clock()
+                if now < self.paused_until:
+                    wait_time = self.paused_until - now
+                else:
+                    self._refill()
+                    # Toleransi pembulatan float: tanpa ini jam yang besar bisa berputar dengan wait_time mendekati nol
+                    if self.tokens >= 1 - 1e-9:
+                        self.tokens = max(0.0, self.tokens - 1)
+                        return
+                    wait_time = (1 - self.tokens) / self.rate
+            self.sleep(wait_time)
+
+    def pause(self, seconds):
+        """Menahan seluruh permintaan selama `seconds` detik; token mulai terisi lagi setelah jeda berakhir"""
+        with self._lock:
+            self._refill()
+            self.paused_until = max(self.paused_until, self.clock() + seconds)
+            self.tokens = min(self.tokens, 0.0)
+            self.updated_at = self.paused_until
+
+    def on_success(self):
+        """Menaikkan laju secara aditif setelah permintaan berhasil"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_throttle(self):
+        """Menurunkan laju secara multiplikatif setelah server membalas 429/5xx"""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+
+class RetryPolicy:
+    """Aturan pengulangan permintaan dengan exponential backoff dan full jitter yang menghormati Retry-After.
+    `max_backoff` hanya membatasi backoff eksponensial; Retry-After selalu ditunggu penuh, kecuali lebih lama
+    dari `max_retry_after` sehingga permintaan dihentikan alih-alih diulang terlalu cepat."""
+
+    def __init__(self, max_retries=3, backoff_factor=0.5, max_backoff=30.0, jitter=True, retry_statuses=RETRY_STATUSES,
+                 max_retry_after=DEFAULT_MAX_RETRY_AFTER):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self.retry_statuses = tuple(retry_statuses)
+
+    @staticmethod
+    def parse_retry_after(value):
+        """Mengubah header Retry-After (detik atau tanggal HTTP) menjadi jumlah detik, atau None"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def backoff(self, attempt, retry_after=None):
+        """Waktu tunggu sebelum percobaan ke-`attempt` (dimulai dari 1)"""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        retry_after_seconds = self.parse_retry_after(retry_after)
+        if retry_after_seconds is not None:
+            delay = max(delay, retry_after_seconds)
+        return delay
+
+class ThrottledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter yang mengambil token dari `rate_limiter` sebelum setiap permintaan ke jaringan
+    dan mengulang permintaan yang gagal sementara (429/5xx, koneksi terputus, timeout) sesuai `retry_policy`.
+    Retry-After dari server juga menjeda `rate_limiter` agar thread lain tidak terus mengirim permintaan."""
+
+    def __init__(self, rate_limiter=None, retry_policy=None, sleep=time.sleep, **kwargs):
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.sleep = sleep
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        max_retries = self.retry_policy.max_retries if self.retry_policy is not None else 0
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = super().send(request, **kwargs)
+            except (RequestsConnectionError, Timeout) as e:
+                if attempt >= max_retries:
+                    raise
+                attempt += 1
+                delay = self.retry_policy.backoff(attempt)
+                print(f"Koneksi ke {request.url} gagal ({e}), ulangi percobaan ke-{attempt} dalam {delay:.2f} detik.")
+                self.sleep(delay)
+                continue
+
+            is_retryable = self.retry_policy is not None and response.status_code in self.retry_policy.retry_statuses
+            if self.rate_limiter is not None:
+                if response.status_code == 429 or response.status_code >= 500:
+                    self.rate_limiter.on_throttle()
+                else:
+                    self.rate_limiter.on_success()
+            if not is_retryable or attempt >= max_retries:
+                return response
+            retry_after = self.retry_policy.parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None and retry_after > self.retry_policy.max_retry_after:
+                print(f"Server meminta menunggu {retry_after:.0f} detik untuk {request.url}, melebihi batas "
+                      f"{self.retry_policy.max_retry_after:.0f} detik, hentikan percobaan.")
+                return response
+            attempt += 1
+            delay = self.retry_policy.backoff(attempt, response.headers.get('Retry-After'))
+            if retry_after is not None and self.rate_limiter is not None:
+                self.rate_limiter.pause(retry_after)
+            print(f"Server membalas {response.status_code} untuk {request.url}, ulangi percobaan ke-{attempt} dalam {delay:.2f} detik.")
+            response.close()
+            self.sleep(delay)
@@ -1,11 +1,104 @@
 import numpy as np
 import pandas as pd
 
-def transform_data(df_input):
-    """Mengubah format data dari hasil proses scraping"""
+from utils.currency import DEFAULT_CURRENCY, convert_prices_to_idr
+from utils.metrics import REGISTRY, TRANSFORM_TIMER
+
+# Skema ringkas: kolom berulang disimpan sebagai kategori dan angka di-downcast ke tipe terkecil yang cukup
+CATEGORICAL_COLUMNS = ['Size', 'Gender']
+COMPACT_DTYPES = {'Rating': 'float32', 'Colors': 'int8'}
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def enforce_schema(df):
+    """Menerapkan skema ringkas pada DataFrame hasil transform: Size dan Gender menjadi kategori,
+    Rating float32, Colors int8, dan Timestamp datetime64. Price tetap float64 agar nilai rupiah tidak kehilangan presisi."""
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    if 'Rating' in df.columns:
+        df['Rating'] = df['Rating'].astype(COMPACT_DTYPES['Rating'])
+    if 'Colors' in df.columns:
+        colors = df['Colors']
+        # Jumlah warna di luar rentang int8 diturunkan ke tipe integer terkecil yang masih cukup
+        if colors.empty or colors.between(np.iinfo(np.int8).min, np.iinfo(np.int8).max).all():
+            df['Colors'] = colors.astype(COMPACT_DTYPES['Colors'])
+        else:
+            df['Colors'] = pd.to_numeric(colors, downcast='integer')
+    if 'Timestamp' in df.columns:
+        df['Timestamp'] = pd.to_datetime(df['Timestamp'], format=TIMESTAMP_FORMAT, errors='coerce')
+    return df
+
+def compare_memory_usage(df_before, df_after):
+    """Membandingkan pemakaian memori (byte, termasuk isi string) per kolom sebelum dan sesudah skema ringkas"""
+    report = pd.DataFrame({
+        'before': df_before.memory_usage(deep=True, index=False),
+        'after': df_after.memory_usage(deep=True, index=False)
+    })
+    report.loc['Total'] = report.sum()
+    report['saved_pct'] = (1 - report['after'] / report['before']) * 100
+    return report
+
+def _clean_price_inplace(price):
+    """Mengubah kolom harga ('$100.00') menjadi angka. Hanya nilai unik yang diurai, lalu hasilnya
+    disebar kembali dengan kode faktorisasi sehingga tidak ada string perantara sepanjang kolom."""
+    if pd.api.types.is_numeric_dtype(price):
+        return price
+    codes, uniques = pd.factorize(price)
+    parsed = pd.to_numeric(pd.Series(uniques).astype(str).str.replace('$', '', regex=False), errors='coerce')
+    values = parsed.to_numpy(dtype=float).take(codes)
+    # Kode -1 menandai nilai kosong pada kolom asli
+    values[codes < 0] = np.nan
+    return pd.Series(values, index=price.index, name=price.name)
+
+def _transform_data_inplace(df, exchange_rates=None, default_currency=DEFAULT_CURRENCY):
+    """Versi `transform_data` tanpa salinan awal: kolom dikonversi langsung pada `df` dan baris yang dibuang
+    (Unknown Product, nilai kritis kosong, duplikat) dikumpulkan dalam satu mask sehingga baris hanya disalin sekali."""
+    if 'Price' in df.columns:
+        if exchange_rates is not None:
+            df['Price'] = convert_prices_to_idr(df['Price'], exchange_rates, default_currency)
+        else:
+            df['Price'] = _clean_price_inplace(df['Price'])
+    df['Rating'] = pd.to_numeric(df['Rating'], errors='coerce').astype(float)
+    colors = pd.to_numeric(df['Colors'], errors='coerce')
+    if colors.hasnans:
+        colors = colors.fillna(0)
+    df['Colors'] = colors.astype(int)
+    df['Size'] = df['Size'].astype(str).replace('nan', np.nan)
+    if 'Gender' in df.columns:
+        gender = df['Gender']
+        df['Gender'] = gender.mask(gender.isna() | (gender == 'N/A'), 'Unisex').astype(str)
+    else:
+        df['Gender'] = 'Unisex'
+    critical_subset = ['Title', 'Size']
+    if 'Price' in df.columns:
+        critical_subset.append('Price')
+    elif 'Rupiah' in df.columns:
+        critical_subset.append('Rupiah')
+    # Baris identik selalu memiliki status filter yang sama, sehingga duplikat dapat dihitung pada seluruh baris
+    keep_mask = (df['Title'] != 'Unknown Product') & df[critical_subset].notna().all(axis=1) & ~df.duplicated()
+    if not keep_mask.all():
+        df = df[keep_mask]
+    return df
+
+def transform_data(df_input, compact=False, inplace=False, exchange_rates=None, default_currency=DEFAULT_CURRENCY):
+    """Mengubah format data dari hasil proses scraping.
+    Jika `exchange_rates` diberikan (kode mata uang -> kurs rupiah), mata uang dan pemisah angka setiap harga dideteksi
+    dan Price langsung dikonversi ke rupiah; tanpa `exchange_rates`, Price tetap dalam dollar seperti sebelumnya.
+    Harga tanpa simbol mata uang (atau kolom Price numerik) dianggap bernilai `default_currency`.
+    Jika `compact=True`, skema ringkas dari `enforce_schema` diterapkan di akhir proses.
+    Jika `inplace=True`, `df_input` diubah langsung tanpa salinan sehingga memori puncak mendekati satu salinan data;
+    `df_input` tidak boleh dipakai lagi setelahnya, gunakan DataFrame yang dikembalikan."""
+    if inplace:
+        with pd.option_context('mode.copy_on_write', True):
+            df_transformed = _transform_data_inplace(df_input, exchange_rates, default_currency)
+            if compact:
+                df_transformed = enforce_schema(df_transformed)
+        return df_transformed
     df_transformed = df_input.copy()
     df_transformed = df_transformed[df_transformed['Title'] != 'Unknown Product']
-    if 'Price' in df_transformed.columns:
+    if 'Price' in df_transformed.columns and exchange_rates is not None:
+        df_transformed['Price'] = convert_prices_to_idr(df_transformed['Price'], exchange_rates, default_currency)
+    elif 'Price' in df_transformed.columns:
         df_transformed['Price'] = pd.to_numeric(df_transformed['Price'].astype(str).str.replace('$', '', regex=False), errors='coerce')
     df_transformed['Rating'] = pd.to_numeric(df_transformed['Rating'], errors='coerce').astype(float)
     df_transformed['Colors'] = pd.to_numeric(df_transformed['Colors'], errors='coerce')
@@ -25,10 +118,55 @@ def transform_data(df_input):
         critical_subset.append('Rupiah')
     df_transformed.dropna(subset=critical_subset, inplace=True);
     df_transformed.drop_duplicates(inplace=True);
+    if compact:
+        df_transformed = enforce_schema(df_transformed)
     return df_transformed
 
-def convert_dollar_to_rupiah(df_input):
-    """Mengonversi nilai dollar ke nilai rupiah sebesar Rp 16.000"""
+def _order_columns(columns):
+    """Urutan kolom akhir: kolom dasar terlebih dahulu, kolom lain menyusul sesuai urutan semula"""
+    final_column_order_base = ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender']
+    ordered_columns = [col for col in final_column_order_base if col in columns]
+    ordered_columns += [col for col in columns if col not in ordered_columns]
+    return ordered_columns
+
+def _convert_dollar_to_rupiah_inplace(df, exchange_rates=None):
+    """Versi `convert_dollar_to_rupiah` tanpa salinan: harga dikalikan langsung pada kolom Price dan
+    penyusunan ulang kolom dengan copy-on-write tidak menyalin isi kolom"""
+    if 'Price in rupiah' in df.columns:
+        df.rename(columns={'Price in rupiah': 'Price'}, inplace=True)
+    if 'Price' not in df.columns:
+        df['Price'] = np.nan
+    try:
+        if exchange_rates is not None:
+            df['Price'] = _price_in_rupiah(df['Price'], exchange_rates)
+        elif pd.api.types.is_numeric_dtype(df['Price']):
+            if df['Price'].max() < 100000:
+                exchange_rate = 16000
+                df['Price'] = df['Price'].astype(float) * exchange_rate
+            else:
+                df['Price'] = df['Price'].astype(float)
+    except Exception as e:
+        print(f"Terjadi kesalahan saat mengonversi ke rupiah: {e}")
+        df['Price'] = np.nan
+    ordered_columns = _order_columns(df.columns)
+    if list(df.columns) != ordered_columns:
+        df = df[ordered_columns]
+    return df
+
+def _price_in_rupiah(price, exchange_rates):
+    """Price numerik dianggap sudah dalam rupiah (hasil `transform_data` dengan kurs); Price teks diurai dan dikonversi"""
+    if pd.api.types.is_numeric_dtype(price):
+        return price.astype(float)
+    return convert_prices_to_idr(price, exchange_rates)
+
+def convert_dollar_to_rupiah(df_input, inplace=False, exchange_rates=None):
+    """Mengonversi nilai dollar ke nilai rupiah sebesar Rp 16.000.
+    Jika `exchange_rates` diberikan, Price tidak ditebak dari nilai maksimumnya: Price numerik dianggap sudah
+    dalam rupiah dan Price teks dikonversi per baris sesuai mata uangnya.
+    Jika `inplace=True`, `df_input` diubah langsung tanpa salinan (lihat `transform_data`)."""
+    if inplace:
+        with pd.option_context('mode.copy_on_write', True):
+            return _convert_dollar_to_rupiah_inplace(df_input, exchange_rates)
     df_converted = df_input.copy()
     # Tahap 1: Tangani perubahan nama kolom jika 'Price in rupiah' tersedia dari eksekusi sebelumnya
     if 'Price in rupiah' in df_converted.columns:
@@ -36,7 +174,9 @@ def convert_dollar_to_rupiah(df_input):
     if 'Price' not in df_converted.columns:
         df_converted['Price'] = np.nan
     try:
-        if pd.api.types.is_numeric_dtype(df_converted['Price']):
+        if exchange_rates is not None:
+            df_converted['Price'] = _price_in_rupiah(df_converted['Price'], exchange_rates)
+        elif pd.api.types.is_numeric_dtype(df_converted['Price']):
             if df_converted['Price'].max() < 100000:
                 df_converted['Price_in_dollar'] = df_converted['Price']
                 exchange_rate = 16000
@@ -49,19 +189,81 @@ def convert_dollar_to_rupiah(df_input):
         df_converted['Price'] = np.nan
 
     # Tahap 2: Susun kembali kolom sesuai format yang diinginkan
-    final_column_order_base = ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender']
-    # Buat urutan aktual sesuai di df_converted dan urutan dasar yang diinginkan
-    ordered_columns = []
-    for col in final_column_order_base:
-        if col in df_converted.columns:
-            ordered_columns.append(col)
-    # Menambahkan kolom yang tidak tercatat di akhir secara eksplisit
-    for col in df_converted.columns:
-        if col not in ordered_columns:
-            ordered_columns.append(col)
-    df_converted = df_converted[ordered_columns]
+    df_converted = df_converted[_order_columns(df_converted.columns)]
     return df_converted
 
+# Jumlah baris per chunk pada transform out-of-core
+DEFAULT_TRANSFORM_CHUNKSIZE = 100000
+
+class RowFingerprintSet:
+    """Himpunan fingerprint baris (hash 64-bit dari `pd.util.hash_pandas_object`) untuk membuang duplikat antar chunk.
+    Fingerprint disimpan sebagai beberapa array uint64 terurut (8 byte per baris, tanpa objek Python per baris);
+    array yang ukurannya setara digabung bertahap sehingga jumlah array tetap logaritmik."""
+
+    def __init__(self):
+        self.runs = []
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+    def add_new(self, fingerprints):
+        """Menambahkan fingerprint dan mengembalikan mask baris yang fingerprint-nya belum pernah terlihat.
+        Di dalam satu array, hanya kemunculan pertama yang dianggap baru (seperti drop_duplicates keep='first')."""
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        unique, first_index = np.unique(fingerprints, return_index=True)
+        is_new = np.ones(len(unique), dtype=bool)
+        for run in self.runs:
+            positions = np.minimum(np.searchsorted(run, unique), len(run) - 1)
+            is_new &= run[positions] != unique
+        mask = np.zeros(len(fingerprints), dtype=bool)
+        mask[first_index[is_new]] = True
+        self._push(unique[is_new])
+        return mask
+
+    def _push(self, run):
+        if not len(run):
+            return
+        self.runs.append(run)
+        while len(self.runs) > 1 and len(self.runs[-2]) <= len(self.runs[-1]):
+            last = self.runs.pop()
+            merged = np.concatenate([self.runs.pop(), last])
+            merged.sort()
+            self.runs.append(merged)
+
+def read_in_chunks(path, chunksize=DEFAULT_TRANSFORM_CHUNKSIZE):
+    """Membaca file CSV atau Parquet (membutuhkan pyarrow) per `chunksize` baris.
+    CSV dibaca sebagai teks seperti hasil scraping; hanya sel kosong yang dianggap NaN agar 'N/A' tetap diproses transform."""
+    if path.lower().endswith(('.parquet', '.pq')):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, dtype=str, keep_default_na=False, na_values=[''])
+
+def transform_in_chunks(chunks, compact=False, exchange_rates=None, seen=None, default_currency=DEFAULT_CURRENCY):
+    """Menerapkan `transform_data` dan `convert_dollar_to_rupiah` pada setiap chunk tanpa salinan (inplace),
+    lalu membuang baris yang sudah muncul di chunk sebelumnya berdasarkan `RowFingerprintSet` `seen`.
+    Menghasilkan chunk hasil transform satu per satu sehingga memori dibatasi oleh ukuran chunk.
+    Berikan `exchange_rates` agar konversi rupiah tidak bergantung pada nilai maksimum setiap chunk.
+    Riwayat hasil pipeline sendiri menyimpan Price tanpa simbol dalam rupiah, proses dengan `default_currency='IDR'`
+    agar harga tersebut tidak dikonversi untuk kedua kalinya."""
+    seen = RowFingerprintSet() if seen is None else seen
+    for chunk in chunks:
+        with REGISTRY.timer(TRANSFORM_TIMER, step='transform_data'):
+            transformed = transform_data(chunk, compact=compact, inplace=True, exchange_rates=exchange_rates,
+                                         default_currency=default_currency)
+        with REGISTRY.timer(TRANSFORM_TIMER, step='convert_dollar_to_rupiah'):
+            transformed = convert_dollar_to_rupiah(transformed, inplace=True, exchange_rates=exchange_rates)
+        if transformed.empty:
+            continue
+        with REGISTRY.timer(TRANSFORM_TIMER, step='deduplicate_chunks'):
+            is_new = seen.add_new(pd.util.hash_pandas_object(transformed, index=False).to_numpy())
+            if not is_new.all():
+                transformed = transformed[is_new]
+        if not transformed.empty:
+            yield transformed
+
 if __name__ == "__main__":
     final_transformed_df = pd.DataFrame(columns=['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender'])
     if 'final_df' not in globals() or not isinstance(final_df, pd.DataFrame) or final_df.empty: # Cakupan: Uji kedua cabang true dan false